@@ -12,50 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
-import time
 import logging
 import collections
 
-MAX_RETRIES = 30
-RETRY_WAIT = 0.1
+from vinyldns.waiter import Backoff
+
+# the most seconds to wait for the API to finish an operation
+WAIT_TIMEOUT = 30
+# tests poll a local API, so start quickly and stay responsive
+WAIT_BACKOFF = Backoff(initial=0.05, maximum=1.0)
+
 
 def wait_until_zone_exists(vinyldns_client, zone_id):
     """
     Waits until the zone exists
     """
-    zone = vinyldns_client.get_zone(zone_id)
-    retries = MAX_RETRIES
-    while (zone is None) and retries > 0:
-        zone = vinyldns_client.get_zone(zone_id)
-        time.sleep(RETRY_WAIT)
-        retries -= 1
-
-    assert zone is not None
+    vinyldns_client.wait_for_zones([zone_id], timeout=WAIT_TIMEOUT, backoff=WAIT_BACKOFF)
 
 
 def wait_until_zone_deleted(vinyldns_client, zone_id):
     """
     Waits until the zone no longer exists
     """
-    zone = vinyldns_client.get_zone(zone_id)
-    retries = MAX_RETRIES
-    while (zone is not None) and retries > 0:
-        zone = vinyldns_client.get_zone(zone_id)
-        time.sleep(RETRY_WAIT)
-        retries -= 1
-
-    assert zone is None
+    vinyldns_client.wait_for_zones([zone_id], deleted=True, timeout=WAIT_TIMEOUT, backoff=WAIT_BACKOFF)
 
 
 def wait_until_record_set_exists(vinyldns_client, zone_id, rs_id):
     """
-    Waits until the zone exists
+    Waits until the record set exists and has no change pending
     """
-    rs = vinyldns_client.get_record_set(zone_id, rs_id)
-    retries = MAX_RETRIES
-    while (rs is None) and retries > 0:
-        rs = vinyldns_client.get_record_set(zone_id, rs_id)
-        time.sleep(RETRY_WAIT)
-        retries -= 1
-
-    assert rs is not None
+    vinyldns_client.wait_for_record_sets([(zone_id, rs_id)], timeout=WAIT_TIMEOUT, backoff=WAIT_BACKOFF)
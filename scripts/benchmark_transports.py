@@ -0,0 +1,104 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Compares the per-call cost of the client's transports against a local stub of the VinylDNS API.
+
+The stub answers instantly, so the numbers measure client overhead (signing, transport, decoding)
+rather than network or server time.
+
+Usage:
+    python benchmark_transports.py [--requests 2000] [--concurrency 1]
+"""
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from vinyldns.client import VinylDNSClient
+from vinyldns.transport import HttpxTransport, RequestsTransport, Urllib3Transport
+
+
+ZONE = {
+    "zone": {
+        "id": "bench", "name": "bench.example.com.", "email": "bench@example.com", "status": "Active",
+        "created": "2026-01-01T00:00:00Z", "adminGroupId": "admins", "acl": {"rules": []}, "shared": False,
+    }
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    body = json.dumps(ZONE).encode("utf-8")
+
+    def do_GET(self):
+        # the client signs and sends a body with every request, which must be drained to reuse the connection
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        # send the headers and body in a single write
+        self._headers_buffer.extend([b"\r\n", self.body])
+        self.flush_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def available_transports():
+    transports = {"requests": RequestsTransport, "urllib3": Urllib3Transport}
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return transports
+    # the stub only speaks HTTP/1.1, so this measures httpx itself rather than multiplexing
+    transports["httpx"] = HttpxTransport
+    return transports
+
+
+def run(client, count, concurrency):
+    start = time.perf_counter()
+    if concurrency == 1:
+        for _ in range(count):
+            client.get_zone("bench")
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda _: client.get_zone("bench"), range(count)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the client transports")
+    parser.add_argument("--requests", type=int, default=2000, help="requests sent per transport")
+    parser.add_argument("--concurrency", type=int, default=1, help="threads sending requests")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:{0}".format(server.server_address[1])
+
+    print("{0:<10} {1:>12} {2:>12}".format("transport", "us/call", "calls/s"))
+    for name, transport in available_transports().items():
+        client = VinylDNSClient(url, "bench", "bench", transport=transport)
+        run(client, min(100, args.requests), args.concurrency)
+        elapsed = run(client, args.requests, args.concurrency)
+        client.close()
+        print("{0:<10} {1:>12.1f} {2:>12.0f}".format(name, elapsed / args.requests * 1e6, args.requests / elapsed))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
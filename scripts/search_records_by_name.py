@@ -133,8 +133,8 @@ def search_records(client: VinylDNSClient, record_name_filter: str) -> list[dict
         for record_set in response.record_sets:
             record_type = record_set.type
             for record in record_set.records:
-                # check for duplicate records
-                key = (record_set.fqdn, record_set.type, format_record_data(record_type, record))
+                # check for duplicate records, rdata compares and hashes by value
+                key = (record_set.fqdn, record_type, record)
                 if key in seen_records:
                     continue
                 seen_records.add(key)
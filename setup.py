@@ -49,8 +49,14 @@ setup(
     install_requires=[
         "botocore>=1.42.97",
         "requests>=2.20.0",
+        "urllib3>=2.0",
         "python-dateutil>=2.7.5",
     ],
+    extras_require={
+        "httpx": ["httpx[http2]>=0.23"],
+        "numpy": ["numpy>=1.22"],
+        "opentelemetry": ["opentelemetry-api>=1.20"],
+    },
     tests_require=[
         "responses==0.25.8",
         "pytest==9.0.3",
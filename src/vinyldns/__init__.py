@@ -13,4 +13,6 @@
 # limitations under the License.
 
 """TODO: Add module docstring."""
-__all__ = ['batch_change', 'client', 'membership', 'record', 'serdes', 'zone']
+__all__ = ['balancer', 'batch_change', 'bulk', 'circuit_breaker', 'client', 'deadline', 'hedging', 'hooks',
+           'membership', 'metrics', 'plan', 'record', 'retry', 'schedule', 'serdes', 'streaming', 'table', 'tracing',
+           'transport', 'update', 'validation', 'waiter', 'writer', 'zone']
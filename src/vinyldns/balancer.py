@@ -0,0 +1,145 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Health-aware load balancing across several VinylDNS API endpoints."""
+import random
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+__all__ = [u'Endpoint', u'EndpointPool']
+
+
+class Endpoint(object):
+    """
+    A single VinylDNS API node along with the signer bound to its host.
+    """
+
+    def __init__(self, url, signer):
+        parts = urlsplit(url)
+        self.url = url
+        self.scheme = parts.scheme or u'https'
+        self.netloc = parts.netloc
+        self.signer = signer
+        self.outstanding = 0
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.ejected_at = None
+        self.checking = False
+
+    def url_for(self, path, query=u''):
+        """
+        Build the url of an API resource on this endpoint.
+
+        :param path: the path of the resource
+        :param query: an already encoded query string
+        :return: the full url
+        """
+        return urlunsplit((self.scheme, self.netloc, path, query, u''))
+
+    def __repr__(self):
+        return u'Endpoint({0!r}, healthy={1}, outstanding={2})'.format(self.url, self.healthy, self.outstanding)
+
+
+class EndpointPool(object):
+    """
+    Balances requests over endpoints using the power of two choices: two healthy endpoints are sampled
+    at random and the one with fewer outstanding requests is used.
+
+    An endpoint is ejected after ``eject_after`` consecutive failures and becomes due for a health check
+    ``readmit_after`` seconds later; it is readmitted once a check passes. If every endpoint is ejected,
+    requests are spread over all of them rather than failing outright.
+    """
+
+    def __init__(self, endpoints, eject_after=3, readmit_after=10.0):
+        """
+        :param endpoints: the list of Endpoint to balance over
+        :param eject_after: the number of consecutive failures that ejects an endpoint
+        :param readmit_after: the number of seconds an ejected endpoint waits before it is health checked
+        """
+        if not endpoints:
+            raise ValueError(u'At least one endpoint is required')
+        self.endpoints = list(endpoints)
+        self.eject_after = eject_after
+        self.readmit_after = readmit_after
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.endpoints)
+
+    def healthy(self):
+        with self._lock:
+            return [e for e in self.endpoints if e.healthy]
+
+    def choose(self):
+        """
+        Pick an endpoint for the next request.
+        """
+        if len(self.endpoints) == 1:
+            return self.endpoints[0]
+
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.healthy] or self.endpoints
+            if len(candidates) == 1:
+                return candidates[0]
+            first, second = random.sample(candidates, 2)
+            return first if first.outstanding <= second.outstanding else second
+
+    def acquire(self, endpoint):
+        with self._lock:
+            endpoint.outstanding += 1
+
+    def release(self, endpoint, ok):
+        """
+        Record the outcome of a request sent to the endpoint.
+
+        :param endpoint: the endpoint the request was sent to
+        :param ok: False if the request failed because of the endpoint
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if ok:
+                endpoint.consecutive_failures = 0
+                return
+            endpoint.consecutive_failures += 1
+            if endpoint.healthy and endpoint.consecutive_failures >= self.eject_after and len(self.endpoints) > 1:
+                endpoint.healthy = False
+                endpoint.ejected_at = time.monotonic()
+
+    def due_for_check(self):
+        """
+        Claim the ejected endpoints whose readmission check is due.
+
+        :return: the endpoints that should be health checked now
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = [e for e in self.endpoints
+                   if not e.healthy and not e.checking and now - e.ejected_at >= self.readmit_after]
+            for endpoint in due:
+                endpoint.checking = True
+            return due
+
+    def mark_checked(self, endpoint, passed):
+        """
+        Record the result of a health check, readmitting the endpoint if it passed.
+        """
+        with self._lock:
+            endpoint.checking = False
+            if passed:
+                endpoint.healthy = True
+                endpoint.consecutive_failures = 0
+                endpoint.ejected_at = None
+            else:
+                endpoint.healthy = False
+                endpoint.ejected_at = time.monotonic()
@@ -13,7 +13,7 @@
 # limitations under the License.
 """TODO: Add module docstring."""
 
-from vinyldns.serdes import parse_datetime, map_option, to_utc_strftime
+from vinyldns.serdes import intern_str, parse_datetime, map_option, to_utc_strftime
 from vinyldns.record import rdata_converters
 import json
 
@@ -32,6 +32,50 @@ def to_review_json(s):
         return None
 
 
+class BatchChangeStatus:
+    PendingProcessing = "PendingProcessing"
+    PendingReview = "PendingReview"
+    Scheduled = "Scheduled"
+    Complete = "Complete"
+    Failed = "Failed"
+    PartialFailure = "PartialFailure"
+    Rejected = "Rejected"
+    Cancelled = "Cancelled"
+
+
+class BatchChangeApprovalStatus:
+    AutoApproved = "AutoApproved"
+    PendingReview = "PendingReview"
+    ManuallyApproved = "ManuallyApproved"
+    ManuallyRejected = "ManuallyRejected"
+    Cancelled = "Cancelled"
+
+
+# Statuses after which a batch change will not change again
+TERMINAL_BATCH_CHANGE_STATUSES = frozenset([BatchChangeStatus.Complete, BatchChangeStatus.Failed,
+                                            BatchChangeStatus.PartialFailure, BatchChangeStatus.Rejected,
+                                            BatchChangeStatus.Cancelled])
+TERMINAL_BATCH_CHANGE_APPROVAL_STATUSES = frozenset([BatchChangeApprovalStatus.ManuallyRejected,
+                                                     BatchChangeApprovalStatus.Cancelled])
+
+# Statuses where a batch change waits on a person or a schedule rather than on processing
+AWAITING_BATCH_CHANGE_STATUSES = frozenset([BatchChangeStatus.PendingReview, BatchChangeStatus.Scheduled])
+
+
+def batch_change_done(batch_change, stop_on_review=False):
+    """
+    Whether a batch change has reached a status it will not leave
+    :param batch_change: A BatchChange, or None if it could not be found
+    :param stop_on_review: Also count a batch change waiting for review or its scheduled time as done
+    :return: True if the batch change is done
+    """
+    if batch_change is None:
+        return False
+    return batch_change.status in TERMINAL_BATCH_CHANGE_STATUSES or \
+        batch_change.approval_status in TERMINAL_BATCH_CHANGE_APPROVAL_STATUSES or \
+        (stop_on_review and batch_change.status in AWAITING_BATCH_CHANGE_STATUSES)
+
+
 class AddRecord(object):
     def __init__(self, input_name, type, ttl, record):
         self.input_name = input_name
@@ -125,14 +169,14 @@ class AddRecordChange(object):
     @staticmethod
     def from_dict(d):
         return AddRecordChange(
-            zone_id=d['zoneId'],
-            zone_name=d['zoneName'],
+            zone_id=intern_str(d['zoneId']),
+            zone_name=intern_str(d['zoneName']),
             record_name=d['recordName'],
             input_name=d['inputName'],
-            type=d['type'],
+            type=intern_str(d['type']),
             ttl=d['ttl'],
             record=rdata_converters[d['type']](d['record']),
-            status=d['status'],
+            status=intern_str(d['status']),
             id=d['id'],
             system_message=d.get('systemMessage'),
             record_change_id=d.get('recordChangeId'),
@@ -161,13 +205,13 @@ class DeleteRecordSetChange(object):
     @staticmethod
     def from_dict(d):
         return DeleteRecordSetChange(
-            zone_id=d['zoneId'],
-            zone_name=d['zoneName'],
+            zone_id=intern_str(d['zoneId']),
+            zone_name=intern_str(d['zoneName']),
             record_name=d['recordName'],
             input_name=d['inputName'],
-            type=d['type'],
+            type=intern_str(d['type']),
             record=map_option(d.get('record'), rdata_converters[d['type']]),
-            status=d['status'],
+            status=intern_str(d['status']),
             id=d['id'],
             system_message=d.get('systemMessage'),
             record_change_id=d.get('recordChangeId'),
@@ -14,7 +14,7 @@
 
 import logging
 from datetime import datetime, UTC
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 import urllib.parse as urlparse
 
 from botocore.auth import SigV4Auth
@@ -89,9 +89,12 @@ class BotoRequestSigner:
         headers: Optional[Dict[str, str]],
         body: Optional[Union[str, bytes]],
         params: Optional[Dict[str, Union[str, bytes]]] = None,
+        query: Optional[str] = None,
     ) -> str:
         """
         Build the AWS SigV4 Authorization header for the given request parameters.
+
+        The query may be given already encoded by generate_canonical_query_string, in which case params is ignored.
         """
         hdrs: Dict[str, str] = dict(headers or {})
         hdrs.setdefault("Host", self.netloc)
@@ -106,7 +109,8 @@ class BotoRequestSigner:
         else:
             data = body
 
-        query = generate_canonical_query_string(params or {})
+        if query is None:
+            query = generate_canonical_query_string(params or {})
 
         if not path.startswith("/"):
             path = "/" + path
@@ -131,30 +135,38 @@ class BotoRequestSigner:
         return aws_request.headers["Authorization"]
 
 
+QueryValue = Union[str, bytes, int, bool]
+
+
 def generate_canonical_query_string(
-    params: Dict[str, Union[str, bytes]],
+    params: Dict[str, Union[QueryValue, Iterable[QueryValue], None]],
 ) -> str:
     """
     Generate a canonical (sorted + percent-encoded) query string suitable for SigV4.
+
+    Parameters whose value is None are left out, and list values are repeated once per item.
     """
     if not params:
         return ""
 
-    def _to_str(value: Union[str, bytes]) -> str:
+    def _to_str(value: QueryValue) -> str:
         if isinstance(value, bytes):
             return value.decode("utf-8")
+        if isinstance(value, bool):
+            return "true" if value else "false"
         return str(value)
 
     encoded_pairs = []
 
     for param in sorted(params):
-        value = _to_str(params[param])
-        encoded_pairs.append(
-            "%s=%s"
-            % (
-                urlparse.quote(param, safe="-_.~"),
-                urlparse.quote(value, safe="-_.~"),
+        value = params[param]
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        encoded_param = urlparse.quote(param, safe="-_.~")
+        for item in sorted(_to_str(v) for v in values):
+            encoded_pairs.append(
+                "%s=%s" % (encoded_param, urlparse.quote(item, safe="-_.~"))
             )
-        )
 
     return "&".join(encoded_pairs)
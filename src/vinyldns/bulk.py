@@ -0,0 +1,148 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Submitting change lists of any size as several batch changes."""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from vinyldns.batch_change import BatchChangeRequest
+from vinyldns.client import ClientError
+from vinyldns.tracing import operation
+
+__all__ = [u'BulkResult', u'chunk_changes', u'single_changes', u'submit_changes']
+
+# the number of changes VinylDNS accepts in one batch change by default
+MAX_BATCH_CHANGES = 1000
+
+
+class BulkResult(object):
+    """
+    The outcome of every change submitted by submit_changes.
+    """
+
+    def __init__(self, changes, outcomes, batch_changes, errors):
+        """
+        :param changes: the changes submitted, in the order given
+        :param outcomes: for each change, its AddRecordChange or DeleteRecordSetChange, or the exception
+            raised when its chunk was submitted, or a ClientError if the API did not return it
+        :param batch_changes: the BatchChange created for each chunk that was accepted
+        :param errors: the exception raised for each chunk that was rejected
+        """
+        self.changes = changes
+        self.outcomes = outcomes
+        self.batch_changes = batch_changes
+        self.errors = errors
+
+    def __iter__(self):
+        return iter(zip(self.changes, self.outcomes))
+
+    def __len__(self):
+        return len(self.changes)
+
+    @property
+    def ok(self):
+        return not self.failed()
+
+    def failed(self):
+        """
+        :return: (change, exception) for every change that failed
+        """
+        return [(change, outcome) for change, outcome in self if isinstance(outcome, Exception)]
+
+
+def chunk_changes(changes, max_changes=MAX_BATCH_CHANGES):
+    """
+    Split changes into chunks of at most max_changes, keeping every change for the same input name in
+    the same chunk so that a delete and the add replacing it are applied together.
+
+    :param changes: a list of AddRecord and DeleteRecordSet
+    :param max_changes: the most changes in one chunk
+    :return: a list of chunks, each a list of indexes into changes
+    """
+    groups = {}
+    for i, change in enumerate(changes):
+        groups.setdefault(change.input_name.lower().rstrip(u'.'), []).append(i)
+
+    chunks, chunk = [], []
+    for name, indexes in groups.items():
+        if len(indexes) > max_changes:
+            raise ValueError(u'{0} has {1} changes, more than fit in one batch change'.format(name, len(indexes)))
+        if chunk and len(chunk) + len(indexes) > max_changes:
+            chunks.append(chunk)
+            chunk = []
+        chunk.extend(indexes)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def single_changes(batch_change, count):
+    """
+    Match the single changes of a created batch change to the changes submitted, which come back in the
+    order they were submitted.
+
+    :param batch_change: the BatchChange returned for the changes
+    :param count: the number of changes submitted
+    :return: the single change of each submitted change, or a ClientError for any the API did not return
+    """
+    outcomes = list(batch_change.changes[:count])
+    if len(outcomes) < count:
+        error = ClientError(u'Batch change {0} has {1} changes, {2} were submitted'.format(
+            batch_change.id, len(batch_change.changes), count))
+        outcomes.extend([error] * (count - len(outcomes)))
+    return outcomes
+
+
+def submit_changes(client, changes, comments=None, owner_group_id=None, allow_manual_review=None,
+                   max_changes=MAX_BATCH_CHANGES, max_workers=4, **kwargs):
+    """
+    Submit any number of changes as batch changes of at most max_changes, several at a time.
+
+    A rejected chunk does not stop the others; its exception is recorded as the outcome of each of its
+    changes.
+
+    :param client: the VinylDNSClient used to submit the changes
+    :param changes: an iterable of AddRecord and DeleteRecordSet
+    :param comments: the comments of each batch change
+    :param owner_group_id: the owner group of each batch change
+    :param allow_manual_review: set to false to fail rather than go to review if there are errors
+    :param max_changes: the most changes in one batch change
+    :param max_workers: the most batch changes submitted at once
+    :return: a BulkResult
+    """
+    changes = list(changes)
+    chunks = chunk_changes(changes, max_changes)
+
+    def submit(chunk):
+        request = BatchChangeRequest([changes[i] for i in chunk], comments, owner_group_id)
+        return client.create_batch_change(request, allow_manual_review=allow_manual_review, **kwargs)
+
+    outcomes, batch_changes, errors = [None] * len(changes), [], []
+    with operation(u'submit_changes', item_count=len(changes), chunk_count=len(chunks)) as span, \
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=u'vinyldns-bulk') as executor:
+        # each chunk runs in a copy of the caller's context so deadlines and the span carry over
+        futures = [executor.submit(contextvars.copy_context().run, submit, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                batch_change = future.result()
+            except Exception as e:
+                errors.append(e)
+                for i in chunk:
+                    outcomes[i] = e
+                continue
+            batch_changes.append(batch_change)
+            for i, outcome in zip(chunk, single_changes(batch_change, len(chunk))):
+                outcomes[i] = outcome
+        span.set_attribute(u'vinyldns.error_count', len(errors))
+
+    return BulkResult(changes, outcomes, batch_changes, errors)
@@ -0,0 +1,118 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Circuit breaker that fails requests fast while the VinylDNS API is unavailable."""
+import collections
+import threading
+import time
+
+__all__ = [u'CircuitBreaker', u'CircuitState']
+
+
+class CircuitState:
+    Closed = "Closed"
+    Open = "Open"
+    HalfOpen = "HalfOpen"
+
+
+class CircuitBreaker(object):
+    """
+    Tracks request outcomes and opens after too many consecutive failures or too high a failure rate.
+
+    While open every request is rejected without touching the network. Once ``reset_timeout`` has passed,
+    a single probe request is admitted; the circuit closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, failure_threshold=5, failure_rate=0.5, window_size=20, min_calls=10, reset_timeout=30.0,
+                 probe_with_ping=False):
+        """
+        :param failure_threshold: the number of consecutive failures that opens the circuit
+        :param failure_rate: the fraction of failures within the window that opens the circuit
+        :param window_size: the number of most recent outcomes used to compute the failure rate
+        :param min_calls: the minimum number of outcomes in the window before the failure rate applies
+        :param reset_timeout: the number of seconds to stay open before admitting a probe
+        :param probe_with_ping: probe with a ping rather than with the first request admitted
+        """
+        self.failure_threshold = failure_threshold
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.probe_with_ping = probe_with_ping
+        self._outcomes = collections.deque(maxlen=window_size)
+        self._consecutive_failures = 0
+        self._state = CircuitState.Closed
+        self._opened_at = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def admit(self):
+        """
+        Decide whether a request may be sent.
+
+        :return: CircuitState.Closed if the request may be sent normally, CircuitState.HalfOpen if it is the
+        single probe, or CircuitState.Open if it must be rejected
+        """
+        with self._lock:
+            if self._state == CircuitState.Closed:
+                return CircuitState.Closed
+
+            if self._state == CircuitState.Open:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return CircuitState.Open
+                self._state = CircuitState.HalfOpen
+
+            if self._probe_in_flight:
+                return CircuitState.Open
+            self._probe_in_flight = True
+            return CircuitState.HalfOpen
+
+    def record_success(self):
+        with self._lock:
+            self._outcomes.append(True)
+            self._consecutive_failures = 0
+            if self._state == CircuitState.HalfOpen:
+                self._state = CircuitState.Closed
+                self._outcomes.clear()
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(False)
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HalfOpen or self.__should_trip():
+                self._state = CircuitState.Open
+                self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release(self, admitted):
+        """
+        Give up an admitted request without recording an outcome, freeing the probe slot if it held it.
+
+        :param admitted: the state returned by admit() for the request
+        """
+        if admitted == CircuitState.HalfOpen:
+            with self._lock:
+                self._probe_in_flight = False
+
+    def __should_trip(self):
+        if self._consecutive_failures >= self.failure_threshold:
+            return True
+        if len(self._outcomes) < self.min_calls:
+            return False
+        failures = sum(1 for ok in self._outcomes if not ok)
+        return failures >= self.failure_rate * len(self._outcomes)
@@ -13,22 +13,31 @@
 # limitations under the License.
 """TODO: Add module docstring."""
 
-import json
 import logging
 import os
+import threading
+import time
 import requests
 from datetime import datetime, UTC
-from urllib.parse import parse_qs, urljoin, urlparse, urlsplit
 
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from vinyldns.boto_request_signer import BotoRequestSigner
+from vinyldns.balancer import Endpoint, EndpointPool
+from vinyldns.boto_request_signer import BotoRequestSigner, generate_canonical_query_string
+from vinyldns.circuit_breaker import CircuitState
+from vinyldns.deadline import clamp_timeout, current_deadline
+from vinyldns.hooks import Hooks, RequestEvent, current_request, end_request, instrumented, start_request
+from vinyldns.metrics import ClientMetrics
+from vinyldns.retry import RetryBudget, RetryPolicy
+from vinyldns.streaming import ArrayStream
+from vinyldns.tracing import RequestTracer, operation, page
+from vinyldns.transport import RequestsTransport
+from vinyldns import waiter
+from vinyldns.update import RecordSetUpdater
 
 from vinyldns.batch_change import BatchChange, ListBatchChangeSummaries, to_review_json
 from vinyldns.membership import Group, ListGroupsResponse, ListGroupChangesResponse, ListMembersResponse, \
     ListAdminsResponse, GroupChange, UserInfo
-from vinyldns.serdes import to_json_string
+from vinyldns.serdes import json_dumps, json_loads, to_json_bytes
 from vinyldns.zone import ListZonesResponse, ListZoneChangesResponse, Zone, ZoneChange, ZoneDetails, \
     ZoneChangeFailuresResponse, DeletedZonesResponse
 from vinyldns.record import ListRecordSetsResponse, ListRecordSetChangesResponse, RecordSet, RecordSetChange, \
@@ -42,6 +51,28 @@ __all__ = [u'VinylDNSClient', u'MAX_RETRIES', u'RETRY_WAIT']
 MAX_RETRIES = 30
 RETRY_WAIT = 0.05
 
+# (connect, read) timeouts in seconds used for any endpoint without an override
+DEFAULT_TIMEOUT = (3.05, 30)
+
+# Per-endpoint (connect, read) timeout overrides, keyed by client method name
+ENDPOINT_TIMEOUTS = {
+    u'ping': (1, 2),
+    u'health': (1, 5),
+    u'color': (1, 2),
+    u'create_batch_change': (3.05, 120),
+    u'search_record_sets': (3.05, 60),
+    u'stream_search_record_sets': (3.05, 60),
+}
+
+
+def _query_params(params):
+    """
+    :return: the query parameters that have a value; None and empty strings or lists are left out, so an
+    unset filter or page token is not sent at all
+    """
+    return dict((k, v) for k, v in params.items()
+                if v is not None and not (isinstance(v, (str, bytes, list, tuple, set, frozenset)) and not v))
+
 
 class ClientError(Exception):
     """Base class for custom exceptions"""
@@ -78,12 +109,62 @@ class UnprocessableError(ClientError):
     pass
 
 
+class DeadlineExceededError(ClientError):
+    """The deadline for the operation passed before the request could complete"""
+    pass
+
+
+class CircuitOpenError(ClientError):
+    """The circuit breaker is open and the request was not sent"""
+    pass
+
+
+class WaitTimeoutError(ClientError):
+    """The operations being waited on did not all finish in time"""
+
+    def __init__(self, message, done, pending):
+        """
+        :param done: the final state of the operations that finished, by id
+        :param pending: the last state seen of the operations that did not, by id; None for those never fetched
+        """
+        super(WaitTimeoutError, self).__init__(message)
+        self.done = done
+        self.pending = pending
+
+
 class VinylDNSClient(object):
     """TODO: Add class docstring."""
 
-    def __init__(self, url, access_key, secret_key):
-        """TODO: Add method docstring."""
-        self.index_url = url
+    def __init__(self, url, access_key, secret_key, retry_policy=None, timeout=DEFAULT_TIMEOUT,
+                 endpoint_timeouts=None, circuit_breaker=None, hedging=None, expected_color=None, read_url=None,
+                 read_your_writes=2.0, transport=None, metrics=False, tracing=False):
+        """
+        :param url: the base url of the VinylDNS API, or a list of base urls to balance requests across
+        :param access_key: the access key used to sign requests
+        :param secret_key: the secret key used to sign requests
+        :param retry_policy: an optional RetryPolicy; by default retries are spread with full jitter and capped by
+        a client-wide RetryBudget
+        :param timeout: the default (connect, read) timeout in seconds for every request
+        :param endpoint_timeouts: a dictionary of client method name to timeout, merged over ENDPOINT_TIMEOUTS
+        :param circuit_breaker: an optional CircuitBreaker that fails requests fast while the API is unavailable
+        :param hedging: an optional HedgingPolicy that hedges slow idempotent reads with a second request
+        :param expected_color: when balancing across several urls, only readmit nodes reporting this color
+        :param read_url: an optional base url, or list of base urls, that GET requests are sent to; mutations
+        always go to url
+        :param read_your_writes: the number of seconds after a mutation during which reads are also sent to url,
+        so they observe the write
+        :param transport: the Transport class, or any callable taking the retry policy, used to send requests;
+        defaults to RequestsTransport
+        :param metrics: True to keep latency histograms and counts of the requests made, read with stats(), or a
+        ClientMetrics to share one between clients; off by default, as it adds hooks to every request
+        :param tracing: True to emit an OpenTelemetry span for every API call, when OpenTelemetry is installed;
+        off by default, as it adds hooks to every request
+        """
+        urls = [url] if isinstance(url, str) else list(url)
+        self.timeout = timeout
+        self.endpoint_timeouts = dict(ENDPOINT_TIMEOUTS)
+        self.endpoint_timeouts.update(endpoint_timeouts or {})
+        self.index_url = urls[0]
         self.headers = {
             u'Accept': u'application/json, text/plain',
             u'Content-Type': u'application/json'
@@ -92,7 +173,32 @@ class VinylDNSClient(object):
         self.signer = BotoRequestSigner(self.index_url,
                                         access_key, secret_key)
 
-        self.session = self.__requests_retry_session()
+        # each endpoint gets its own signer, as the signature covers the host it is sent to
+        self.endpoints = EndpointPool(
+            [Endpoint(self.index_url, self.signer)] +
+            [Endpoint(u, BotoRequestSigner(u, access_key, secret_key)) for u in urls[1:]])
+        self.expected_color = expected_color
+
+        read_urls = [] if read_url is None else [read_url] if isinstance(read_url, str) else list(read_url)
+        self.read_endpoints = EndpointPool(
+            [Endpoint(u, BotoRequestSigner(u, access_key, secret_key)) for u in read_urls]) if read_urls else None
+        self.read_your_writes = read_your_writes
+        self._last_write = None
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy(total=5, backoff_factor=0.4, backoff_max=20, budget=RetryBudget())
+        self.retry_policy = retry_policy
+        self.transport = (transport or RequestsTransport)(self.retry_policy)
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.hooks = Hooks()
+        self.metrics = None
+        if metrics:
+            self.metrics = metrics if isinstance(metrics, ClientMetrics) else ClientMetrics()
+            self.metrics.attach(self)
+        if tracing:
+            RequestTracer().attach(self)
+        self.record_set_updater = RecordSetUpdater(self)
 
     @classmethod
     def from_env(cls):
@@ -109,55 +215,291 @@ class VinylDNSClient(object):
             raise Exception('\'VINYLDNS_API_URL\', \'VINYLDNS_ACCESS_KEY_ID\', '
                             '\'VINYLDNS_SECRET_ACCESS_KEY\' environment variables'
                             'are required.')
-        return cls(url, access_key, secret_key)
-
-    def __requests_retry_session(self,
-                                 retries=5,
-                                 backoff_factor=0.4,
-                                 status_forcelist=(500, 502, 504),
-                                 session=None):
-
-        session = session or requests.Session()
-        retry = Retry(
-            total=retries,
-            read=retries,
-            connect=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=status_forcelist,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount(u'http://', adapter)
-        session.mount(u'https://', adapter)
-        return session
 
-    def __make_request(self, url, method=u'GET', headers=None, body_string=None, raw_response=False, **kwargs):
+        # several endpoints may be given as a comma separated list
+        urls = [u.strip() for u in url.split(',') if u.strip()]
+        return cls(urls if len(urls) > 1 else url, access_key, secret_key)
+
+    @property
+    def session(self):
+        """
+        The requests session, when the client uses a RequestsTransport.
+        """
+        return getattr(self.transport, u'session', None)
+
+    def close(self):
+        """
+        Release the connections held by the transport and shut down the hedging thread pools.
+        """
+        self.transport.close()
+        if self.hedging is not None:
+            self.hedging.close()
+
+    def add_hook(self, name, hook):
+        """
+        Call a function at a point of every request the client makes, e.g. to feed telemetry.
+
+        :param name: before_request, after_response, on_retry or on_error
+        :param hook: a function taking a RequestEvent, which has the endpoint, method, path, status, bytes in
+        and out, retry count and a breakdown of the request's time in timings
+        :return: the hook
+        """
+        return self.hooks.register(name, hook)
+
+    def remove_hook(self, name, hook):
+        self.hooks.unregister(name, hook)
+
+    def stats(self):
+        """
+        The latency, status, retry, in flight and connection reuse metrics of the requests this client has
+        made, by client method. Render them for Prometheus with client.metrics.render_prometheus().
+
+        :return: a dict of metrics by client method name, empty if metrics are turned off
+        """
+        return self.metrics.stats() if self.metrics is not None else {}
 
+    def __make_request(self, path, method=u'GET', headers=None, body_string=None, raw_response=False, endpoint=None,
+                       params=None, stream=False, **kwargs):
+        """
+        :param path: the path of the API resource, e.g. /zones/{id}
+        :param params: a dictionary of query parameters; None and empty values are left out and list values
+        repeated
+        :param stream: return the successful response unread, in place of the decoded body
+        """
+        if not self.hooks:
+            return self.__request(path, method, headers, body_string, raw_response, endpoint, params, stream,
+                                  **kwargs)
+
+        event = RequestEvent(endpoint, method, path)
+        token = start_request(self.hooks, event)
+        try:
+            result = self.__request(path, method, headers, body_string, raw_response, endpoint, params, stream,
+                                    **kwargs)
+        except Exception as e:
+            end_request(self.hooks, event, token, e)
+            raise
+        end_request(self.hooks, event, token)
+        return result
+
+    def __request(self, path, method, headers, body_string, raw_response, endpoint, params, stream, **kwargs):
         # remove retries arg if provided
         kwargs.pop(u'retries', None)
+        kwargs[u'timeout'] = self.__request_timeout(endpoint, kwargs.get(u'timeout'))
+
+        # the query is encoded once, in canonical form, and that same string is both signed and sent
+        query = generate_canonical_query_string(_query_params(params)) if params else u''
+
+        if self.circuit_breaker is None:
+            response = self.__dispatch(path, query, method, headers, body_string, endpoint, stream=stream,
+                                       **kwargs)
+            return self.__check_response(response, method, raw_response=raw_response, stream=stream)
+
+        admitted = self.__admit(endpoint)
+        try:
+            response = self.__dispatch(path, query, method, headers, body_string, endpoint, stream=stream,
+                                       **kwargs)
+        except requests.exceptions.RequestException:
+            self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            self.circuit_breaker.release(admitted)
+            raise
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        return self.__check_response(response, method, raw_response=raw_response, stream=stream)
 
-        path = urlparse(url).path
+    def __admit(self, endpoint):
+        """
+        Ask the circuit breaker to admit a request, probing with a ping first if so configured.
 
-        # we must parse the query string so we can provide it if it exists so that we can pass it to the
-        # build_vinyldns_request so that it can be properly included in the AWS signing...
-        query = parse_qs(urlsplit(url).query)
+        :return: the state the request was admitted in
+        """
+        admitted = self.circuit_breaker.admit()
+        if admitted == CircuitState.Open:
+            raise CircuitOpenError(u'Circuit open, failing {0} fast'.format(endpoint))
 
-        if query:
-            # the problem with parse_qs is that it will return a list for ALL params, even if they are a single value
-            # we need to essentially flatten the params if a param has only one value
-            query = dict((k, v if len(v) > 1 else v[0])
-                         for k, v in query.items())
+        if admitted == CircuitState.HalfOpen and self.circuit_breaker.probe_with_ping and endpoint != u'ping':
+            try:
+                probe = self.__send(u'/ping', u'', u'GET', self.headers, None, u'ping',
+                                    timeout=self.__request_timeout(u'ping'))
+            except requests.exceptions.RequestException as e:
+                self.circuit_breaker.record_failure()
+                raise CircuitOpenError(u'Circuit probe failed, failing {0} fast'.format(endpoint)) from e
+            except BaseException:
+                self.circuit_breaker.release(admitted)
+                raise
 
-        signed_headers, signed_body = self.__build_vinyldns_request(method, path, body_string, query,
-                                                                    with_headers=headers or {}, **kwargs)
+            if probe.status_code != 200:
+                self.circuit_breaker.record_failure()
+                raise CircuitOpenError(u'Circuit probe failed, failing {0} fast'.format(endpoint))
+            self.circuit_breaker.record_success()
+            admitted = CircuitState.Closed
+
+        return admitted
+
+    def __dispatch(self, path, query, method, headers, body_string, endpoint, **kwargs):
+        """
+        Send a request, hedging it if the hedging policy covers the endpoint.
+        """
+        if self.hedging is None or not self.hedging.applies_to(endpoint, method):
+            return self.__send(path, query, method, headers, body_string, endpoint, **kwargs)
+
+        def send():
+            return self.__send(path, query, method, headers, body_string, endpoint, **kwargs)
+
+        return self.hedging.run(endpoint, send, discard=lambda response: response.close())
+
+    def __send(self, path, query, method, headers, body_string, endpoint, target=None, pool=None, stream=False,
+               **kwargs):
+        """
+        Sign and send a request, returning the raw response.
 
-        response = self.session.request(method, url, data=signed_body, headers=signed_headers, **kwargs)
+        :param path: the path of the API resource
+        :param query: the canonical query string, which is signed and sent as is
+        :param target: the Endpoint to send to; by default one is chosen from the pool
+        :param pool: the EndpointPool the target belongs to; by default the pool serving the method
+        """
+        pool = pool or self.__pool_for(method)
+        target = target or pool.choose()
+        url = target.url_for(path, query)
 
-        return self.__check_response(response, method, raw_response=raw_response)
+        event = current_request()
+        started = time.perf_counter()
+        signed_headers, signed_body = self.__build_vinyldns_request(method, path, body_string, query,
+                                                                    with_headers=headers or {},
+                                                                    signer=target.signer, **kwargs)
+        if event is not None:
+            event.add_time(u'sign', time.perf_counter() - started)
+            event.url = url
+            event.bytes_out += len(signed_body) if signed_body else 0
+
+        self.retry_policy.record_request()
+        pool.acquire(target)
+        ok = False
+        try:
+            response = self.transport.request(method, url, signed_headers, signed_body, kwargs[u'timeout'],
+                                              stream=stream)
+            ok = response.status_code < 500
+            if event is not None:
+                event.status = response.status_code
+                if not stream:
+                    event.bytes_in = (event.bytes_in or 0) + len(response.content)
+            return response
+        except requests.exceptions.Timeout as e:
+            active_deadline = current_deadline()
+            if active_deadline is not None and active_deadline.expired():
+                raise DeadlineExceededError(u'Deadline exceeded during {0}'.format(endpoint or path)) from e
+            raise
+        finally:
+            if method != u'GET':
+                self._last_write = time.monotonic()
+            pool.release(target, ok)
+            self.__schedule_endpoint_checks()
+
+    def __pool_for(self, method):
+        """
+        Reads go to the read pool, if there is one, unless a mutation was sent within the read-your-writes window.
+        """
+        if method != u'GET' or self.read_endpoints is None:
+            return self.endpoints
+        last_write = self._last_write
+        if last_write is not None and time.monotonic() - last_write < self.read_your_writes:
+            return self.endpoints
+        return self.read_endpoints
+
+    def __pools(self):
+        return [self.endpoints] if self.read_endpoints is None else [self.endpoints, self.read_endpoints]
+
+    def __schedule_endpoint_checks(self):
+        """
+        Health check any ejected endpoints that are due, in the background.
+        """
+        for pool in self.__pools():
+            due = pool.due_for_check()
+            if due:
+                threading.Thread(target=self.__check_endpoints, args=(pool, due), name=u'vinyldns-endpoint-check',
+                                 daemon=True).start()
+
+    def __check_endpoints(self, pool, endpoints):
+        results = {}
+        for target in endpoints:
+            passed = self.__check_endpoint(pool, target)
+            pool.mark_checked(target, passed)
+            results[target.url] = passed
+        return results
+
+    def __check_endpoint(self, pool, target):
+        """
+        An endpoint passes its check if it answers ping and health, and reports the expected color if one is set.
+        """
+        checks = [u'ping', u'health']
+        if self.expected_color is not None:
+            checks.append(u'color')
+
+        try:
+            for check in checks:
+                response = self.__send(u'/' + check, u'', u'GET', self.headers, None, check,
+                                       target=target, pool=pool, timeout=self.__request_timeout(check))
+                if response.status_code != 200:
+                    return False
+                if check == u'color' and response.text.strip() != self.expected_color:
+                    return False
+        except requests.exceptions.RequestException:
+            return False
+        return True
+
+    def check_endpoints(self):
+        """
+        Health check every endpoint now using ping, health and (if expected_color is set) color, ejecting those
+        that fail and readmitting those that pass.
+
+        :return: a dictionary of endpoint url to whether it passed
+        """
+        results = {}
+        for pool in self.__pools():
+            results.update(self.__check_endpoints(pool, pool.endpoints))
+        return results
+
+    def __stream(self, path, params, endpoint, key, item_hook, **kwargs):
+        """
+        Send a GET and stream the items of one array member of the response.
+
+        :return: an ArrayStream, or None if the resource was not found
+        """
+        status, response = self.__make_request(path, u'GET', self.headers, params=params, endpoint=endpoint,
+                                               stream=True, **kwargs)
+        if response is None:
+            return None
+        return ArrayStream(response.iter_content(), key, item_hook, close=response.close)
+
+    def __request_timeout(self, endpoint, timeout=None):
+        """
+        Resolve the timeout for a request, clamped to any deadline in effect.
+        """
+        if timeout is None:
+            timeout = self.endpoint_timeouts.get(endpoint, self.timeout)
+
+        active_deadline = current_deadline()
+        if active_deadline is None:
+            return timeout
+        if active_deadline.expired():
+            raise DeadlineExceededError(
+                u'Deadline of {0}s exceeded before {1}'.format(active_deadline.seconds, endpoint))
+        return clamp_timeout(timeout, active_deadline.remaining())
 
-    def __check_response(self, response, method, raw_response=False):
+    def __check_response(self, response, method, raw_response=False, stream=False):
         status = response.status_code
-        if status == 200 or status == 202:
-            response_data = response.text if raw_response else response.json()
+        if (status == 200 or status == 202) and stream:
+            return response.status_code, response
+        elif status == 200 or status == 202:
+            event = current_request()
+            started = time.perf_counter()
+            response_data = response.text if raw_response else json_loads(response.content)
+            if event is not None:
+                event.add_time(u'decode', time.perf_counter() - started)
             return response.status_code, response_data
         elif status == 400:
             raise BadRequestError(response.text)
@@ -167,6 +509,7 @@ class VinylDNSClient(object):
             raise ForbiddenError(response.text)
         elif status == 404:
             if method == 'GET':
+                response.close()
                 return 404, None
             else:
                 raise NotFoundError(response.text)
@@ -177,12 +520,12 @@ class VinylDNSClient(object):
         else:
             raise ClientError(response.text)
 
-    def __build_vinyldns_request(self, method, path, body_data, params=None, **kwargs):
+    def __build_vinyldns_request(self, method, path, body_data, query=u'', **kwargs):
 
-        if isinstance(body_data, str):
+        if isinstance(body_data, (str, bytes)):
             body_string = body_data
         else:
-            body_string = json.dumps(body_data)
+            body_string = json_dumps(body_data)
 
         new_headers = {u'X-Amz-Target': u'VinylDNS'}
         new_headers.update(kwargs.get(u'with_headers', dict()))
@@ -191,7 +534,8 @@ class VinylDNSClient(object):
 
         headers = self.__build_headers(new_headers, suppress_headers)
 
-        auth_header = self.signer.build_auth_header(method, path, headers, body_string, params)
+        signer = kwargs.get(u'signer') or self.signer
+        auth_header = signer.build_auth_header(method, path, headers, body_string, query=query)
         headers[u'Authorization'] = auth_header
 
         return headers, body_string
@@ -216,6 +560,7 @@ class VinylDNSClient(object):
 
         return headers
 
+    @instrumented
     def create_group(self, group, **kwargs):
         """
         Create a new group.
@@ -223,11 +568,13 @@ class VinylDNSClient(object):
         :param group: A group dictionary that can be serialized to json
         :return: the content of the response, which should be a group json
         """
-        url = urljoin(self.index_url, u'/groups')
-        response, data = self.__make_request(url, u'POST', self.headers, to_json_string(group), **kwargs)
+        path = u'/groups'
+        response, data = self.__make_request(path, u'POST', self.headers, to_json_bytes(group),
+                                             endpoint=u'create_group', **kwargs)
 
         return Group.from_dict(data)
 
+    @instrumented
     def get_group(self, group_id, **kwargs):
         """
         Get a group.
@@ -235,11 +582,12 @@ class VinylDNSClient(object):
         :param group_id: Id of the group to get
         :return: the group json
         """
-        url = urljoin(self.index_url, u'/groups/' + group_id)
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/' + group_id
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_group', **kwargs)
 
         return Group.from_dict(data) if data is not None else None
 
+    @instrumented
     def delete_group(self, group_id, **kwargs):
         """
         Delete a group.
@@ -247,11 +595,12 @@ class VinylDNSClient(object):
         :param group_id: Id of the group to delete
         :return: the group json
         """
-        url = urljoin(self.index_url, u'/groups/' + group_id)
-        response, data = self.__make_request(url, u'DELETE', self.headers, **kwargs)
+        path = u'/groups/' + group_id
+        response, data = self.__make_request(path, u'DELETE', self.headers, endpoint=u'delete_group', **kwargs)
 
         return Group.from_dict(data)
 
+    @instrumented
     def update_group(self, group, **kwargs):
         """
         Update an existing group, uses the id of the group provided
@@ -259,11 +608,13 @@ class VinylDNSClient(object):
         :param group: A group to be updated
         :return: the content of the response, which should be a group json
         """
-        url = urljoin(self.index_url, u'/groups/{0}'.format(group.id))
-        response, data = self.__make_request(url, u'PUT', self.headers, to_json_string(group), **kwargs)
+        path = u'/groups/{0}'.format(group.id)
+        response, data = self.__make_request(path, u'PUT', self.headers, to_json_bytes(group),
+                                             endpoint=u'update_group', **kwargs)
 
         return Group.from_dict(data)
 
+    @instrumented
     def list_my_groups(self, group_name_filter=None, start_from=None, max_items=None, **kwargs):
         """
         Retrieve my groups.
@@ -273,19 +624,13 @@ class VinylDNSClient(object):
         :param group_name_filter: only returns groups whose names contain filter string
         :return: the content of the response
         """
-        args = []
-        if group_name_filter:
-            args.append(u'groupNameFilter={0}'.format(group_name_filter))
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-
-        url = urljoin(self.index_url, u'/groups') + u'?' + u'&'.join(args)
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'groupNameFilter': group_name_filter, u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(u'/groups', u'GET', self.headers, params=params,
+                                             endpoint=u'list_my_groups', **kwargs)
 
         return ListGroupsResponse.from_dict(data)
 
+    @instrumented
     def list_all_my_groups(self, group_name_filter=None, **kwargs):
         """
         Retrieve all my groups, paging through the results until exhausted
@@ -294,24 +639,27 @@ class VinylDNSClient(object):
         :return: the content of the response
         """
         groups = []
-        args = []
-        if group_name_filter:
-            args.append(u'groupNameFilter={0}'.format(group_name_filter))
-
-        url = urljoin(self.index_url, u'/groups') + u'?' + u'&'.join(args)
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
-        groups.extend(data[u'groups'])
-
-        while u'nextId' in data and data[u'nextId']:
-            next_args = args[:]
-            next_args.append(u'startFrom={0}'.format(data['nextId']))
-            url = urljoin(self.index_url, u'/groups') + u'?' + u'&'.join(next_args)
-            response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'groupNameFilter': group_name_filter}
+        with operation(u'list_all_my_groups') as span:
+            with page(1):
+                response, data = self.__make_request(u'/groups', u'GET', self.headers, params=params,
+                                                     endpoint=u'list_all_my_groups', **kwargs)
             groups.extend(data[u'groups'])
 
-        g = [Group.from_dict(elem) for elem in groups]
-        return ListGroupsResponse(groups=g, group_name_filter=group_name_filter)
+            pages = 1
+            while u'nextId' in data and data[u'nextId']:
+                pages += 1
+                next_params = dict(params, startFrom=data[u'nextId'])
+                with page(pages):
+                    response, data = self.__make_request(u'/groups', u'GET', self.headers, params=next_params,
+                                                         endpoint=u'list_all_my_groups', **kwargs)
+                groups.extend(data[u'groups'])
+            span.set_attributes({u'vinyldns.page_count': pages, u'vinyldns.item_count': len(groups)})
 
+            g = [Group.from_dict(elem) for elem in groups]
+            return ListGroupsResponse(groups=g, group_name_filter=group_name_filter)
+
+    @instrumented
     def list_members_group(self, group_id, start_from=None, max_items=None, **kwargs):
         """
         List the members of an existing group.
@@ -321,21 +669,14 @@ class VinylDNSClient(object):
         :param max_items: the max number of items to be returned
         :return: the json of the members
         """
-        if start_from is None and max_items is None:
-            url = urljoin(self.index_url, u'/groups/{0}/members'.format(group_id))
-        elif start_from is None and max_items is not None:
-            url = urljoin(self.index_url, u'/groups/{0}/members?maxItems={1}'.format(group_id, max_items))
-        elif start_from is not None and max_items is None:
-            url = urljoin(self.index_url, u'/groups/{0}/members?startFrom={1}'.format(group_id, start_from))
-        elif start_from is not None and max_items is not None:
-            url = urljoin(self.index_url, u'/groups/{0}/members?startFrom={1}&maxItems={2}'.format(group_id,
-                                                                                                   start_from,
-                                                                                                   max_items))
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/{0}/members'.format(group_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_members_group', **kwargs)
 
         return ListMembersResponse.from_dict(data)
 
+    @instrumented
     def list_group_admins(self, group_id, **kwargs):
         """
         Return the group admins.
@@ -343,11 +684,12 @@ class VinylDNSClient(object):
         :param group_id: the Id of the group
         :return: the user info of the admins
         """
-        url = urljoin(self.index_url, u'/groups/{0}/admins'.format(group_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/{0}/admins'.format(group_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'list_group_admins', **kwargs)
 
         return ListAdminsResponse.from_dict(data)
 
+    @instrumented
     def list_group_changes(self, group_id, start_from=None, max_items=None, **kwargs):
         """
         List the changes of an existing group.
@@ -357,21 +699,14 @@ class VinylDNSClient(object):
         :param max_items: the max number of items to be returned
         :return: the json of the members
         """
-        if start_from is None and max_items is None:
-            url = urljoin(self.index_url, u'/groups/{0}/activity'.format(group_id))
-        elif start_from is None and max_items is not None:
-            url = urljoin(self.index_url, u'/groups/{0}/activity?maxItems={1}'.format(group_id, max_items))
-        elif start_from is not None and max_items is None:
-            url = urljoin(self.index_url, u'/groups/{0}/activity?startFrom={1}'.format(group_id, start_from))
-        elif start_from is not None and max_items is not None:
-            url = urljoin(self.index_url, u'/groups/{0}/activity?startFrom={1}&maxItems={2}'.format(group_id,
-                                                                                                    start_from,
-                                                                                                    max_items))
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/{0}/activity'.format(group_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_group_changes', **kwargs)
 
         return ListGroupChangesResponse.from_dict(data)
 
+    @instrumented
     def get_group_change(self, group_change_id, **kwargs):
         """
         Get a group change by ID.
@@ -379,21 +714,24 @@ class VinylDNSClient(object):
         :param group_change_id: the group change ID
         :return: the group change details
         """
-        url = urljoin(self.index_url, u'/groups/change/{0}'.format(group_change_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/change/{0}'.format(group_change_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_group_change', **kwargs)
 
         return GroupChange.from_dict(data) if data is not None else None
 
+    @instrumented
     def list_group_valid_domains(self, **kwargs):
         """
         List valid email domains for groups.
 
         :return: list of valid domains
         """
-        url = urljoin(self.index_url, u'/groups/valid/domains')
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/groups/valid/domains'
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'list_group_valid_domains',
+                                             **kwargs)
         return data if data is not None else []
 
+    @instrumented
     def connect_zone(self, zone, **kwargs):
         """
         Create a new zone with the given name and email.
@@ -401,10 +739,12 @@ class VinylDNSClient(object):
         :param zone: the zone to be created
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones')
-        response, data = self.__make_request(url, u'POST', self.headers, to_json_string(zone), **kwargs)
+        path = u'/zones'
+        response, data = self.__make_request(path, u'POST', self.headers, to_json_bytes(zone),
+                                             endpoint=u'connect_zone', **kwargs)
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def update_zone(self, zone, **kwargs):
         """
         Update a zone.
@@ -412,10 +752,12 @@ class VinylDNSClient(object):
         :param zone: the zone to be created
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}'.format(zone.id))
-        response, data = self.__make_request(url, u'PUT', self.headers, to_json_string(zone), **kwargs)
+        path = u'/zones/{0}'.format(zone.id)
+        response, data = self.__make_request(path, u'PUT', self.headers, to_json_bytes(zone),
+                                             endpoint=u'update_zone', **kwargs)
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def sync_zone(self, zone_id, **kwargs):
         """
         Sync a zone.
@@ -423,11 +765,12 @@ class VinylDNSClient(object):
         :param zone: the zone to be updated
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/sync'.format(zone_id))
-        response, data = self.__make_request(url, u'POST', self.headers, **kwargs)
+        path = u'/zones/{0}/sync'.format(zone_id)
+        response, data = self.__make_request(path, u'POST', self.headers, endpoint=u'sync_zone', **kwargs)
 
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def abandon_zone(self, zone_id, **kwargs):
         """
         Delete the zone for the given id.
@@ -435,11 +778,12 @@ class VinylDNSClient(object):
         :param zone_id: the id of the zone to be deleted
         :return: nothing, will fail if the status code was not expected
         """
-        url = urljoin(self.index_url, u'/zones/{0}'.format(zone_id))
-        response, data = self.__make_request(url, u'DELETE', self.headers, **kwargs)
+        path = u'/zones/{0}'.format(zone_id)
+        response, data = self.__make_request(path, u'DELETE', self.headers, endpoint=u'abandon_zone', **kwargs)
 
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def get_zone(self, zone_id, **kwargs):
         """
         Get a zone for the given zone id.
@@ -447,21 +791,49 @@ class VinylDNSClient(object):
         :param zone_id: the id of the zone to retrieve
         :return: the zone, or will 404 if not found
         """
-        url = urljoin(self.index_url, u'/zones/{0}'.format(zone_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/{0}'.format(zone_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_zone', **kwargs)
 
         return Zone.from_dict(data['zone']) if data is not None else None
 
+    def wait_for_zones(self, zone_ids, deleted=False, timeout=300, on_complete=None, backoff=None, **kwargs):
+        """
+        Wait for zones to exist, or to be gone.
+
+        :param zone_ids: the ids of the zones to wait for
+        :param deleted: wait for the zones to be gone rather than to exist
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param on_complete: an optional function called with the id and Zone of each one as it finishes
+        :param backoff: the Backoff between polls of a zone
+        :return: the Zone, or None once deleted, by id
+        """
+        return waiter.zones(self, zone_ids, deleted, **kwargs).run(timeout, backoff, on_complete)
+
+    def wait_for_zone_changes(self, zone_changes, timeout=300, on_complete=None, backoff=None, **kwargs):
+        """
+        Wait for zone changes, such as those returned by connect_zone, sync_zone and abandon_zone, to
+        complete or fail.
+
+        :param zone_changes: the ZoneChange objects to wait for
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param on_complete: an optional function called with the id and ZoneChange of each one as it finishes
+        :param backoff: the Backoff between polls of a zone change
+        :return: the final ZoneChange, by change id
+        """
+        return waiter.zone_changes(self, zone_changes, **kwargs).run(timeout, backoff, on_complete)
+
+    @instrumented
     def get_zone_by_name(self, name, **kwargs):
         """
         Get a zone by zone name.
         :param zone: the name of the zone to retrieve
         :return: the zone, or will 404 if not found
         """
-        url = urljoin(self.index_url, u'/zones/name/{0}'.format(name))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/name/{0}'.format(name)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_zone_by_name', **kwargs)
         return Zone.from_dict(data['zone']) if data is not None else None
 
+    @instrumented
     def get_zone_details(self, zone_id, **kwargs):
         """
         Get detailed zone info for the given zone id.
@@ -469,17 +841,18 @@ class VinylDNSClient(object):
         :param zone_id: the id of the zone to retrieve
         :return: the zone details, or will 404 if not found
         """
-        url = urljoin(self.index_url, u'/zones/{0}/details'.format(zone_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/{0}/details'.format(zone_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_zone_details', **kwargs)
 
         return ZoneDetails.from_dict(data['zone']) if data is not None else None
 
+    @instrumented
     def list_zone_backend_ids(self, **kwargs):
         """
         List configured backend IDs.
         """
-        url = urljoin(self.index_url, u'/zones/backendids')
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/backendids'
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'list_zone_backend_ids', **kwargs)
 
         if data is None:
             return []
@@ -487,46 +860,28 @@ class VinylDNSClient(object):
             return data.get('backendIds', [])
         return data
 
+    @instrumented
     def list_zone_changes_failure(self, name_filter=None, start_from=None, max_items=None, **kwargs):
         """
         List failed zone changes.
         """
-        args = []
-        if name_filter:
-            args.append(u'nameFilter={0}'.format(name_filter))
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-
-        url = urljoin(self.index_url, u'/metrics/health/zonechangesfailure')
-        if args:
-            url = url + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'nameFilter': name_filter, u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(u'/metrics/health/zonechangesfailure', u'GET', self.headers,
+                                             params=params, endpoint=u'list_zone_changes_failure', **kwargs)
         return ZoneChangeFailuresResponse.from_dict(data)
 
+    @instrumented
     def list_deleted_zones(self, name_filter=None, start_from=None, max_items=None, ignore_access=None, **kwargs):
         """
         List deleted zone changes.
         """
-        args = []
-        if name_filter:
-            args.append(u'nameFilter={0}'.format(name_filter))
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        if ignore_access is not None:
-            args.append(u'ignoreAccess={0}'.format(ignore_access))
-
-        url = urljoin(self.index_url, u'/zones/deleted/changes')
-        if args:
-            url = url + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'nameFilter': name_filter, u'startFrom': start_from, u'maxItems': max_items,
+                  u'ignoreAccess': ignore_access}
+        response, data = self.__make_request(u'/zones/deleted/changes', u'GET', self.headers, params=params,
+                                             endpoint=u'list_deleted_zones', **kwargs)
         return DeletedZonesResponse.from_dict(data)
 
+    @instrumented
     def list_zone_changes(self, zone_id, start_from=None, max_items=None, **kwargs):
         """
         Get the zone changes for the given zone id.
@@ -534,42 +889,27 @@ class VinylDNSClient(object):
         :param zone_id: the id of the zone to retrieve
         :param start_from: the start key of the page
         :param max_items: the page limit
-        :return: the zone, or will 404 if not found
+        :return: the zone changes, or None if the zone is not found
         """
-        args = []
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        url = urljoin(self.index_url, u'/zones/{0}/changes'.format(zone_id)) + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
-        return ListZoneChangesResponse.from_dict(data)
+        path = u'/zones/{0}/changes'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_zone_changes', **kwargs)
+        return ListZoneChangesResponse.from_dict(data) if data is not None else None
 
+    @instrumented
     def list_zones(self, name_filter=None, start_from=None, max_items=None, **kwargs):
         """
         Get a list of zones that currently exist.
 
         :return: a list of zones
         """
-        url = urljoin(self.index_url, u'/zones')
-
-        query = []
-        if name_filter:
-            query.append(u'nameFilter=' + name_filter)
-
-        if start_from:
-            query.append(u'startFrom=' + str(start_from))
-
-        if max_items:
-            query.append(u'maxItems=' + str(max_items))
-
-        if query:
-            url = url + u'?' + u'&'.join(query)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'nameFilter': name_filter, u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(u'/zones', u'GET', self.headers, params=params, endpoint=u'list_zones',
+                                             **kwargs)
         return ListZonesResponse.from_dict(data)
 
+    @instrumented
     def create_record_set(self, record_set, **kwargs):
         """
         Create a new record_set.
@@ -577,10 +917,12 @@ class VinylDNSClient(object):
         :param record_set: the record_set to be created
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets'.format(record_set.zone_id))
-        response, data = self.__make_request(url, u'POST', self.headers, to_json_string(record_set), **kwargs)
+        path = u'/zones/{0}/recordsets'.format(record_set.zone_id)
+        response, data = self.__make_request(path, u'POST', self.headers, to_json_bytes(record_set),
+                                             endpoint=u'create_record_set', **kwargs)
         return RecordSetChange.from_dict(data)
 
+    @instrumented
     def delete_record_set(self, zone_id, rs_id, **kwargs):
         """
         Delete an existing record_set.
@@ -589,11 +931,12 @@ class VinylDNSClient(object):
         :param rs_id: the id of the record_set to be deleted
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets/{1}'.format(zone_id, rs_id))
+        path = u'/zones/{0}/recordsets/{1}'.format(zone_id, rs_id)
 
-        response, data = self.__make_request(url, u'DELETE', self.headers, **kwargs)
+        response, data = self.__make_request(path, u'DELETE', self.headers, endpoint=u'delete_record_set', **kwargs)
         return RecordSetChange.from_dict(data)
 
+    @instrumented
     def update_record_set(self, record_set, **kwargs):
         """
         Update an existing record_set.
@@ -601,11 +944,11 @@ class VinylDNSClient(object):
         :param record_set: the record_set to be updated
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets/{1}'.format(record_set.zone_id, record_set.id))
+        path = u'/zones/{0}/recordsets/{1}'.format(record_set.zone_id, record_set.id)
 
         payload = self._record_set_update_payload(record_set)
-        response, data = self.__make_request(url, u'PUT', self.headers,
-                                             to_json_string(payload), **kwargs)
+        response, data = self.__make_request(path, u'PUT', self.headers,
+                                             to_json_bytes(payload), endpoint=u'update_record_set', **kwargs)
 
         return RecordSetChange.from_dict(data)
 
@@ -628,6 +971,21 @@ class VinylDNSClient(object):
 
         return payload
 
+    def modify_record_set(self, zone_id, rs_id, mutate, **kwargs):
+        """
+        Update a record set by reading it, applying a function and writing it back, reading and applying
+        the function again if another update conflicts. Concurrent modifications of the same record set
+        from this client are coalesced into one update. Retries are set on record_set_updater.
+
+        :param zone_id: the zone id the record_set belongs to
+        :param rs_id: the id of the record_set to be updated
+        :param mutate: a function that takes the current RecordSet and returns the RecordSet to write,
+        usually the same one changed in place, or None to leave it as it is
+        :return: the RecordSetChange of the update, or None if nothing was changed
+        """
+        return self.record_set_updater.modify(zone_id, rs_id, mutate, **kwargs)
+
+    @instrumented
     def get_record_set(self, zone_id, rs_id, **kwargs):
         """
         Get an existing record_set.
@@ -636,11 +994,26 @@ class VinylDNSClient(object):
         :param rs_id: the id of the record_set to be retrieved
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets/{1}'.format(zone_id, rs_id))
+        path = u'/zones/{0}/recordsets/{1}'.format(zone_id, rs_id)
 
-        response, data = self.__make_request(url, u'GET', self.headers, None, **kwargs)
+        response, data = self.__make_request(path, u'GET', self.headers, None, endpoint=u'get_record_set', **kwargs)
         return RecordSet.from_dict(data['recordSet']) if data is not None else None
 
+    def wait_for_record_sets(self, record_sets, deleted=False, timeout=300, on_complete=None, backoff=None,
+                             **kwargs):
+        """
+        Wait for record sets to exist with no change pending, or to be gone.
+
+        :param record_sets: RecordSet objects, or (zone id, record set id) tuples
+        :param deleted: wait for the record sets to be gone rather than to be active
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param on_complete: an optional function called with the key and RecordSet of each one as it finishes
+        :param backoff: the Backoff between polls of a record set
+        :return: the RecordSet, or None once deleted, by (zone id, record set id)
+        """
+        return waiter.record_sets(self, record_sets, deleted, **kwargs).run(timeout, backoff, on_complete)
+
+    @instrumented
     def list_record_sets(self, zone_id, start_from=None, max_items=None, record_name_filter=None, **kwargs):
         """
         Retrieve record_sets in a zone.
@@ -651,56 +1024,55 @@ class VinylDNSClient(object):
         :param record_name_filter: only returns record_sets whose names contain filter string
         :return: the content of the response
         """
-        args = []
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        if record_name_filter:
-            args.append(u'recordNameFilter={0}'.format(record_name_filter))
+        path = u'/zones/{0}/recordsets'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items, u'recordNameFilter': record_name_filter}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_record_sets', **kwargs)
+        return ListRecordSetsResponse.from_dict(data)
 
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets'.format(zone_id)) + u'?' + u'&'.join(args)
+    def stream_record_sets(self, zone_id, start_from=None, max_items=None, record_name_filter=None, **kwargs):
+        """
+        Retrieve record_sets in a zone, decoding them one at a time as the response arrives.
 
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
-        return ListRecordSetsResponse.from_dict(data)
+        :param zone_id: the zone to retrieve
+        :param start_from: the start key of the page
+        :param max_items: the page limit
+        :param record_name_filter: only returns record_sets whose names contain filter string
+        :return: an ArrayStream of RecordSet; nextId and the other paging fields are in its fields once exhausted
+        """
+        path = u'/zones/{0}/recordsets'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items, u'recordNameFilter': record_name_filter}
+        return self.__stream(path, params, u'stream_record_sets', u'recordSets', RecordSet.from_dict, **kwargs)
 
+    @instrumented
     def get_record_set_count(self, zone_id, **kwargs):
         """
         Get record set count for a zone.
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsetcount'.format(zone_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/{0}/recordsetcount'.format(zone_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_record_set_count', **kwargs)
         return RecordSetCount.from_dict(data)
 
+    @instrumented
     def list_record_set_change_history(self, zone_id, fqdn, record_type, start_from=None, max_items=None, **kwargs):
         """
         Retrieve record set change history for a FQDN and type.
         """
-        args = [u'zoneId={0}'.format(zone_id), u'fqdn={0}'.format(fqdn), u'recordType={0}'.format(record_type)]
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-
-        url = urljoin(self.index_url, u'/recordsetchange/history') + u'?' + u'&'.join(args)
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'zoneId': zone_id, u'fqdn': fqdn, u'recordType': record_type, u'startFrom': start_from,
+                  u'maxItems': max_items}
+        response, data = self.__make_request(u'/recordsetchange/history', u'GET', self.headers, params=params,
+                                             endpoint=u'list_record_set_change_history', **kwargs)
         return ListRecordSetChangesResponse.from_dict(data)
 
+    @instrumented
     def list_record_set_changes_failure(self, zone_id, start_from=None, max_items=None, **kwargs):
         """
         List failed record set changes for a zone.
         """
-        args = []
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-
-        url = urljoin(self.index_url, u'/metrics/health/zones/{0}/recordsetchangesfailure'.format(zone_id))
-        if args:
-            url = url + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/metrics/health/zones/{0}/recordsetchangesfailure'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_record_set_changes_failure', **kwargs)
         return RecordSetChangeFailuresResponse.from_dict(data)
 
     def request_record_set_ownership(self, record_set, requested_owner_group_id, **kwargs):
@@ -742,6 +1114,7 @@ class VinylDNSClient(object):
 
         return self.update_record_set(record_set, **kwargs)
 
+    @instrumented
     def search_record_sets(self, start_from=None, max_items=None, record_name_filter=None,
                            record_type_filter=None, record_owner_group_filter=None, name_sort=None, **kwargs):
         """
@@ -756,26 +1129,27 @@ class VinylDNSClient(object):
         :param name_sort: sort the results as per given order
         :return: the content of the response
         """
-        args = []
-        if start_from is not None:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        if record_name_filter is not None:
-            args.append(u'recordNameFilter={0}'.format(record_name_filter))
-        if record_type_filter is not None:
-            for record_type in record_type_filter:
-                args.append(u'recordTypeFilter[]={0}'.format(record_type))
-        if record_owner_group_filter is not None:
-            args.append(u'recordOwnerGroupFilter={0}'.format(record_owner_group_filter))
-        if name_sort is not None:
-            args.append(u'nameSort={0}'.format(name_sort))
-
-        url = urljoin(self.index_url, u'/recordsets') + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'startFrom': start_from, u'maxItems': max_items, u'recordNameFilter': record_name_filter,
+                  u'recordTypeFilter[]': record_type_filter, u'recordOwnerGroupFilter': record_owner_group_filter,
+                  u'nameSort': name_sort}
+        response, data = self.__make_request(u'/recordsets', u'GET', self.headers, params=params,
+                                             endpoint=u'search_record_sets', **kwargs)
         return ListRecordSetsResponse.from_dict(data)
 
+    def stream_search_record_sets(self, start_from=None, max_items=None, record_name_filter=None,
+                                  record_type_filter=None, record_owner_group_filter=None, name_sort=None, **kwargs):
+        """
+        Search RecordSets globally like search_record_sets, decoding them one at a time as the response arrives.
+
+        :return: an ArrayStream of RecordSet; nextId and the other paging fields are in its fields once exhausted
+        """
+        params = {u'startFrom': start_from, u'maxItems': max_items, u'recordNameFilter': record_name_filter,
+                  u'recordTypeFilter[]': record_type_filter, u'recordOwnerGroupFilter': record_owner_group_filter,
+                  u'nameSort': name_sort}
+        return self.__stream(u'/recordsets', params, u'stream_search_record_sets', u'recordSets',
+                             RecordSet.from_dict, **kwargs)
+
+    @instrumented
     def get_record_set_change(self, zone_id, rs_id, change_id, **kwargs):
         """
         Get an existing record_set change.
@@ -785,11 +1159,26 @@ class VinylDNSClient(object):
         :param change_id: the id of the change to be retrieved
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/{0}/recordsets/{1}/changes/{2}'.format(zone_id, rs_id, change_id))
+        path = u'/zones/{0}/recordsets/{1}/changes/{2}'.format(zone_id, rs_id, change_id)
 
-        response, data = self.__make_request(url, u'GET', self.headers, None, **kwargs)
+        response, data = self.__make_request(path, u'GET', self.headers, None,
+                                             endpoint=u'get_record_set_change', **kwargs)
         return RecordSetChange.from_dict(data) if data is not None else None
 
+    def wait_for_record_set_changes(self, record_set_changes, timeout=300, on_complete=None, backoff=None,
+                                    **kwargs):
+        """
+        Wait for record set changes, such as those returned by create_record_set, to complete or fail.
+
+        :param record_set_changes: the RecordSetChange objects to wait for
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param on_complete: an optional function called with the id and RecordSetChange of each one as it finishes
+        :param backoff: the Backoff between polls of a change
+        :return: the final RecordSetChange, by change id
+        """
+        return waiter.record_set_changes(self, record_set_changes, **kwargs).run(timeout, backoff, on_complete)
+
+    @instrumented
     def list_record_set_changes(self, zone_id, start_from=None, max_items=None, **kwargs):
         """
         Get the record_set changes for the given zone id.
@@ -799,16 +1188,27 @@ class VinylDNSClient(object):
         :param max_items: the page limit
         :return: the zone, or will 404 if not found
         """
-        args = []
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        url = urljoin(self.index_url, u'/zones/{0}/recordsetchanges'.format(zone_id)) + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/zones/{0}/recordsetchanges'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        response, data = self.__make_request(path, u'GET', self.headers, params=params,
+                                             endpoint=u'list_record_set_changes', **kwargs)
         return ListRecordSetChangesResponse.from_dict(data)
 
+    def stream_record_set_changes(self, zone_id, start_from=None, max_items=None, **kwargs):
+        """
+        Get the record_set changes for the given zone id, decoding them one at a time as the response arrives.
+
+        :param zone_id: the id of the zone to retrieve
+        :param start_from: the start key of the page
+        :param max_items: the page limit
+        :return: an ArrayStream of RecordSetChange
+        """
+        path = u'/zones/{0}/recordsetchanges'.format(zone_id)
+        params = {u'startFrom': start_from, u'maxItems': max_items}
+        return self.__stream(path, params, u'stream_record_set_changes', u'recordSetChanges',
+                             RecordSetChange.from_dict, **kwargs)
+
+    @instrumented
     def create_batch_change(self, batch_change_input, allow_manual_review=None, **kwargs):
         """
         Create a new batch change.
@@ -818,16 +1218,14 @@ class VinylDNSClient(object):
         review if there are errors
         :return: the content of the response
         """
-        arg = ''
-
-        if allow_manual_review is not None:
-            arg = u'allowManualReview={0}'.format(allow_manual_review)
-
-        url = urljoin(self.index_url, u'/zones/batchrecordchanges') + u'?' + arg
-        response, data = self.__make_request(url, u'POST', self.headers, to_json_string(batch_change_input), **kwargs)
+        params = {u'allowManualReview': allow_manual_review}
+        response, data = self.__make_request(u'/zones/batchrecordchanges', u'POST', self.headers,
+                                             to_json_bytes(batch_change_input), params=params,
+                                             endpoint=u'create_batch_change', **kwargs)
 
         return BatchChange.from_dict(data)
 
+    @instrumented
     def get_batch_change(self, batch_change_id, **kwargs):
         """
         Get an existing batch change.
@@ -835,11 +1233,39 @@ class VinylDNSClient(object):
         :param batch_change_id: the unique identifier of the batchchange
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/batchrecordchanges/{0}'.format(batch_change_id))
-        response, data = self.__make_request(url, u'GET', self.headers, None, **kwargs)
+        path = u'/zones/batchrecordchanges/{0}'.format(batch_change_id)
+        response, data = self.__make_request(path, u'GET', self.headers, None, endpoint=u'get_batch_change', **kwargs)
 
         return BatchChange.from_dict(data) if data is not None else None
 
+    def wait_for_batch_changes(self, batch_change_ids, timeout=300, on_complete=None, stop_on_review=False,
+                               backoff=None, **kwargs):
+        """
+        Wait for batch changes to finish processing, polling each on its own backoff from a single loop.
+
+        :param batch_change_ids: the ids of the batch changes to wait for
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param on_complete: an optional function called with the id and BatchChange of each one as it finishes
+        :param stop_on_review: also stop waiting for batch changes that are pending review or scheduled
+        :param backoff: the Backoff between polls of a batch change
+        :return: the final BatchChange of each, by id
+        """
+        wait = waiter.batch_changes(self, batch_change_ids, stop_on_review, **kwargs)
+        return wait.run(timeout, backoff, on_complete)
+
+    def stream_batch_change_changes(self, batch_change_id, **kwargs):
+        """
+        Get the single changes of an existing batch change, decoding them one at a time as the response arrives.
+
+        :param batch_change_id: the unique identifier of the batchchange
+        :return: an ArrayStream of AddRecordChange and DeleteRecordSetChange, whose fields hold the rest of the
+        batch change once exhausted; None if the batch change does not exist
+        """
+        path = u'/zones/batchrecordchanges/{0}'.format(batch_change_id)
+        return self.__stream(path, None, u'stream_batch_change_changes', u'changes',
+                             lambda d: BatchChange.change_type_converters[d['changeType']](d), **kwargs)
+
+    @instrumented
     def list_batch_change_summaries(self, start_from=None, max_items=None,
                                     ignore_access=None, approval_status=None, **kwargs):
         """
@@ -847,55 +1273,51 @@ class VinylDNSClient(object):
 
         :return: the content of the response
         """
-        args = []
-        if start_from:
-            args.append(u'startFrom={0}'.format(start_from))
-        if max_items is not None:
-            args.append(u'maxItems={0}'.format(max_items))
-        if ignore_access:
-            args.append(u'ignoreAccess={0}'.format(ignore_access))
-        if approval_status:
-            args.append(u'approvalStatus={0}'.format(approval_status))
-
-        url = urljoin(self.index_url, u'/zones/batchrecordchanges') + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        params = {u'startFrom': start_from, u'maxItems': max_items, u'ignoreAccess': ignore_access,
+                  u'approvalStatus': approval_status}
+        response, data = self.__make_request(u'/zones/batchrecordchanges', u'GET', self.headers, params=params,
+                                             endpoint=u'list_batch_change_summaries', **kwargs)
         return ListBatchChangeSummaries.from_dict(data)
 
+    @instrumented
     def approve_batch_change(self, batch_change_id, approval=None, **kwargs):
         """
         Approve a batch change
 
         :return: the content of the response
         """
-        url = urljoin(self.index_url, '/zones/batchrecordchanges/{0}/approve'.format(batch_change_id),
-                      to_json_string(approval))
-        response, data = self.__make_request(url, u'POST', self.headers, to_review_json(approval), **kwargs)
+        path = u'/zones/batchrecordchanges/{0}/approve'.format(batch_change_id)
+        response, data = self.__make_request(path, u'POST', self.headers, to_review_json(approval),
+                                             endpoint=u'approve_batch_change', **kwargs)
 
         return BatchChange.from_dict(data)
 
+    @instrumented
     def cancel_batch_change(self, batch_change_id, **kwargs):
         """
         Cancel a batch change
 
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/batchrecordchanges/{0}/cancel'.format(batch_change_id))
-        response, data = self.__make_request(url, u'POST', self.headers, **kwargs)
+        path = u'/zones/batchrecordchanges/{0}/cancel'.format(batch_change_id)
+        response, data = self.__make_request(path, u'POST', self.headers, endpoint=u'cancel_batch_change', **kwargs)
 
         return BatchChange.from_dict(data) if data is not None else None
 
+    @instrumented
     def reject_batch_change(self, batch_change_id, rejection=None, **kwargs):
         """
         Reject a batch change
 
         :return: the content of the response
         """
-        url = urljoin(self.index_url, u'/zones/batchrecordchanges/{0}/reject'.format(batch_change_id))
-        response, data = self.__make_request(url, u'POST', self.headers,  to_review_json(rejection), **kwargs)
+        path = u'/zones/batchrecordchanges/{0}/reject'.format(batch_change_id)
+        response, data = self.__make_request(path, u'POST', self.headers,  to_review_json(rejection),
+                                             endpoint=u'reject_batch_change', **kwargs)
 
         return BatchChange.from_dict(data)
 
+    @instrumented
     def add_zone_acl_rule(self, zone_id, acl_rule, **kwargs):
         """
         Put an acl rule on the zone.
@@ -904,12 +1326,13 @@ class VinylDNSClient(object):
         :param acl_rule: The acl rule contents
         :return: the content of the response
         """
-        url = urljoin(self.index_url, '/zones/{0}/acl/rules'.format(zone_id))
-        response, data = self.__make_request(url, 'PUT', self.headers,
-                                             to_json_string(acl_rule), **kwargs)
+        path = '/zones/{0}/acl/rules'.format(zone_id)
+        response, data = self.__make_request(path, 'PUT', self.headers,
+                                             to_json_bytes(acl_rule), endpoint=u'add_zone_acl_rule', **kwargs)
 
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def delete_zone_acl_rule(self, zone_id, acl_rule, **kwargs):
         """
         Delete an acl rule from the zone.
@@ -918,88 +1341,93 @@ class VinylDNSClient(object):
         :param acl_rule: The acl rule to remove
         :return: the content of the response
         """
-        url = urljoin(self.index_url, '/zones/{0}/acl/rules'.format(zone_id))
-        response, data = self.__make_request(url, 'DELETE', self.headers,
-                                             to_json_string(acl_rule), **kwargs)
+        path = '/zones/{0}/acl/rules'.format(zone_id)
+        response, data = self.__make_request(path, 'DELETE', self.headers,
+                                             to_json_bytes(acl_rule), endpoint=u'delete_zone_acl_rule', **kwargs)
 
         return ZoneChange.from_dict(data)
 
+    @instrumented
     def ping(self, **kwargs):
         """
         Simple health check.
         """
-        url = urljoin(self.index_url, u'/ping')
-        response, data = self.__make_request(url, u'GET', self.headers, raw_response=True, **kwargs)
+        path = u'/ping'
+        response, data = self.__make_request(path, u'GET', self.headers, raw_response=True, endpoint=u'ping', **kwargs)
         return data
 
+    @instrumented
     def health(self, **kwargs):
         """
         Comprehensive health check.
         """
-        url = urljoin(self.index_url, u'/health')
-        response, data = self.__make_request(url, u'GET', self.headers, raw_response=True, **kwargs)
+        path = u'/health'
+        response, data = self.__make_request(path, u'GET', self.headers, raw_response=True,
+                                             endpoint=u'health', **kwargs)
         return data
 
+    @instrumented
     def color(self, **kwargs):
         """
         Blue/green deployment status.
         """
-        url = urljoin(self.index_url, u'/color')
-        response, data = self.__make_request(url, u'GET', self.headers, raw_response=True, **kwargs)
+        path = u'/color'
+        response, data = self.__make_request(path, u'GET', self.headers, raw_response=True, endpoint=u'color',
+                                             **kwargs)
         return data
 
+    @instrumented
     def metrics_prometheus(self, names=None, **kwargs):
         """
         Prometheus metrics export.
         """
-        args = []
-        if names:
-            for name in names:
-                args.append(u'name={0}'.format(name))
-
-        url = urljoin(self.index_url, u'/metrics/prometheus')
-        if args:
-            url = url + u'?' + u'&'.join(args)
-
-        response, data = self.__make_request(url, u'GET', self.headers, raw_response=True, **kwargs)
+        params = {u'name': names}
+        response, data = self.__make_request(u'/metrics/prometheus', u'GET', self.headers, params=params,
+                                             raw_response=True, endpoint=u'metrics_prometheus', **kwargs)
         return data
 
+    @instrumented
     def get_status(self, **kwargs):
         """
         Get system processing status.
         """
-        url = urljoin(self.index_url, u'/status')
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/status'
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_status', **kwargs)
         return SystemStatus.from_dict(data)
 
+    @instrumented
     def update_status(self, processing_disabled, **kwargs):
         """
         Enable/disable processing (admin).
         """
-        url = urljoin(self.index_url, u'/status?processingDisabled={0}'.format(str(processing_disabled).lower()))
-        response, data = self.__make_request(url, u'POST', self.headers, **kwargs)
+        params = {u'processingDisabled': processing_disabled}
+        response, data = self.__make_request(u'/status', u'POST', self.headers, params=params,
+                                             endpoint=u'update_status', **kwargs)
         return SystemStatus.from_dict(data)
 
+    @instrumented
     def get_user(self, user_id, **kwargs):
         """
         Get user by ID.
         """
-        url = urljoin(self.index_url, u'/users/{0}'.format(user_id))
-        response, data = self.__make_request(url, u'GET', self.headers, **kwargs)
+        path = u'/users/{0}'.format(user_id)
+        response, data = self.__make_request(path, u'GET', self.headers, endpoint=u'get_user', **kwargs)
         return UserInfo.from_dict(data) if data is not None else None
 
+    @instrumented
     def lock_user(self, user_id, **kwargs):
         """
         Lock a user (admin).
         """
-        url = urljoin(self.index_url, u'/users/{0}/lock'.format(user_id))
-        response, data = self.__make_request(url, u'PUT', self.headers, **kwargs)
+        path = u'/users/{0}/lock'.format(user_id)
+        response, data = self.__make_request(path, u'PUT', self.headers, endpoint=u'lock_user', **kwargs)
         return UserInfo.from_dict(data)
 
+    @instrumented
     def unlock_user(self, user_id, **kwargs):
         """
         Unlock a user (admin).
         """
-        url = urljoin(self.index_url, u'/users/{0}/unlock'.format(user_id))
-        response, data = self.__make_request(url, u'PUT', self.headers, **kwargs)
+        path = u'/users/{0}/unlock'.format(user_id)
+        response, data = self.__make_request(path, u'PUT', self.headers, endpoint=u'unlock_user', **kwargs)
         return UserInfo.from_dict(data)
@@ -0,0 +1,83 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""End-to-end deadlines that bound every request made within a block of code."""
+import contextlib
+import contextvars
+import time
+
+__all__ = [u'Deadline', u'deadline', u'current_deadline', u'clamp_timeout']
+
+_current_deadline = contextvars.ContextVar(u'vinyldns_deadline', default=None)
+
+
+class Deadline(object):
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """
+        :return: the number of seconds left before the deadline, never less than zero
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """
+    Bound every client request made inside the block to finish within the given number of seconds.
+
+    Each request's timeout is clamped to the time remaining, and once the deadline passes any further
+    request raises DeadlineExceededError, so a paginated or fan-out operation stops rather than continuing
+    with the rest of its work. Nested deadlines can shorten, but never extend, an enclosing one.
+    Threads started inside the block only see the deadline if they run in a copy of the current context.
+
+    :param seconds: the number of seconds the block is allowed to take
+    :return: the Deadline in effect
+    """
+    new_deadline = Deadline(seconds)
+    enclosing = _current_deadline.get()
+    if enclosing is not None and enclosing.expires_at < new_deadline.expires_at:
+        new_deadline = enclosing
+
+    token = _current_deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline():
+    """
+    :return: the Deadline in effect for the current context, or None
+    """
+    return _current_deadline.get()
+
+
+def clamp_timeout(timeout, remaining):
+    """
+    Limit a requests-style timeout so that no part of it exceeds the time remaining.
+
+    :param timeout: None, a number of seconds, or a (connect, read) tuple
+    :param remaining: the number of seconds remaining
+    :return: a timeout of the same shape that does not exceed remaining
+    """
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return min(timeout, remaining)
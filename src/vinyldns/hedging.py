@@ -0,0 +1,228 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hedged requests that cut tail latency on idempotent reads."""
+import collections
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from vinyldns.hooks import merge_attempt, new_attempt, use_attempt
+from vinyldns.retry import RetryBudget
+
+__all__ = [u'HedgingPolicy', u'LatencyTracker', u'HEDGED_ENDPOINTS']
+
+# Read-only client methods that are safe to send twice
+HEDGED_ENDPOINTS = frozenset([
+    u'get_zone',
+    u'get_zone_by_name',
+    u'get_zone_details',
+    u'list_zones',
+    u'get_record_set',
+    u'list_record_sets',
+    u'search_record_sets',
+    u'get_record_set_change',
+    u'get_group',
+    u'get_batch_change',
+])
+
+
+class LatencyTracker(object):
+    """
+    Keeps the most recent latencies observed for an endpoint.
+    """
+
+    def __init__(self, window_size=200):
+        self._samples = collections.deque(maxlen=window_size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, p):
+        """
+        :param p: the percentile to compute, between 0 and 100
+        :return: the latency at that percentile, or None if nothing has been recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * p / 100.0))
+        return samples[index]
+
+
+class HedgingPolicy(object):
+    """
+    Sends a second, identical request when the first has not answered within the observed latency
+    percentile for its endpoint, and returns whichever response arrives first.
+
+    Hedges are funded from a RetryBudget, so they add at most ``budget.ratio`` extra requests. The slower
+    request cannot be interrupted once it is on the wire; it is cancelled if it has not started and its
+    response is discarded otherwise.
+
+    First requests and hedges run on two bounded thread pools that are reused across requests, so a first
+    request is never queued behind hedges. When the budget could not fund a hedge, or ``max_requests``
+    first requests are already in flight, the request is simply made on the caller's thread.
+    """
+
+    def __init__(self, percentile=95, min_delay=0.005, max_delay=1.0, min_samples=20, window_size=200,
+                 endpoints=HEDGED_ENDPOINTS, budget=None, max_workers=16, max_requests=32):
+        """
+        :param percentile: the latency percentile after which a hedge is sent
+        :param min_delay: the shortest time to wait before hedging, in seconds
+        :param max_delay: the longest time to wait before hedging, also used until enough samples are seen
+        :param min_samples: the number of samples needed before the percentile is trusted
+        :param window_size: the number of recent latencies kept per endpoint
+        :param endpoints: the client methods that may be hedged
+        :param budget: a RetryBudget limiting hedges to a fraction of requests; defaults to 5%
+        :param max_workers: the maximum number of hedges in flight on the hedging thread pool
+        :param max_requests: the maximum number of first requests in flight that may still be hedged
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window_size = window_size
+        self.endpoints = frozenset(endpoints)
+        self.budget = budget if budget is not None else RetryBudget(ratio=0.05, min_retries_per_second=0.5)
+        self.max_workers = max_workers
+        self.max_requests = max_requests
+        self._trackers = collections.defaultdict(lambda: LatencyTracker(self.window_size))
+        self._executors = {}
+        self._slots = threading.BoundedSemaphore(max_requests)
+        self._lock = threading.Lock()
+
+    def applies_to(self, endpoint, method):
+        return method == u'GET' and endpoint in self.endpoints
+
+    def tracker(self, endpoint):
+        with self._lock:
+            return self._trackers[endpoint]
+
+    def delay(self, endpoint):
+        """
+        :return: the number of seconds to wait for a response before hedging
+        """
+        tracker = self.tracker(endpoint)
+        if len(tracker) < self.min_samples:
+            return self.max_delay
+        return min(self.max_delay, max(self.min_delay, tracker.percentile(self.percentile)))
+
+    def run(self, endpoint, send, discard=None):
+        """
+        Call send, hedging it with a second call if it is slow.
+
+        :param endpoint: the client method being called
+        :param send: a function of no arguments that performs the request
+        :param discard: an optional function called with the losing result
+        :return: the first successful result; if both fail, the first failure is raised
+        """
+        self.budget.deposit()
+        tracker = self.tracker(endpoint)
+        if not self.budget.can_retry() or not self._slots.acquire(blocking=False):
+            return self.__timed(send, tracker)()
+
+        primary = self.__submit(u'primary', self.max_requests, send, tracker)
+        primary.add_done_callback(lambda f: self._slots.release())
+        done, _ = wait([primary], timeout=self.delay(endpoint))
+        if done or not self.budget.withdraw():
+            return self.__use(primary)
+
+        hedge = self.__submit(u'hedge', self.max_workers, send, tracker)
+        pending = {primary, hedge}
+        first_failure = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        self.__abandon(loser, discard)
+                    return self.__use(future)
+                first_failure = first_failure or future
+        return self.__use(first_failure)
+
+    def close(self, wait=False):
+        """
+        Shut down the hedging thread pools.
+
+        :param wait: wait for requests still in flight to finish
+        """
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def __timed(send, tracker):
+        def timed_send():
+            start = time.monotonic()
+            try:
+                return send()
+            finally:
+                tracker.record(time.monotonic() - start)
+        return timed_send
+
+    @classmethod
+    def __attempt(cls, send, tracker):
+        """
+        :return: a function that makes an attempt, reporting it on an event of its own, and the event
+        """
+        attempt, timed_send = new_attempt(), cls.__timed(send, tracker)
+
+        def run_attempt():
+            use_attempt(attempt)
+            return timed_send()
+
+        # each attempt runs in its own copy of the caller's context so deadlines carry over
+        return functools.partial(contextvars.copy_context().run, run_attempt), attempt
+
+    def __submit(self, kind, max_workers, send, tracker):
+        """
+        Run an attempt on the thread pool for its kind, first requests and hedges each having their own.
+        """
+        with self._lock:
+            executor = self._executors.get(kind)
+            if executor is None:
+                executor = self._executors[kind] = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix=u'vinyldns-{0}'.format(kind))
+
+        run_attempt, attempt = self.__attempt(send, tracker)
+        future = executor.submit(run_attempt)
+        future.attempt = attempt
+        return future
+
+    @staticmethod
+    def __use(future):
+        """
+        :return: the result of the attempt that won, after reporting it on the request's event
+        """
+        merge_attempt(future.attempt)
+        return future.result()
+
+    @staticmethod
+    def __abandon(future, discard):
+        if future.cancel() or discard is None:
+            return
+
+        def discard_result(f):
+            if not f.cancelled() and f.exception() is None:
+                discard(f.result())
+
+        future.add_done_callback(discard_result)
@@ -0,0 +1,231 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Event hooks that report every request the client makes, with a breakdown of where its time went."""
+import contextvars
+import functools
+import logging
+import time
+
+__all__ = [u'Hooks', u'RequestEvent', u'HOOK_EVENTS', u'TIMINGS', u'current_request', u'record_retry',
+           u'instrumented']
+
+logger = logging.getLogger(__name__)
+
+HOOK_EVENTS = (u'before_request', u'after_response', u'on_retry', u'on_error')
+
+# the parts a request's time is broken down into, in the order they happen
+TIMINGS = (u'sign', u'connect', u'first_byte', u'transfer', u'decode', u'hydrate')
+
+_current_request = contextvars.ContextVar(u'vinyldns_request', default=None)
+_current_call = contextvars.ContextVar(u'vinyldns_call', default=None)
+
+
+class RequestEvent(object):
+    """
+    One request made by a client method, including any retries of it.
+
+    ``timings`` holds the seconds spent in each part of the request that was measured, keyed by the
+    names in TIMINGS, and ``total`` the seconds from the start of the request until its response was
+    decoded:
+
+    * sign: building and signing the request
+    * connect: waiting for a connection from the pool and establishing new connections
+    * first_byte: from sending the request to receiving the response headers, less connect
+    * transfer: reading the response body
+    * decode: parsing the response JSON
+    * hydrate: converting the parsed JSON to model objects
+
+    The requests and urllib3 transports measure connect, first_byte and transfer and count the new
+    connections opened in ``connections_opened``; the httpx transport measures first_byte and transfer.
+    When several requests are sent one after another for one call, as with retries, their times are added
+    together; of concurrent attempts, as with hedging, only the one whose result is used is reported.
+    """
+
+    __slots__ = (u'endpoint', u'method', u'path', u'url', u'status', u'bytes_out', u'bytes_in', u'retries', u'error',
+                 u'timings', u'connections_opened', u'total', u'started', u'returned')
+
+    def __init__(self, endpoint, method, path):
+        self.endpoint = endpoint
+        self.method = method
+        self.path = path
+        self.url = None
+        self.status = None
+        self.bytes_out = 0
+        self.bytes_in = None
+        self.retries = 0
+        self.error = None
+        self.timings = {}
+        self.connections_opened = 0
+        self.total = None
+        self.started = time.perf_counter()
+        self.returned = None
+
+    def add_time(self, name, seconds):
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def finish(self):
+        self.returned = time.perf_counter()
+        self.total = self.returned - self.started
+
+    def __repr__(self):
+        return u'RequestEvent({0} {1} {2}, status={3}, retries={4}, total={5})'.format(
+            self.endpoint, self.method, self.path, self.status, self.retries, self.total)
+
+
+class Hooks(object):
+    """
+    The functions called as a client's requests are made, by event:
+
+    * before_request: before the request is signed and sent
+    * after_response: once the response has been decoded and converted, with every timing
+    * on_retry: before each retry, with the retry count and status so far
+    * on_error: when the request raises, with the exception as ``error``
+
+    Each function is called with the RequestEvent. Exceptions raised by hooks are logged, never raised to
+    the caller. With no hooks registered, requests are not instrumented at all.
+    """
+
+    def __init__(self):
+        self._hooks = dict((name, []) for name in HOOK_EVENTS)
+
+    def register(self, name, hook):
+        """
+        :param name: one of HOOK_EVENTS
+        :param hook: a function taking a RequestEvent
+        :return: the hook
+        """
+        if name not in self._hooks:
+            raise ValueError(u'Unknown hook {0}, choose from {1}'.format(name, u', '.join(HOOK_EVENTS)))
+        self._hooks[name].append(hook)
+        return hook
+
+    def unregister(self, name, hook):
+        self._hooks[name].remove(hook)
+
+    def __bool__(self):
+        return any(self._hooks.values())
+
+    def fire(self, name, event):
+        for hook in list(self._hooks[name]):
+            try:
+                hook(event)
+            except Exception:
+                logger.exception(u'%s hook %r failed', name, hook)
+
+
+def current_request():
+    """
+    :return: the RequestEvent of the request being made in the current context, or None when no hooks are
+        registered
+    """
+    current = _current_request.get()
+    return None if current is None else current[1]
+
+
+def record_retry():
+    """
+    Count a retry of the request being made in the current context and call its on_retry hooks.
+    """
+    current = _current_request.get()
+    if current is not None:
+        hooks, event = current
+        event.retries += 1
+        hooks.fire(u'on_retry', event)
+
+
+def new_attempt():
+    """
+    Make an event for one of several concurrent attempts at the request being made in the current context,
+    such as a hedge. Each attempt reports on its own event, set with use_attempt in the context it runs in,
+    and only the one whose result is used is added to the request's event, with merge_attempt.
+
+    :return: a RequestEvent, or None when no hooks are registered
+    """
+    current = _current_request.get()
+    if current is None:
+        return None
+    event = current[1]
+    return RequestEvent(event.endpoint, event.method, event.path)
+
+
+def use_attempt(attempt):
+    """
+    Report the request made in the current context on the event of an attempt from new_attempt.
+    """
+    current = _current_request.get()
+    if current is not None and attempt is not None:
+        _current_request.set((current[0], attempt))
+
+
+def merge_attempt(attempt):
+    """
+    Add the attempt whose result is used to the event of the request being made in the current context.
+    """
+    event = current_request()
+    if event is None or attempt is None:
+        return
+    event.url = attempt.url
+    event.status = attempt.status
+    event.bytes_out += attempt.bytes_out
+    if attempt.bytes_in is not None:
+        event.bytes_in = (event.bytes_in or 0) + attempt.bytes_in
+    event.retries += attempt.retries
+    event.connections_opened += attempt.connections_opened
+    for name, seconds in attempt.timings.items():
+        event.add_time(name, seconds)
+
+
+def start_request(hooks, event):
+    token = _current_request.set((hooks, event))
+    hooks.fire(u'before_request', event)
+    return token
+
+
+def end_request(hooks, event, token, error=None):
+    """
+    Finish a request; its after_response hooks wait for the model conversion of the calling method, if any.
+    """
+    _current_request.reset(token)
+    event.finish()
+    if error is not None:
+        event.error = error
+        hooks.fire(u'on_error', event)
+        return
+    pending = _current_call.get()
+    if pending is None:
+        hooks.fire(u'after_response', event)
+    else:
+        pending.append(event)
+
+
+def instrumented(method):
+    """
+    Decorate a client method so that the time it spends converting its response to models is reported as
+    the hydrate timing of its last request.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.hooks:
+            return method(self, *args, **kwargs)
+        pending = []
+        token = _current_call.set(pending)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _current_call.reset(token)
+            if pending:
+                pending[-1].add_time(u'hydrate', time.perf_counter() - pending[-1].returned)
+            for event in pending:
+                self.hooks.fire(u'after_response', event)
+    return wrapper
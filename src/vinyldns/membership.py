@@ -13,7 +13,7 @@
 # limitations under the License.
 """TODO: Add module docstring."""
 
-from vinyldns.serdes import map_option, parse_datetime
+from vinyldns.serdes import ValueObject, lazy_attribute, lazy_list, map_option, parse_datetime
 
 
 class UserLockStatus:
@@ -21,7 +21,7 @@ class UserLockStatus:
     Locked = "Locked"
 
 
-class User(object):
+class User(ValueObject):
     def __init__(self, id, user_name=None, first_name=None, last_name=None, email=None, created=None,
                  lock_status=UserLockStatus.Unlocked):
         self.id = id
@@ -81,6 +81,10 @@ class UserInfo(object):
 
 
 class Group(object):
+    # members and admins are converted on first access, groups can be large
+    members = lazy_attribute()
+    admins = lazy_attribute()
+
     def __init__(self, name, email, description=None, created=None, members=[], admins=[], id=None):
         self.name = name
         self.email = email
@@ -97,8 +101,8 @@ class Group(object):
             email=d['email'],
             description=d.get('description'),
             created=map_option(d.get('created'), parse_datetime),
-            members=[User.from_dict(ud) for ud in d.get('members', [])],
-            admins=[User.from_dict(ud) for ud in d.get('admins', [])],
+            members=lazy_list(d.get('members'), User.from_dict),
+            admins=lazy_list(d.get('admins'), User.from_dict),
             id=d.get('id')
         )
 
@@ -0,0 +1,254 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process metrics of the requests a client makes, as seen from the client."""
+import threading
+from collections import Counter
+
+from vinyldns.hooks import TIMINGS
+
+__all__ = [u'LatencyHistogram', u'ClientMetrics', u'PROMETHEUS_BUCKETS']
+
+# the upper bounds, in seconds, of the histogram buckets rendered for Prometheus
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class LatencyHistogram(object):
+    """
+    A histogram of durations with log-linear buckets, in the manner of HdrHistogram: every power of two
+    of microseconds is split into the same number of buckets, so any value is kept to within a fixed
+    relative error (about 1.6% with the default 7 bits) whatever its magnitude, in a few hundred buckets.
+    """
+
+    __slots__ = (u'bits', u'counts', u'count', u'sum', u'min', u'max')
+
+    def __init__(self, bits=7):
+        """
+        :param bits: the precision of the buckets; the relative error is 2 ** (1 - bits)
+        """
+        self.bits = bits
+        self.counts = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds):
+        index = self.__index(max(0, int(seconds * 1e6)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, q):
+        """
+        :param q: the percentile, from 0 to 100
+        :return: the duration in seconds below which q percent of the recorded durations fall, or None if
+            nothing has been recorded
+        """
+        if not self.count:
+            return None
+        rank, seen = q / 100.0 * self.count, 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, high = self.__bounds(index)
+                return min(self.max, max(self.min, (low + high) / 2e6))
+        return self.max
+
+    def count_at_most(self, seconds):
+        """
+        :return: the number of recorded durations no longer than seconds, to the precision of the buckets
+        """
+        limit = seconds * 1e6
+        return sum(count for index, count in self.counts.items() if sum(self.__bounds(index)) / 2.0 <= limit)
+
+    def __index(self, micros):
+        half = 1 << (self.bits - 1)
+        if micros < (1 << self.bits):
+            return micros
+        shift = micros.bit_length() - self.bits
+        return (shift + 1) * half + (micros >> shift) - half
+
+    def __bounds(self, index):
+        half = 1 << (self.bits - 1)
+        if index < (1 << self.bits):
+            return index, index + 1
+        shift = index // half - 1
+        mantissa = index % half + half
+        return mantissa << shift, (mantissa + 1) << shift
+
+
+class _EndpointStats(object):
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.timings = dict((name, LatencyHistogram()) for name in TIMINGS)
+        self.statuses = Counter()
+        self.requests = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.connections_opened = 0
+
+
+def _status_class(event):
+    if event.status is None:
+        return u'error'
+    return u'{0}xx'.format(event.status // 100)
+
+
+def _label(value):
+    return value.replace(u'\\', u'\\\\').replace(u'"', u'\\"').replace(u'\n', u'\\n')
+
+
+class ClientMetrics(object):
+    """
+    Keeps, for each client method, a latency histogram of its requests and of each part of their time, the
+    number of responses by status class, retries, the requests in flight and the connections opened.
+    Requests that failed without a response are counted with the status class ``error``.
+
+    Every VinylDNSClient keeps one, unless created with metrics=False, read with client.stats(). It can also
+    be attached to other clients to combine their metrics.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def attach(self, client):
+        """
+        Start recording the requests of a client.
+        """
+        client.add_hook(u'before_request', self.before_request)
+        client.add_hook(u'after_response', self.finish_request)
+        client.add_hook(u'on_error', self.finish_request)
+
+    def detach(self, client):
+        client.remove_hook(u'before_request', self.before_request)
+        client.remove_hook(u'after_response', self.finish_request)
+        client.remove_hook(u'on_error', self.finish_request)
+
+    def __endpoint(self, event):
+        name = event.endpoint or event.path
+        stats = self._endpoints.get(name)
+        if stats is None:
+            stats = self._endpoints[name] = _EndpointStats()
+        return stats
+
+    def before_request(self, event):
+        with self._lock:
+            self.__endpoint(event).in_flight += 1
+
+    def finish_request(self, event):
+        with self._lock:
+            stats = self.__endpoint(event)
+            stats.in_flight -= 1
+            stats.requests += 1
+            stats.retries += event.retries
+            stats.connections_opened += event.connections_opened
+            stats.statuses[_status_class(event)] += 1
+            stats.latency.record(event.total + event.timings.get(u'hydrate', 0.0))
+            for name, seconds in event.timings.items():
+                stats.timings[name].record(seconds)
+
+    def reset(self):
+        """
+        Clear every metric but the requests in flight.
+        """
+        with self._lock:
+            for name, stats in list(self._endpoints.items()):
+                self._endpoints[name] = _EndpointStats()
+                self._endpoints[name].in_flight = stats.in_flight
+
+    def stats(self):
+        """
+        :return: a dict by client method name of its requests, in_flight, retries, statuses by class,
+            connection_reuse (the fraction of requests that opened no new connection, when measured), and
+            latency and timings summaries with count, mean, p50, p90, p99 and max in seconds
+        """
+        def summary(histogram):
+            return {u'count': histogram.count, u'mean': histogram.mean(), u'p50': histogram.percentile(50),
+                    u'p90': histogram.percentile(90), u'p99': histogram.percentile(99), u'max': histogram.max}
+
+        with self._lock:
+            result = {}
+            for name, stats in sorted(self._endpoints.items()):
+                reuse = None
+                if stats.requests and stats.timings[u'connect'].count:
+                    reuse = max(0.0, 1.0 - float(stats.connections_opened) / stats.requests)
+                result[name] = {
+                    u'requests': stats.requests,
+                    u'in_flight': stats.in_flight,
+                    u'retries': stats.retries,
+                    u'statuses': dict(stats.statuses),
+                    u'connection_reuse': reuse,
+                    u'latency': summary(stats.latency),
+                    u'timings': dict((t, summary(h)) for t, h in stats.timings.items() if h.count),
+                }
+            return result
+
+    def render_prometheus(self, prefix=u'vinyldns_client', buckets=PROMETHEUS_BUCKETS):
+        """
+        Render the metrics in the Prometheus text exposition format, e.g. to serve from an application's
+        own /metrics endpoint.
+
+        :param prefix: the prefix of every metric name
+        :param buckets: the upper bounds, in seconds, of the request duration histogram buckets
+        :return: the metrics as a string
+        """
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(u'# HELP {0}_{1} {2}'.format(prefix, name, help_text))
+            lines.append(u'# TYPE {0}_{1} {2}'.format(prefix, name, kind))
+            for suffix, labels, value in samples:
+                label_text = u','.join(u'{0}="{1}"'.format(k, _label(v)) for k, v in labels)
+                lines.append(u'{0}_{1}{2}{{{3}}} {4}'.format(prefix, name, suffix, label_text, _number(value))
+                             if label_text else u'{0}_{1}{2} {3}'.format(prefix, name, suffix, _number(value)))
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            family(u'requests_total', u'counter', u'Requests completed, by client method and status class.',
+                   [(u'', ((u'endpoint', e), (u'status', status)), count)
+                    for e, stats in endpoints for status, count in sorted(stats.statuses.items())])
+            family(u'retries_total', u'counter', u'Retries of requests, by client method.',
+                   [(u'', ((u'endpoint', e),), stats.retries) for e, stats in endpoints])
+            family(u'in_flight', u'gauge', u'Requests in flight, by client method.',
+                   [(u'', ((u'endpoint', e),), stats.in_flight) for e, stats in endpoints])
+            family(u'connections_opened_total', u'counter', u'New connections opened, by client method.',
+                   [(u'', ((u'endpoint', e),), stats.connections_opened) for e, stats in endpoints])
+
+            samples = []
+            for e, stats in endpoints:
+                for bound in buckets:
+                    samples.append((u'_bucket', ((u'endpoint', e), (u'le', _number(bound))),
+                                    stats.latency.count_at_most(bound)))
+                samples.append((u'_bucket', ((u'endpoint', e), (u'le', u'+Inf')), stats.latency.count))
+                samples.append((u'_sum', ((u'endpoint', e),), stats.latency.sum))
+                samples.append((u'_count', ((u'endpoint', e),), stats.latency.count))
+            family(u'request_duration_seconds', u'histogram', u'Request duration, by client method.', samples)
+
+            family(u'request_phase_seconds_total', u'counter',
+                   u'Time spent in each part of requests, by client method and phase.',
+                   [(u'', ((u'endpoint', e), (u'phase', t)), stats.timings[t].sum)
+                    for e, stats in endpoints for t in TIMINGS if stats.timings[t].count])
+        return u'\n'.join(lines) + u'\n'
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
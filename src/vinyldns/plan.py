@@ -0,0 +1,167 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Diffing a desired set of records against a zone and applying the difference as batch changes."""
+from vinyldns.batch_change import AddRecord, BatchChangeRequest, DeleteRecordSet
+from vinyldns.bulk import MAX_BATCH_CHANGES, chunk_changes
+from vinyldns.record import RecordType
+from vinyldns.tracing import operation, page
+
+__all__ = [u'Plan', u'plan', u'apply']
+
+
+class Plan(object):
+    """
+    The changes that bring a zone to its desired state, grouped into batch change requests.
+    """
+
+    def __init__(self, zone, changes, requests, unchanged):
+        """
+        :param zone: the zone that was diffed
+        :param changes: every AddRecord and DeleteRecordSet needed, in the order they are submitted
+        :param requests: the BatchChangeRequest to submit; the changes of a record set are never split between them
+        :param unchanged: the number of record sets that already match
+        """
+        self.zone = zone
+        self.changes = changes
+        self.requests = requests
+        self.unchanged = unchanged
+
+    def __len__(self):
+        return len(self.changes)
+
+    def __repr__(self):
+        return u'Plan({0!r}, changes={1}, requests={2}, unchanged={3})'.format(
+            self.zone.name, len(self.changes), len(self.requests), self.unchanged)
+
+
+def fqdn(name, zone_name):
+    """
+    Resolve a record set name relative to a zone into an absolute name.
+
+    :param name: a relative name, an absolute name ending in a dot, or @ for the zone apex
+    :param zone_name: the name of the zone
+    :return: the absolute name, lower case and ending in a dot
+    """
+    zone_name = zone_name.lower().rstrip(u'.') + u'.'
+    name = name.lower()
+    if name in (u'@', u'', zone_name, zone_name[:-1]):
+        return zone_name
+    if name.endswith(u'.'):
+        return name
+    return u'{0}.{1}'.format(name, zone_name)
+
+
+def current_record_sets(client, zone, **kwargs):
+    """
+    Load every record set in a zone, paging through list_record_sets.
+    """
+    next_id, number = None, 0
+    while True:
+        number += 1
+        with page(number):
+            response = client.list_record_sets(zone.id, start_from=next_id, **kwargs)
+        for record_set in response.record_sets:
+            yield record_set
+        next_id = response.next_id
+        if not next_id:
+            return
+
+
+def _diff(name, record_type, current, desired):
+    """
+    The changes that turn the current record set into the desired one; either may be None.
+    """
+    if desired is None:
+        return [DeleteRecordSet(name, record_type)]
+    if current is None or current.ttl != desired.ttl:
+        # a new ttl can only be set by replacing the whole record set
+        changes = [] if current is None else [DeleteRecordSet(name, record_type)]
+        return changes + [AddRecord(name, record_type, desired.ttl, r) for r in _unique(desired.records)]
+
+    current_records, desired_records = frozenset(current.records), frozenset(desired.records)
+    return [DeleteRecordSet(name, record_type, r) for r in _unique(current.records) if r not in desired_records] + \
+        [AddRecord(name, record_type, desired.ttl, r) for r in _unique(desired.records) if r not in current_records]
+
+
+def _unique(records):
+    seen = set()
+    return [r for r in records if not (r in seen or seen.add(r))]
+
+
+def plan(client, desired_records, zone, prune=True, comments=None, owner_group_id=None,
+         max_changes=MAX_BATCH_CHANGES, **kwargs):
+    """
+    Work out the smallest set of batch changes that makes a zone hold exactly the desired records.
+
+    Record sets are matched by name and type and compared by ttl and rdata, using the value equality of
+    the rdata classes. Record sets that match are left alone, rdata added to or removed from a set is
+    added or deleted record by record, and a set whose ttl changes is deleted and added again.
+
+    :param client: the VinylDNSClient used to load the zone
+    :param desired_records: an iterable of RecordSet; names may be relative to the zone, absolute, or @
+    :param zone: the Zone to diff against
+    :param prune: delete record sets in the zone that are not desired; the zone's SOA and apex NS records
+        are never deleted
+    :param comments: the comments of each batch change
+    :param owner_group_id: the owner group of each batch change
+    :param max_changes: the most changes put in one batch change; the changes of a record set are never split
+    :return: a Plan
+    """
+    zone_name = fqdn(u'@', zone.name)
+    desired = {}
+    for record_set in desired_records:
+        key = (fqdn(record_set.name, zone_name), record_set.type)
+        if key in desired:
+            raise ValueError(u'{0} {1} is desired more than once'.format(*key))
+        desired[key] = record_set
+
+    current = {}
+    with operation(u'plan', zone_id=zone.id) as span:
+        loaded = 0
+        for record_set in current_record_sets(client, zone, **kwargs):
+            loaded += 1
+            key = (fqdn(record_set.fqdn or record_set.name, zone_name), record_set.type)
+            if key[1] == RecordType.SOA or (key[1] == RecordType.NS and key[0] == zone_name):
+                if key not in desired:
+                    continue
+            if key in desired or prune:
+                current[key] = record_set
+        span.set_attribute(u'vinyldns.item_count', loaded)
+
+    groups, unchanged = [], 0
+    for key in sorted(set(current) | set(desired)):
+        changes = _diff(key[0], key[1], current.get(key), desired.get(key))
+        if changes:
+            groups.append(changes)
+        else:
+            unchanged += 1
+
+    changes = [change for group in groups for change in group]
+    requests = [BatchChangeRequest([changes[i] for i in chunk], comments, owner_group_id)
+                for chunk in chunk_changes(changes, max_changes)]
+    return Plan(zone, changes, requests, unchanged)
+
+
+def apply(client, plan, allow_manual_review=None, **kwargs):
+    """
+    Submit the batch changes of a plan, in order.
+
+    :param client: the VinylDNSClient used to submit the changes
+    :param plan: a Plan
+    :param allow_manual_review: set to false to fail rather than go to review if there are errors
+    :return: the BatchChange created for each request of the plan
+    """
+    with operation(u'apply', zone_id=plan.zone.id, item_count=len(plan.changes), chunk_count=len(plan.requests)):
+        return [client.create_batch_change(request, allow_manual_review=allow_manual_review, **kwargs)
+                for request in plan.requests]
@@ -15,7 +15,7 @@
 
 from vinyldns.zone import Zone
 
-from vinyldns.serdes import parse_datetime, map_option
+from vinyldns.serdes import ValueObject, intern_str, lazy_attribute, lazy_list, parse_datetime, map_option
 
 
 class RecordType:
@@ -41,6 +41,17 @@ class RecordSetStatus:
     PendingDelete = "PendingDelete"
 
 
+# Statuses of a record set with a change still being applied
+PENDING_RECORD_SET_STATUSES = frozenset([RecordSetStatus.Pending, RecordSetStatus.PendingUpdate,
+                                         RecordSetStatus.PendingDelete])
+
+
+class RecordSetChangeStatus:
+    Pending = "Pending"
+    Complete = "Complete"
+    Failed = "Failed"
+
+
 class OwnershipTransferStatus:
     AutoApproved = "AutoApproved"
     Cancelled = "Cancelled"
@@ -50,7 +61,7 @@ class OwnershipTransferStatus:
     PendingReview = "PendingReview"
 
 
-class OwnershipTransfer(object):
+class OwnershipTransfer(ValueObject):
     def __init__(self, ownership_transfer_status, requested_owner_group_id=None):
         self.ownership_transfer_status = ownership_transfer_status
         self.requested_owner_group_id = requested_owner_group_id
@@ -63,7 +74,7 @@ class OwnershipTransfer(object):
         )
 
 
-class AData(object):
+class AData(ValueObject):
     def __init__(self, address):
         self.address = address
 
@@ -72,7 +83,7 @@ class AData(object):
         return AData(d['address'])
 
 
-class AAAAData(object):
+class AAAAData(ValueObject):
     def __init__(self, address):
         self.address = address
 
@@ -81,7 +92,7 @@ class AAAAData(object):
         return AAAAData(d['address'])
 
 
-class CNAMEData(object):
+class CNAMEData(ValueObject):
     def __init__(self, cname):
         self.cname = cname
 
@@ -90,7 +101,7 @@ class CNAMEData(object):
         return CNAMEData(d['cname'])
 
 
-class MXData(object):
+class MXData(ValueObject):
     def __init__(self, preference, exchange):
         self.preference = preference
         self.exchange = exchange
@@ -100,7 +111,7 @@ class MXData(object):
         return MXData(d['preference'], d['exchange'])
 
 
-class NSData(object):
+class NSData(ValueObject):
     def __init__(self, nsdname):
         self.nsdname = nsdname
 
@@ -109,7 +120,7 @@ class NSData(object):
         return NSData(d['nsdname'])
 
 
-class PTRData(object):
+class PTRData(ValueObject):
     def __init__(self, ptrdname):
         self.ptrdname = ptrdname
 
@@ -118,7 +129,7 @@ class PTRData(object):
         return PTRData(d['ptrdname'])
 
 
-class SOAData(object):
+class SOAData(ValueObject):
     def __init__(self, mname, rname, serial, refresh, retry, expire, minimum):
         self.mname = mname
         self.rname = rname
@@ -133,7 +144,7 @@ class SOAData(object):
         return SOAData(d['mname'], d['rname'], d['serial'], d['refresh'], d['retry'], d['expire'], d['minimum'])
 
 
-class SPFData(object):
+class SPFData(ValueObject):
     def __init__(self, text):
         self.text = text
 
@@ -142,7 +153,7 @@ class SPFData(object):
         return SPFData(d['text'])
 
 
-class SRVData(object):
+class SRVData(ValueObject):
     def __init__(self, priority, weight, port, target):
         self.priority = priority
         self.weight = weight
@@ -154,7 +165,7 @@ class SRVData(object):
         return SRVData(d['priority'], d['weight'], d['port'], d['target'])
 
 
-class SSHFPData(object):
+class SSHFPData(ValueObject):
     def __init__(self, algorithm, type, fingerprint):
         self.algorithm = algorithm
         self.type = type
@@ -165,7 +176,7 @@ class SSHFPData(object):
         return SSHFPData(d['algorithm'], d['type'], d['fingerprint'])
 
 
-class TXTData(object):
+class TXTData(ValueObject):
     def __init__(self, text):
         self.text = text
 
@@ -174,7 +185,7 @@ class TXTData(object):
         return TXTData(d['text'])
 
 
-class UNKNOWNData(object):
+class UNKNOWNData(ValueObject):
     def __init__(self, rdata):
         self.rdata = rdata
 
@@ -200,7 +211,12 @@ rdata_converters = {
 }
 
 
-class RecordSet(object):
+class RecordSet(ValueObject):
+    # rdata is converted on first access, most callers only read the name, type and owner
+    records = lazy_attribute()
+    # set by the server as changes are applied, not part of what the record set holds
+    _uncompared_fields = ('status', 'created', 'updated')
+
     def __init__(self, zone_id, name, type, ttl, status=None, created=None,
                  updated=None, records=[], id=None, owner_group_id=None, fqdn=None,
                  record_set_group_change=None):
@@ -220,16 +236,16 @@ class RecordSet(object):
     @staticmethod
     def from_dict(d):
         return RecordSet(
-            zone_id=d['zoneId'],
+            zone_id=intern_str(d['zoneId']),
             name=d['name'],
-            type=d['type'],
+            type=intern_str(d['type']),
             ttl=d['ttl'],
-            status=d.get('status'),
+            status=intern_str(d.get('status')),
             created=map_option(d.get('created'), parse_datetime),
             updated=d.get('updated'),
-            records=[rdata_converters[d['type']](rd) for rd in d.get('records', [])],
+            records=lazy_list(d.get('records'), rdata_converters[d['type']]),
             id=d.get('id'),
-            owner_group_id=d.get('ownerGroupId'),
+            owner_group_id=intern_str(d.get('ownerGroupId')),
             fqdn=d.get('fqdn'),
             record_set_group_change=map_option(d.get('recordSetGroupChange'), OwnershipTransfer.from_dict)
         )
@@ -273,14 +289,14 @@ class RecordSetChange(object):
         return RecordSetChange(
             zone=Zone.from_dict(d['zone']),
             record_set=RecordSet.from_dict(d['recordSet']),
-            user_id=d['userId'],
-            change_type=d['changeType'],
-            status=d['status'],
+            user_id=intern_str(d['userId']),
+            change_type=intern_str(d['changeType']),
+            status=intern_str(d['status']),
             created=map_option(d.get('created'), parse_datetime),
             system_message=d.get('systemMessage'),
             updates=map_option(d.get('updates'), RecordSet.from_dict),
             id=d['id'],
-            user_name=d.get('userName')
+            user_name=intern_str(d.get('userName'))
         )
 
 
@@ -0,0 +1,228 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retry policy and client-wide retry budget used by the VinylDNS client."""
+import random
+import threading
+import time
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from vinyldns.deadline import current_deadline
+from vinyldns.hooks import record_retry
+
+__all__ = [u'RetryPolicy', u'RetryBudget', u'DEFAULT_STATUS_RULES', u'IDEMPOTENT_METHODS']
+
+# Maximum number of retries allowed for each retryable status code
+DEFAULT_STATUS_RULES = {
+    429: 5,
+    500: 2,
+    502: 5,
+    503: 5,
+    504: 5,
+}
+
+# Methods that are safe to replay after the server may have acted on the request
+IDEMPOTENT_METHODS = frozenset([u'GET', u'HEAD', u'OPTIONS', u'PUT', u'DELETE'])
+
+# Statuses that mean the server rejected the request without acting on it, so any method may be replayed
+REJECTED_STATUSES = frozenset([429])
+
+
+class RetryBudget(object):
+    """
+    Caps retries across the whole client as a fraction of the requests it sends.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so during an outage retries
+    add at most ``ratio`` extra load on top of normal traffic. A small reserve that refills at
+    ``min_retries_per_second`` lets low-volume clients still retry.
+    """
+
+    def __init__(self, ratio=0.2, min_retries_per_second=1.0, max_balance=100):
+        """
+        :param ratio: the fraction of requests that may be retried
+        :param min_retries_per_second: the rate at which the reserve refills, independent of traffic
+        :param max_balance: the maximum number of retries that can be saved up from deposits
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._balance = 0.0
+        self._reserve_capacity = max(1.0, min_retries_per_second) if min_retries_per_second > 0 else 0.0
+        self._reserve = self._reserve_capacity
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __refill(self):
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._reserve = min(self._reserve_capacity, self._reserve + elapsed * self.min_retries_per_second)
+
+    def deposit(self):
+        """
+        Record that a request was sent.
+        """
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def can_retry(self):
+        """
+        :return: True if a retry could be withdrawn right now
+        """
+        with self._lock:
+            self.__refill()
+            return self._balance >= 1 or self._reserve >= 1
+
+    def withdraw(self):
+        """
+        Withdraw a single retry from the budget.
+
+        :return: True if the retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            self.__refill()
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+            if self._reserve >= 1:
+                self._reserve -= 1
+                return True
+            return False
+
+
+class RetryPolicy(Retry):
+    """
+    A urllib3 ``Retry`` with per-status rules, full-jitter backoff and an optional shared ``RetryBudget``.
+
+    Non-idempotent methods (POST) are only replayed when the status shows the server rejected the
+    request outright (429), never after errors where the request may already have been processed.
+    ``Retry-After`` headers are honoured, capped at ``backoff_max``. No retry starts once the current
+    deadline has expired, or when the wait before it would outlast the deadline.
+
+    When a response is not retried, or retries run out, the response itself is returned rather than a
+    ``RetryError`` raised, so the client raises the error for its status.
+    """
+
+    def __init__(self, total=5, status_rules=None, budget=None, non_idempotent_statuses=REJECTED_STATUSES,
+                 allowed_methods=IDEMPOTENT_METHODS, **kwargs):
+        """
+        :param total: the total number of retries allowed for a single request
+        :param status_rules: a dictionary of status code to the maximum retries allowed for that status
+        :param budget: an optional RetryBudget shared by every request the client sends
+        :param non_idempotent_statuses: statuses that may be retried regardless of the request method
+        :param allowed_methods: methods that may be retried after any retryable failure
+        """
+        self.status_rules = dict(DEFAULT_STATUS_RULES if status_rules is None else status_rules)
+        self.budget = budget
+        self.non_idempotent_statuses = frozenset(non_idempotent_statuses)
+        # drawn once so the wait checked against the deadline is the wait slept
+        self._jitter = random.random()
+        kwargs.setdefault(u'status_forcelist', self.status_rules.keys())
+        kwargs.setdefault(u'raise_on_status', False)
+        super(RetryPolicy, self).__init__(total=total, allowed_methods=allowed_methods, **kwargs)
+
+    def new(self, **kw):
+        kw.setdefault(u'status_rules', self.status_rules)
+        kw.setdefault(u'budget', self.budget)
+        kw.setdefault(u'non_idempotent_statuses', self.non_idempotent_statuses)
+        return super(RetryPolicy, self).new(**kw)
+
+    def record_request(self):
+        """
+        Record that a new request is about to be sent, funding the retry budget.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        max_retries = self.status_rules.get(status_code)
+        if max_retries is None:
+            return False
+
+        if not self._is_method_retryable(method) and status_code not in self.non_idempotent_statuses:
+            return False
+
+        if sum(1 for h in self.history if h.status == status_code) >= max_retries:
+            return False
+
+        if self.__deadline_expired():
+            return False
+
+        return self.budget is None or self.budget.can_retry()
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        new_retry = super(RetryPolicy, self).increment(method=method, url=url, response=response, error=error,
+                                                       _pool=_pool, _stacktrace=_stacktrace)
+
+        if self.__deadline_expired():
+            reason = error or ResponseError(u'deadline exceeded')
+            raise MaxRetryError(_pool, url, reason) from reason
+
+        active_deadline = current_deadline()
+        if active_deadline is not None and new_retry.__wait(response) > active_deadline.remaining():
+            reason = error or ResponseError(u'the wait before retrying would outlast the deadline')
+            raise MaxRetryError(_pool, url, reason) from reason
+
+        if self.budget is not None and not self.budget.withdraw():
+            reason = error or ResponseError(u'retry budget exhausted')
+            raise MaxRetryError(_pool, url, reason) from reason
+
+        record_retry()
+        return new_retry
+
+    @staticmethod
+    def __deadline_expired():
+        active_deadline = current_deadline()
+        return active_deadline is not None and active_deadline.expired()
+
+    def __wait(self, response):
+        """
+        :return: the seconds sleep waits before the retry, ignoring the deadline
+        """
+        if self.respect_retry_after_header and response is not None:
+            retry_after = self.__retry_after(response)
+            if retry_after:
+                return retry_after
+        return self.__backoff()
+
+    def __backoff(self):
+        if not self.history:
+            return 0
+        ceiling = min(self.backoff_max, self.backoff_factor * (2 ** (len(self.history) - 1)))
+        return ceiling * self._jitter
+
+    def __retry_after(self, response):
+        retry_after = super(RetryPolicy, self).get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.backoff_max)
+
+    @staticmethod
+    def __clamp(seconds):
+        active_deadline = current_deadline()
+        if seconds is None or active_deadline is None:
+            return seconds
+        return min(seconds, active_deadline.remaining())
+
+    def get_backoff_time(self):
+        """
+        Full-jitter exponential backoff: a uniformly random wait between zero and the exponential ceiling,
+        so that clients retrying the same failure spread out instead of arriving together. Never longer
+        than the time left before the current deadline.
+        """
+        return self.__clamp(self.__backoff())
+
+    def get_retry_after(self, response):
+        return self.__clamp(self.__retry_after(response))
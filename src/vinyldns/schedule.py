@@ -0,0 +1,169 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Spreading scheduled batch changes over their windows so the backend is not flooded in any one minute."""
+from collections import Counter
+from datetime import datetime, timezone
+
+from vinyldns.batch_change import BatchChangeRequest, batch_change_done
+from vinyldns.bulk import chunk_changes
+from vinyldns.tracing import operation
+
+__all__ = [u'ChangeWindow', u'Schedule', u'schedule', u'submit', u'progress', u'MISSING']
+
+# the status progress counts batch changes under when they no longer exist
+MISSING = u'Missing'
+
+
+def _minute(t, round_up=False):
+    """
+    :return: the whole number of minutes from the epoch to a time with a time zone, rounded down or up
+    """
+    if t.tzinfo is None:
+        raise ValueError(u'Expected datetime object with tzinfo attribute.')
+    minutes, seconds = divmod(t.timestamp(), 60)
+    return int(minutes) + 1 if round_up and seconds else int(minutes)
+
+
+def _time(minute):
+    return datetime.fromtimestamp(minute * 60, timezone.utc)
+
+
+class ChangeWindow(object):
+    """
+    A set of changes that should be applied between two times.
+    """
+
+    def __init__(self, changes, not_before, not_after=None, comments=None, owner_group_id=None):
+        """
+        :param changes: a list of AddRecord and DeleteRecordSet
+        :param not_before: the earliest time the changes may be applied, with a time zone
+        :param not_after: the latest time the changes may be applied, or None for no limit
+        :param comments: the comments of the batch changes
+        :param owner_group_id: the owner group of the batch changes
+        """
+        self.changes = changes
+        self.not_before = not_before
+        self.not_after = not_after
+        self.comments = comments
+        self.owner_group_id = owner_group_id
+
+
+class Schedule(object):
+    """
+    Batch change requests with a scheduled time assigned to each.
+    """
+
+    def __init__(self, windows, requests, window_indexes, load):
+        """
+        :param windows: the ChangeWindow scheduled
+        :param requests: the BatchChangeRequest to submit, each with its scheduled_time set
+        :param window_indexes: for each request, the index of the window its changes came from
+        :param load: the number of changes scheduled by minute, in UTC, including those already booked
+        """
+        self.windows = windows
+        self.requests = requests
+        self.window_indexes = window_indexes
+        self.load = load
+
+    def __len__(self):
+        return len(self.requests)
+
+    def __repr__(self):
+        return u'Schedule(windows={0}, requests={1}, busiest minute={2})'.format(
+            len(self.windows), len(self.requests), max(self.load.values()) if self.load else 0)
+
+
+def schedule(windows, max_changes_per_minute, booked=(), now=None):
+    """
+    Assign a scheduled time to the changes of each window so that no minute has more than
+    max_changes_per_minute changes scheduled.
+
+    Windows are placed earliest deadline first, each in the first minute of its window with room for it.
+    A window with more changes than fit in one minute is split into several batch changes, keeping the
+    changes of a name together, that are scheduled in order.
+
+    :param windows: an iterable of ChangeWindow
+    :param max_changes_per_minute: the most changes scheduled in any one minute
+    :param booked: BatchChangeSummary or BatchChange already scheduled, e.g. from
+        list_batch_change_summaries, whose changes count towards the minute they are scheduled in
+    :param now: the current time; nothing is scheduled before the next whole minute
+    :return: a Schedule
+    :raises ValueError: if the changes of a window do not fit before its not_after time
+    """
+    windows = list(windows)
+    now = now or datetime.now(timezone.utc)
+    first_minute = _minute(now) + 1
+
+    load = Counter()
+    for batch_change in booked:
+        if batch_change.scheduled_time is not None and not batch_change_done(batch_change):
+            count = getattr(batch_change, u'total_changes', None)
+            load[_minute(batch_change.scheduled_time)] += len(batch_change.changes) if count is None else count
+
+    def deadline(i):
+        not_after = windows[i].not_after
+        return (0, _minute(not_after), i) if not_after is not None else (1, 0, i)
+
+    placed = []
+    for i in sorted(range(len(windows)), key=deadline):
+        window = windows[i]
+        minute = max(first_minute, _minute(window.not_before, round_up=True))
+        last_minute = None if window.not_after is None else _minute(window.not_after)
+        for chunk in chunk_changes(window.changes, max_changes_per_minute):
+            while load[minute] + len(chunk) > max_changes_per_minute:
+                minute += 1
+            if last_minute is not None and minute > last_minute:
+                raise ValueError(u'The {0} changes of window {1} do not fit at {2} changes per minute before {3}'
+                                 .format(len(window.changes), i, max_changes_per_minute, window.not_after))
+            load[minute] += len(chunk)
+            placed.append((minute, i, chunk))
+
+    placed.sort(key=lambda p: (p[0], p[1]))
+    requests = [BatchChangeRequest([windows[i].changes[c] for c in chunk], windows[i].comments,
+                                   windows[i].owner_group_id, _time(minute))
+                for minute, i, chunk in placed]
+    return Schedule(windows, requests, [i for _, i, _ in placed],
+                    dict((_time(minute), count) for minute, count in sorted(load.items()) if count))
+
+
+def submit(client, schedule, allow_manual_review=None, **kwargs):
+    """
+    Submit the batch change requests of a schedule up front; VinylDNS holds each until its scheduled time.
+    Scheduled changes must be enabled on the VinylDNS server.
+
+    :param client: the VinylDNSClient used to submit the changes
+    :param schedule: a Schedule
+    :param allow_manual_review: set to false to fail rather than go to review if there are errors
+    :return: the BatchChange created for each request of the schedule
+    """
+    with operation(u'schedule.submit', item_count=sum(len(r.changes) for r in schedule.requests),
+                   chunk_count=len(schedule.requests)):
+        return [client.create_batch_change(request, allow_manual_review=allow_manual_review, **kwargs)
+                for request in schedule.requests]
+
+
+def progress(client, batch_changes, **kwargs):
+    """
+    Count submitted batch changes by their current status. To block until they finish, pass their ids to
+    wait_for_batch_changes with a timeout past the last scheduled time.
+
+    :param client: the VinylDNSClient used to fetch the batch changes
+    :param batch_changes: the BatchChange returned by submit
+    :return: a Counter of batch changes by status; those that do not exist are counted as MISSING
+    """
+    statuses = Counter()
+    for batch_change in batch_changes:
+        current = client.get_batch_change(batch_change.id, **kwargs)
+        statuses[MISSING if current is None else current.status] += 1
+    return statuses
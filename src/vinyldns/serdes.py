@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """TODO: Add module docstring."""
+import functools
 import re
+import sys
 from datetime import date, datetime
 import json
 # Python 2/3 compatibility
@@ -21,6 +23,17 @@ try:
 except ImportError:
     from dateutil.tz import tzutc
 
+# Optional faster JSON implementations, preferred in this order when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 camel_pat = re.compile(r'([A-Z])')
 under_pat = re.compile(r'_([a-z])')
 
@@ -75,6 +88,61 @@ def to_dict(obj, cls=None):
         return obj
 
 
+class JsonCodec(object):
+    """
+    A JSON implementation. loads accepts str or UTF-8 bytes and dumps returns UTF-8 bytes.
+    """
+
+    def __init__(self, name, loads, dumps):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return 'JsonCodec({0!r})'.format(self.name)
+
+
+JSON_CODECS = {'json': JsonCodec('json', json.loads, lambda o: json.dumps(o).encode('utf-8'))}
+if ujson is not None:
+    JSON_CODECS['ujson'] = JsonCodec('ujson', ujson.loads,
+                                     lambda o: ujson.dumps(o, ensure_ascii=False).encode('utf-8'))
+if orjson is not None:
+    JSON_CODECS['orjson'] = JsonCodec('orjson', orjson.loads, orjson.dumps)
+
+json_codec = next(JSON_CODECS[name] for name in ('orjson', 'ujson', 'json') if name in JSON_CODECS)
+
+
+def set_json_codec(name):
+    """
+    Select the JSON implementation used to encode requests and decode responses
+    :param name: one of orjson, ujson or json; the library must be installed
+    :return: the previously selected codec name
+    """
+    global json_codec
+    if name not in JSON_CODECS:
+        raise ValueError('JSON codec {0} is not available, choose from {1}'.format(name, sorted(JSON_CODECS)))
+    previous, json_codec = json_codec.name, JSON_CODECS[name]
+    return previous
+
+
+def json_loads(s):
+    """
+    Parses json with the selected codec
+    :param s: A json document as str or UTF-8 bytes
+    :return: The decoded value
+    """
+    return json_codec.loads(s)
+
+
+def json_dumps(o):
+    """
+    Encodes a plain value (dicts, lists, strings, numbers) with the selected codec
+    :param o: The value to encode
+    :return: The json document as UTF-8 bytes
+    """
+    return json_codec.dumps(o)
+
+
 def from_json_string(s, object_hook):
     """
     Given the string as json, loads it into a nested dictionary and passes it into the object_ctor
@@ -83,7 +151,7 @@ def from_json_string(s, object_hook):
     :param object_hook: A function that takes a dictionary and yields a new object instance
     :return: A populated object instance generated from the object_ctor
     """
-    d = json.loads(s)
+    d = json_loads(s)
     return object_hook(d)
 
 
@@ -96,6 +164,25 @@ def to_json_string(o):
     return json.dumps(to_dict(o))
 
 
+def to_json_bytes(o):
+    """
+    Converts the object to json with the selected codec, ready to sign and send
+    :param o: An object that can be serialized to json
+    :return: A json formatted UTF-8 bytes representation of the object
+    """
+    return json_dumps(to_dict(o))
+
+
+def intern_str(s):
+    """
+    Interns a decoded string so that values repeated across many objects, such as zone ids, types and
+    statuses, are stored once
+    :param s: A string or None
+    :return: The interned string; s unchanged if it is not a string
+    """
+    return sys.intern(s) if type(s) is str else s
+
+
 def map_option(v, f):
     """
     Applies the function f to the value if it is not None
@@ -109,6 +196,132 @@ def map_option(v, f):
         return None
 
 
+class LazyValue(object):
+    """
+    A raw value from a response that is converted the first time the attribute holding it is read
+    """
+    __slots__ = ('raw', 'convert')
+
+    def __init__(self, raw, convert):
+        """
+        :param raw: The decoded json value
+        :param convert: A function that takes the raw value and yields the converted one
+        """
+        self.raw = raw
+        self.convert = convert
+
+    def force(self):
+        return self.convert(self.raw)
+
+    def _ast(self):
+        return self.force()
+
+
+def _convert_items(f, items):
+    return [f(item) for item in items]
+
+
+def lazy_list(items, f):
+    """
+    Defers applying the function f to each of the items until the list is first read
+    :param items: A list of decoded json values, may be None
+    :param f: A function that takes a single item to convert; a module level function or static method keeps
+    the model picklable before the list is read
+    :return: A LazyValue for an attribute declared with lazy_attribute
+    """
+    return LazyValue(items or [], functools.partial(_convert_items, f))
+
+
+class lazy_attribute(object):
+    """
+    Declares an attribute that may hold a LazyValue, which is replaced by its converted value on first access.
+    The value stays in the instance __dict__ under the attribute name, so to_dict still serializes it
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+        if isinstance(value, LazyValue):
+            value = obj.__dict__[self.name] = value.force()
+        return value
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+def _freeze(v):
+    if isinstance(v, (list, tuple)):
+        return tuple(_freeze(e) for e in v)
+    if isinstance(v, dict):
+        return frozenset((k, _freeze(e)) for k, e in v.items())
+    return v
+
+
+class ValueObject(object):
+    """
+    Gives a model structural equality and a hash computed from its fields. The hash is cached on first use
+    and dropped when an attribute is assigned, lists held by the model should be replaced rather than
+    changed in place once it has been hashed. Fields named in ``_uncompared_fields``, such as those the
+    server manages, are left out of both.
+
+    Lazy attributes are left out of the hash and compared by their raw values while both sides are still
+    unconverted, so comparing and hashing models does not convert them.
+    """
+    # kept out of __dict__ so that it is not serialized or compared
+    __slots__ = ('_hash',)
+    _lazy_attributes = ()
+    _uncompared_fields = ()
+    _skipped_fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._lazy_attributes = tuple(name for name in dir(cls) if isinstance(getattr(cls, name), lazy_attribute))
+        cls._skipped_fields = cls._lazy_attributes + tuple(cls._uncompared_fields)
+
+    def _fields(self):
+        # the fields compared and hashed as they are, lazy attributes are compared apart
+        if not self._skipped_fields:
+            return self.__dict__
+        return dict((k, v) for k, v in self.__dict__.items() if k not in self._skipped_fields)
+
+    def __lazy_equal(self, other, name):
+        mine, theirs = self.__dict__.get(name), other.__dict__.get(name)
+        if isinstance(mine, LazyValue) and isinstance(theirs, LazyValue):
+            return mine.raw == theirs.raw
+        return getattr(self, name, None) == getattr(other, name, None)
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        if self._fields() != other._fields():
+            return False
+        return all(self.__lazy_equal(other, name) for name in self._lazy_attributes)
+
+    def __hash__(self):
+        h = getattr(self, '_hash', None)
+        if h is None:
+            values = tuple(self._fields().values())
+            try:
+                h = hash((type(self), values))
+            except TypeError:
+                h = hash((type(self), _freeze(values)))
+            object.__setattr__(self, '_hash', h)
+        return h
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_hash', None)
+
+
 def parse_datetime(s):
     """
     Parses the iso formatted date from the string provided
@@ -0,0 +1,167 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Incremental decoding of large JSON list responses."""
+import codecs
+import json
+
+__all__ = [u'ArrayStream']
+
+_decoder = json.JSONDecoder()
+
+# consumed text is dropped from the buffer once this many characters have accumulated
+_COMPACT_AFTER = 1 << 16
+
+
+class _Buffer(object):
+    """
+    A window of decoded text over a stream of byte chunks that grows on demand and drops what has been consumed.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder(u'utf-8')()
+        self.data = u''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+            if text:
+                self.data += text
+                return True
+        if not self.eof:
+            self.eof = True
+            self.data += self.decoder.decode(b'', final=True)
+        return False
+
+    def require(self):
+        if not self.fill():
+            raise ValueError(u'Truncated JSON document')
+
+    def compact(self):
+        if self.pos >= _COMPACT_AFTER:
+            self.data = self.data[self.pos:]
+            self.pos = 0
+
+    def peek(self):
+        """
+        :return: the next non-whitespace character, which is not consumed
+        """
+        while True:
+            while self.pos < len(self.data) and self.data[self.pos] in u' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.data):
+                return self.data[self.pos]
+            self.require()
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(u'Expected {0!r} at offset {1}, found {2!r}'.format(char, self.pos, found))
+        self.pos += 1
+
+    def value(self):
+        """
+        Consume and decode one complete JSON value, reading more of the stream until it is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.data, self.pos)
+            except json.JSONDecodeError:
+                # most likely the value continues past the end of the buffer, otherwise it is malformed
+                if not self.fill():
+                    raise
+                continue
+            # a number at the very end of the buffer may have more digits to come
+            if end < len(self.data) or not self.fill():
+                self.pos = end
+                return value
+
+
+class ArrayStream(object):
+    """
+    Iterates over one array member of a JSON object, decoding its items one at a time as the bytes arrive,
+    so that memory use is bounded by the largest item rather than the whole document.
+
+    The other members of the object are decoded whole and are available in ``fields`` once iteration has
+    finished. Use it as a context manager, or call ``close``, to release the connection early.
+    """
+
+    def __init__(self, chunks, key, item_hook=None, close=None):
+        """
+        :param chunks: an iterable of bytes making up a JSON object
+        :param key: the name of the array member to stream
+        :param item_hook: an optional function applied to each decoded item, e.g. RecordSet.from_dict
+        :param close: an optional function that releases the underlying response
+        """
+        self.key = key
+        self.item_hook = item_hook
+        self.fields = {}
+        self._buffer = _Buffer(chunks)
+        self._close = close
+        self._items = self.__items()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._items.close()
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __items(self):
+        buffer = self._buffer
+        buffer.expect(u'{')
+        while True:
+            char = buffer.peek()
+            if char == u'}':
+                break
+            if char == u',':
+                buffer.pos += 1
+                continue
+
+            name = buffer.value()
+            buffer.expect(u':')
+            if name != self.key or buffer.peek() != u'[':
+                self.fields[name] = buffer.value()
+                continue
+
+            buffer.pos += 1
+            while True:
+                char = buffer.peek()
+                if char == u']':
+                    buffer.pos += 1
+                    break
+                if char == u',':
+                    buffer.pos += 1
+                    continue
+                item = buffer.value()
+                buffer.compact()
+                yield self.item_hook(item) if self.item_hook is not None else item
+
+        if self._close is not None:
+            self._close()
+            self._close = None
@@ -0,0 +1,255 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A compact columnar store of record sets for counting and grouping large estates."""
+from array import array
+from collections import Counter
+
+from vinyldns.record import RecordSet, rdata_converters
+from vinyldns.serdes import LazyValue, json_dumps, json_loads, lazy_list, to_dict
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    numpy = None
+
+__all__ = [u'RecordSetTable']
+
+
+class _Categories(object):
+    """
+    A column of repeated values stored as integer codes into a list of the distinct values.
+    """
+
+    def __init__(self):
+        self.codes = array(u'I')
+        self.values = []
+        self.index = {}
+
+    def append(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def encode(self, values):
+        return [self.index[v] for v in values if v in self.index]
+
+    def decode(self, code):
+        return self.values[code]
+
+
+class _Integers(object):
+    """
+    A column of integers, stored as is.
+    """
+
+    def __init__(self):
+        self.codes = array(u'q')
+
+    def append(self, value):
+        self.codes.append(value)
+
+    @staticmethod
+    def encode(values):
+        return list(values)
+
+    @staticmethod
+    def decode(code):
+        return int(code)
+
+
+class _Strings(object):
+    """
+    A column of strings stored back to back in one buffer, indexed by their end offsets.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array(u'Q', [0])
+
+    def append(self, value):
+        self.data += value if isinstance(value, bytes) else value.encode(u'utf-8')
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, row):
+        return bytes(self.data[self.offsets[row]:self.offsets[row + 1]])
+
+
+class RecordSetTable(object):
+    """
+    Holds record sets column by column: zone, type and owner group as category codes, ttl as integers and
+    names and rdata in string buffers. A row costs a few dozen bytes instead of a RecordSet and its rdata
+    objects, and counts over millions of rows run over the integer columns, with NumPy when it is installed.
+
+    Rows are appended from any iterable of RecordSet, such as the pages of list_record_sets or
+    search_record_sets, or a stream from stream_record_sets::
+
+        table = RecordSetTable()
+        for zone in zones:
+            table.extend(client.stream_record_sets(zone.id))
+        table.group_count(u'owner_group_id', u'type')
+
+    Conditions are given as keyword arguments naming a column, with either a single value or a list,
+    tuple or set of accepted values, e.g. ``table.count(type=[u'A', u'AAAA'], owner_group_id=None)``.
+    """
+
+    columns = (u'zone_id', u'type', u'owner_group_id', u'ttl')
+
+    def __init__(self, record_sets=()):
+        """
+        :param record_sets: an optional iterable of RecordSet to load
+        """
+        self._columns = {u'zone_id': _Categories(), u'type': _Categories(), u'owner_group_id': _Categories(),
+                         u'ttl': _Integers()}
+        self._ids = _Strings()
+        self._names = _Strings()
+        self._rdata = _Strings()
+        self.extend(record_sets)
+
+    def __len__(self):
+        return len(self._columns[u'ttl'].codes)
+
+    def append(self, record_set):
+        for name, column in self._columns.items():
+            column.append(getattr(record_set, name))
+        self._ids.append(record_set.id or u'')
+        self._names.append(record_set.name)
+        # rdata that has not been read yet is stored as received, without converting it
+        records = record_set.__dict__.get(u'records')
+        self._rdata.append(json_dumps(records.raw if isinstance(records, LazyValue) else to_dict(records)))
+
+    def extend(self, record_sets):
+        for record_set in record_sets:
+            self.append(record_set)
+
+    def column(self, name):
+        """
+        :param name: one of the names in columns
+        :return: the decoded values of the column, as a NumPy array when NumPy is installed
+        """
+        column = self._columns[name]
+        if isinstance(column, _Integers):
+            return numpy.array(column.codes) if numpy is not None else column.codes.tolist()
+        values = [column.decode(code) for code in column.codes]
+        return numpy.array(values, dtype=object) if numpy is not None else values
+
+    def name(self, row):
+        return self._names[row].decode(u'utf-8')
+
+    def rdata(self, row):
+        """
+        :return: the rdata of a row as dicts, as returned by the API
+        """
+        return json_loads(self._rdata[row])
+
+    def record_set(self, row):
+        """
+        Rebuild the RecordSet of a row; its rdata is converted on first access.
+        """
+        zone_id, type, owner_group_id, ttl = (self._columns[name].decode(self._columns[name].codes[row])
+                                              for name in self.columns)
+        return RecordSet(zone_id, self.name(row), type, ttl, id=self._ids[row].decode(u'utf-8') or None,
+                         owner_group_id=owner_group_id,
+                         records=lazy_list(self.rdata(row), rdata_converters[type]))
+
+    def filter(self, **conditions):
+        """
+        :return: the rows matching every condition, as a NumPy array when NumPy is installed
+        """
+        if numpy is not None:
+            mask = numpy.ones(len(self), dtype=bool)
+            for name, codes in self.__codes(conditions):
+                mask &= numpy.isin(self.__array(self._columns[name]), codes)
+            return numpy.flatnonzero(mask)
+
+        rows = range(len(self))
+        for name, codes in self.__codes(conditions):
+            column, codes = self._columns[name].codes, set(codes)
+            rows = [row for row in rows if column[row] in codes]
+        return list(rows)
+
+    def count(self, **conditions):
+        """
+        :return: the number of rows matching every condition
+        """
+        if not conditions:
+            return len(self)
+        return len(self.filter(**conditions))
+
+    def group_count(self, *columns, **conditions):
+        """
+        Count the rows matching the conditions by the distinct values of one or more columns.
+
+        :param columns: the names of the columns to group by
+        :return: a dict of count by value, or by tuple of values when grouping by several columns
+        """
+        if not columns:
+            raise ValueError(u'At least one column is required')
+        grouped = [self._columns[name] for name in columns]
+        rows = self.filter(**conditions) if conditions else None
+        if len(self if rows is None else rows) == 0:
+            return {}
+
+        if numpy is not None:
+            counted = self.__numpy_group_count(grouped, rows)
+        else:
+            codes = [column.codes if rows is None else [column.codes[row] for row in rows] for column in grouped]
+            counted = Counter(zip(*codes)).items()
+
+        result = {}
+        for key, count in counted:
+            values = tuple(column.decode(code) for column, code in zip(grouped, key))
+            result[values if len(values) > 1 else values[0]] = count
+        return result
+
+    def __codes(self, conditions):
+        for name, wanted in conditions.items():
+            if name not in self._columns:
+                raise ValueError(u'Unknown column {0}, choose from {1}'.format(name, u', '.join(self.columns)))
+            if not isinstance(wanted, (list, tuple, set, frozenset)):
+                wanted = [wanted]
+            yield name, self._columns[name].encode(wanted)
+
+    @classmethod
+    def __numpy_group_count(cls, grouped, rows):
+        # the codes of each column are combined into a single integer key so that one sort does the grouping
+        keys = []
+        for column in grouped:
+            values = cls.__array(column, rows)
+            if isinstance(column, _Integers):
+                distinct, values = numpy.unique(values, return_inverse=True)
+            else:
+                distinct = numpy.arange(len(column.values))
+            keys.append((distinct, values))
+        if numpy.prod([float(len(distinct)) for distinct, _ in keys]) >= 2 ** 63:
+            unique, counts = numpy.unique(numpy.stack([values for _, values in keys], axis=1), axis=0,
+                                          return_counts=True)
+            return [(tuple(distinct[code] for (distinct, _), code in zip(keys, key)), count)
+                    for key, count in zip(unique.tolist(), counts.tolist())]
+
+        combined = numpy.zeros(len(keys[0][1]), dtype=numpy.int64)
+        for distinct, values in keys:
+            combined = combined * len(distinct) + values
+        unique, counts = numpy.unique(combined, return_counts=True)
+        codes = []
+        for distinct, _ in reversed(keys):
+            unique, code = numpy.divmod(unique, len(distinct))
+            codes.append(distinct[code].tolist())
+        return zip(zip(*reversed(codes)), counts.tolist())
+
+    @staticmethod
+    def __array(column, rows=None):
+        values = numpy.array(column.codes, dtype=numpy.int64)
+        return values if rows is None else values[rows]
@@ -0,0 +1,167 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""OpenTelemetry spans for API calls and the operations made of several of them."""
+import contextlib
+import contextvars
+import re
+import threading
+import time
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - opentelemetry is an optional dependency
+    trace = None
+
+__all__ = [u'operation', u'page', u'RequestTracer', u'enabled']
+
+_current_page = contextvars.ContextVar(u'vinyldns_page', default=None)
+
+# the zone id in the paths of the zone resources, e.g. /zones/{id}/recordsets, but not /zones/name/{name}
+_ZONE_PATH = re.compile(r'^/zones/(?!name/|batchrecordchanges|backendids|deleted/)([^/]+)')
+
+
+def enabled():
+    """
+    :return: True if OpenTelemetry is installed
+    """
+    return trace is not None
+
+
+def _tracer():
+    return trace.get_tracer(u'vinyldns')
+
+
+def _attributes(attributes):
+    return dict((u'vinyldns.{0}'.format(k), v) for k, v in attributes.items() if v is not None)
+
+
+class _NoopSpan(object):
+    """
+    Stands in for a span when OpenTelemetry is not installed.
+    """
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, attributes):
+        pass
+
+    def add_event(self, name, attributes=None):
+        pass
+
+    def record_exception(self, exception, attributes=None):
+        pass
+
+    def is_recording(self):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextlib.contextmanager
+def operation(name, **attributes):
+    """
+    A parent span for an operation made of several API calls, such as paging through a listing or
+    submitting batch changes; the spans of the calls made inside the block are its children. Attributes
+    are given as keyword arguments and prefixed with ``vinyldns.``, and None values are left out.
+
+    :param name: the name of the operation; the span is named vinyldns.<name>
+    :return: the span, or a stand-in with the same methods when OpenTelemetry is not installed
+    """
+    if trace is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer().start_as_current_span(u'vinyldns.{0}'.format(name), attributes=_attributes(attributes)) as span:
+        yield span
+
+
+@contextlib.contextmanager
+def page(number):
+    """
+    Label the API calls made inside the block with a page number.
+    """
+    token = _current_page.set(number)
+    try:
+        yield
+    finally:
+        _current_page.reset(token)
+
+
+class RequestTracer(object):
+    """
+    Emits a client span for every API call a client makes, from its request hooks. Spans are named
+    vinyldns.<client method> and carry the method, path, zone id, page number, status, retries, bytes in
+    and out and the timing breakdown of the call.
+    """
+
+    def __init__(self):
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def attach(self, client):
+        """
+        Start tracing the requests of a client; does nothing if OpenTelemetry is not installed.
+        """
+        if trace is None:
+            return
+        client.add_hook(u'before_request', self.before_request)
+        client.add_hook(u'after_response', self.after_response)
+        client.add_hook(u'on_error', self.on_error)
+
+    def before_request(self, event):
+        attributes = _attributes({u'endpoint': event.endpoint, u'page': _current_page.get()})
+        attributes[u'http.request.method'] = event.method
+        attributes[u'url.path'] = event.path
+        zone = _ZONE_PATH.match(event.path or u'')
+        if zone is not None:
+            attributes[u'vinyldns.zone_id'] = zone.group(1)
+        span = _tracer().start_span(u'vinyldns.{0}'.format(event.endpoint or event.path), kind=SpanKind.CLIENT,
+                                    attributes=attributes)
+        with self._lock:
+            self._spans[id(event)] = span
+
+    def __finish(self, event):
+        with self._lock:
+            span = self._spans.pop(id(event), None)
+        if span is None:
+            return None
+        if span.is_recording():
+            span.set_attributes(_attributes({u'retries': event.retries, u'bytes_out': event.bytes_out,
+                                             u'bytes_in': event.bytes_in}))
+            span.set_attributes(dict((u'vinyldns.timing.{0}'.format(name), seconds)
+                                     for name, seconds in event.timings.items()))
+            if event.status is not None:
+                span.set_attribute(u'http.response.status_code', event.status)
+        return span
+
+    @staticmethod
+    def __end_time(event):
+        # after_response waits for the calling method to convert the response, which for methods making
+        # several calls is after all of them; each span ends when its own response was decoded, and the
+        # conversion time is left to the hydrate attribute
+        return time.time_ns() - int((time.perf_counter() - event.returned) * 1e9)
+
+    def after_response(self, event):
+        span = self.__finish(event)
+        if span is not None:
+            span.end(self.__end_time(event))
+
+    def on_error(self, event):
+        span = self.__finish(event)
+        if span is not None:
+            span.record_exception(event.error)
+            span.set_status(Status(StatusCode.ERROR, type(event.error).__name__))
+            span.end(self.__end_time(event))
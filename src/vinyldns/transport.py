@@ -0,0 +1,408 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""HTTP transports that send already-signed requests to the VinylDNS API."""
+import time
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, HTTPError, MaxRetryError, NewConnectionError, ProtocolError, \
+    ReadTimeoutError, ResponseError
+
+from vinyldns.hooks import current_request
+from vinyldns.serdes import json_loads
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is an optional dependency
+    httpx = None
+
+__all__ = [u'Transport', u'TransportResponse', u'StreamedResponse', u'RequestsTransport', u'Urllib3Transport',
+           u'HttpxTransport']
+
+# the size of the reads made from a streamed response body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class TransportResponse(object):
+    """
+    The status, headers and body of a response, fully read.
+    """
+
+    __slots__ = (u'status_code', u'headers', u'content', u'encoding')
+
+    def __init__(self, status_code, headers, content, encoding=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or u'utf-8', errors=u'replace')
+
+    def json(self):
+        return json_loads(self.content)
+
+    def close(self):
+        """
+        The body has already been read, so there is nothing to release.
+        """
+        pass
+
+
+class StreamedResponse(object):
+    """
+    The status and headers of a response whose body has not been read yet.
+    """
+
+    def __init__(self, status_code, headers, chunks, close, encoding=None):
+        """
+        :param chunks: an iterator over the body as bytes
+        :param close: a function that releases the connection
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.encoding = encoding
+        self._chunks = chunks
+        self._close = close
+
+    def iter_content(self):
+        return self._chunks
+
+    @property
+    def content(self):
+        try:
+            return b''.join(self._chunks)
+        finally:
+            self.close()
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or u'utf-8', errors=u'replace')
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+
+class Transport(object):
+    """
+    Sends signed requests and returns a TransportResponse, or a StreamedResponse when streaming.
+
+    Transports apply the client's RetryPolicy and raise the ``requests.exceptions`` types (Timeout,
+    ConnectionError, RetryError) on failure, whatever library they are built on.
+    """
+
+    def __init__(self, retry_policy=None):
+        """
+        :param retry_policy: the RetryPolicy applied to every request
+        """
+        self.retry_policy = retry_policy
+
+    def request(self, method, url, headers, body, timeout, stream=False):
+        """
+        :param method: the HTTP method
+        :param url: the full url, including any query string
+        :param headers: the signed headers
+        :param body: the signed body string, or None
+        :param timeout: a (connect, read) tuple or a single timeout in seconds
+        :param stream: return as soon as the headers arrive, leaving the body to be read from the response
+        :return: a TransportResponse, or a StreamedResponse if stream is set
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class _TimedConnectionMixin(object):
+    """
+    Adds the time taken to establish a connection to the connect timing of the current request.
+    """
+
+    def connect(self):
+        event = current_request()
+        if event is None:
+            return super(_TimedConnectionMixin, self).connect()
+        event.connections_opened += 1
+        started = time.perf_counter()
+        try:
+            return super(_TimedConnectionMixin, self).connect()
+        finally:
+            event.add_time(u'connect', time.perf_counter() - started)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedPoolMixin(object):
+    """
+    Adds the time spent waiting for a connection from the pool to the connect timing of the current request.
+    """
+
+    def _get_conn(self, timeout=None):
+        event = current_request()
+        if event is None:
+            return super(_TimedPoolMixin, self)._get_conn(timeout)
+        started = time.perf_counter()
+        try:
+            return super(_TimedPoolMixin, self)._get_conn(timeout)
+        finally:
+            event.add_time(u'connect', time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def _time_connections(pool_manager):
+    pool_manager.pool_classes_by_scheme = {u'http': _TimedHTTPConnectionPool, u'https': _TimedHTTPSConnectionPool}
+
+
+class _ResponseTimer(object):
+    """
+    Splits the time of a request being instrumented into first_byte and transfer.
+    """
+
+    def __init__(self, event):
+        self.event = event
+        self.started = time.perf_counter()
+        self.connect = event.timings.get(u'connect', 0.0)
+        self.headers_at = None
+
+    def headers_received(self):
+        self.headers_at = time.perf_counter()
+        connect = self.event.timings.get(u'connect', 0.0) - self.connect
+        self.event.add_time(u'first_byte', self.headers_at - self.started - connect)
+
+    def body_received(self):
+        self.event.add_time(u'transfer', time.perf_counter() - self.headers_at)
+
+
+def _split_timeout(timeout):
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+def _reraise_urllib3_error(error):
+    """
+    Raise the requests exception matching a urllib3 error, the same way requests' HTTPAdapter does.
+    """
+    reason = error.reason if isinstance(error, MaxRetryError) else error
+    # NewConnectionError subclasses ConnectTimeoutError, but a refused connection is no timeout
+    if isinstance(reason, ConnectTimeoutError) and not isinstance(reason, NewConnectionError):
+        raise requests.exceptions.ConnectTimeout(error) from error
+    if isinstance(reason, ReadTimeoutError):
+        raise requests.exceptions.ReadTimeout(error) from error
+    if isinstance(reason, ResponseError):
+        raise requests.exceptions.RetryError(error) from error
+    raise requests.exceptions.ConnectionError(error) from error
+
+
+class RequestsTransport(Transport):
+    """
+    Sends requests through a ``requests.Session``.
+    """
+
+    def __init__(self, retry_policy=None, session=None):
+        """
+        :param retry_policy: the RetryPolicy applied to every request
+        :param session: an optional session to use; the retry policy is mounted on it
+        """
+        super(RequestsTransport, self).__init__(retry_policy)
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(max_retries=retry_policy) if retry_policy is not None else HTTPAdapter()
+        _time_connections(adapter.poolmanager)
+        self.session.mount(u'http://', adapter)
+        self.session.mount(u'https://', adapter)
+
+    def request(self, method, url, headers, body, timeout, stream=False):
+        event = current_request()
+        if event is None:
+            response = self.session.request(method, url, data=body, headers=headers, timeout=timeout, stream=stream)
+        else:
+            # the body is read separately so that its transfer is timed apart from the wait for the headers
+            timer = _ResponseTimer(event)
+            response = self.session.request(method, url, data=body, headers=headers, timeout=timeout, stream=True)
+            timer.headers_received()
+        if stream:
+            return StreamedResponse(response.status_code, response.headers,
+                                    response.iter_content(STREAM_CHUNK_SIZE), response.close, response.encoding)
+        content = response.content
+        if event is not None:
+            timer.body_received()
+        return TransportResponse(response.status_code, response.headers, content, response.encoding)
+
+    def close(self):
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """
+    Sends requests directly through a urllib3 ``PoolManager``, skipping the session, cookie and hook
+    handling that requests performs on every call.
+    """
+
+    def __init__(self, retry_policy=None, **pool_kwargs):
+        """
+        :param retry_policy: the RetryPolicy applied to every request
+        :param pool_kwargs: extra arguments for the PoolManager, e.g. maxsize or ca_certs
+        """
+        super(Urllib3Transport, self).__init__(retry_policy)
+        pool_kwargs.setdefault(u'maxsize', 10)
+        self.pool = urllib3.PoolManager(**pool_kwargs)
+        _time_connections(self.pool)
+
+    def request(self, method, url, headers, body, timeout, stream=False):
+        connect, read = _split_timeout(timeout)
+        retries = self.retry_policy if self.retry_policy is not None else False
+        event = current_request()
+        timer = None if event is None else _ResponseTimer(event)
+        try:
+            response = self.pool.urlopen(method, url, body=body, headers=headers, retries=retries,
+                                         redirect=False, timeout=urllib3.Timeout(connect=connect, read=read),
+                                         preload_content=not stream and timer is None)
+        except HTTPError as e:
+            _reraise_urllib3_error(e)
+        if stream:
+            return StreamedResponse(response.status, response.headers, response.stream(STREAM_CHUNK_SIZE),
+                                    response.release_conn)
+        if timer is None:
+            return TransportResponse(response.status, response.headers, response.data)
+
+        timer.headers_received()
+        try:
+            content = response.read()
+        except HTTPError as e:
+            _reraise_urllib3_error(e)
+        finally:
+            response.release_conn()
+        timer.body_received()
+        return TransportResponse(response.status, response.headers, content)
+
+    def close(self):
+        self.pool.clear()
+
+
+class _RetryResponse(object):
+    """
+    The parts of a urllib3 response that Retry reads, for responses from other libraries.
+    """
+
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = response.headers
+
+    @staticmethod
+    def get_redirect_location():
+        return False
+
+
+class HttpxTransport(Transport):
+    """
+    Sends requests through an ``httpx.Client``, by default negotiating HTTP/2 so that concurrent requests
+    are multiplexed over a few connections. Requires ``httpx`` (and ``h2`` for HTTP/2), available with
+    ``pip install vinyldns-python[httpx]``.
+    """
+
+    def __init__(self, retry_policy=None, http2=True, **client_kwargs):
+        """
+        :param retry_policy: the RetryPolicy applied to every request
+        :param http2: negotiate HTTP/2 with servers that support it
+        :param client_kwargs: extra arguments for the httpx.Client, e.g. limits or verify
+        """
+        if httpx is None:
+            raise ImportError(u'HttpxTransport requires httpx, install vinyldns-python[httpx]')
+        super(HttpxTransport, self).__init__(retry_policy)
+        self.client = httpx.Client(http2=http2, **client_kwargs)
+
+    def request(self, method, url, headers, body, timeout, stream=False):
+        connect, read = _split_timeout(timeout)
+        timeout = httpx.Timeout(read, connect=connect)
+        retries = self.retry_policy
+        event = current_request()
+        while True:
+            timer = None if event is None else _ResponseTimer(event)
+            try:
+                request = self.client.build_request(method, url, content=body, headers=headers, timeout=timeout)
+                response = self.client.send(request, stream=True)
+            except httpx.TransportError as e:
+                error = self.__as_urllib3_error(e)
+                if retries is None:
+                    _reraise_urllib3_error(error)
+                try:
+                    retries = retries.increment(method, url, error=error)
+                except HTTPError as exhausted:
+                    # MaxRetryError, or the error itself when it cannot be retried
+                    _reraise_urllib3_error(exhausted)
+                retries.sleep()
+                continue
+            if timer is not None:
+                timer.headers_received()
+
+            if retries is not None and retries.is_retry(method, response.status_code,
+                                                        u'Retry-After' in response.headers):
+                retry_response = _RetryResponse(response)
+                try:
+                    retries = retries.increment(method, url, response=retry_response)
+                except MaxRetryError as exhausted:
+                    if retries.raise_on_status:
+                        response.close()
+                        _reraise_urllib3_error(exhausted)
+                    return self.__response(response, stream, timer)
+                response.close()
+                retries.sleep(retry_response)
+                continue
+
+            return self.__response(response, stream, timer)
+
+    @staticmethod
+    def __response(response, stream, timer=None):
+        if stream:
+            return StreamedResponse(response.status_code, response.headers,
+                                    response.iter_bytes(STREAM_CHUNK_SIZE), response.close)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        if timer is not None:
+            timer.body_received()
+        return TransportResponse(response.status_code, response.headers, content)
+
+    @staticmethod
+    def __as_urllib3_error(error):
+        if isinstance(error, httpx.ConnectTimeout):
+            return ConnectTimeoutError(str(error))
+        if isinstance(error, httpx.TimeoutException):
+            return ReadTimeoutError(None, None, str(error))
+        if isinstance(error, httpx.ConnectError):
+            return NewConnectionError(None, str(error))
+        return ProtocolError(str(error), error)
+
+    def close(self):
+        self.client.close()
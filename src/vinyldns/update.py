@@ -0,0 +1,137 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Read-modify-write updates of record sets that retry when another writer gets there first."""
+import copy
+import threading
+import time
+from concurrent.futures import Future
+
+from vinyldns.deadline import current_deadline
+from vinyldns.tracing import operation
+from vinyldns.waiter import Backoff
+
+__all__ = [u'RecordSetUpdater']
+
+
+class RecordSetUpdater(object):
+    """
+    Applies mutation functions to record sets with optimistic concurrency: the record set is read, changed
+    and written back, and when the write conflicts with another one, read and changed again.
+
+    Updates of the same record set made at the same time from several threads are coalesced: while one
+    caller's update is in flight, the mutations of the others queue up and are applied together, in the
+    order they were made, in a single update whose RecordSetChange every caller gets. Each client has one
+    updater, used by VinylDNSClient.modify_record_set.
+    """
+
+    def __init__(self, client, max_attempts=5, backoff=None):
+        """
+        :param client: the VinylDNSClient used to read and write record sets
+        :param max_attempts: the most writes tried before the ConflictError is raised
+        :param backoff: the Backoff between a conflict and the next read
+        """
+        self.client = client
+        self.max_attempts = max_attempts
+        self.backoff = backoff or Backoff(initial=0.1, maximum=2.0)
+        self._lock = threading.Lock()
+        self._queues = {}
+
+    def modify(self, zone_id, record_set_id, mutate, **kwargs):
+        """
+        Update a record set by applying a function to its current state.
+
+        The function is given the current RecordSet and returns the RecordSet to write, usually the same one
+        changed in place, or None to leave the record set as it is. It is applied again to a fresh read after
+        every conflict, so it should not depend on having run before.
+
+        :param zone_id: the id of the zone of the record set
+        :param record_set_id: the id of the record set
+        :param mutate: a function that takes a RecordSet and returns the RecordSet to write, or None
+        :return: the RecordSetChange of the update, or None if no mutation changed the record set
+        :raises ConflictError: if the record set still conflicted after max_attempts writes
+        :raises NotFoundError: if the record set does not exist
+        """
+        key = (zone_id, record_set_id)
+        future = Future()
+        with self._lock:
+            queue = self._queues.get(key)
+            leader = queue is None
+            if leader:
+                queue = self._queues[key] = []
+            queue.append((mutate, future))
+
+        if leader:
+            with operation(u'modify_record_set', zone_id=zone_id, record_set_id=record_set_id):
+                self.__lead(key, kwargs)
+        return future.result()
+
+    def __lead(self, key, kwargs):
+        while True:
+            with self._lock:
+                pending = self._queues[key]
+                if not pending:
+                    del self._queues[key]
+                    return
+                self._queues[key] = []
+            try:
+                self.__update(key, pending, kwargs)
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def __update(self, key, pending, kwargs):
+        # imported here as the client imports this module
+        from vinyldns.client import ConflictError, NotFoundError
+
+        attempt = 0
+        while True:
+            record_set, changed = self.client.get_record_set(*key, **kwargs), False
+            if record_set is None:
+                raise NotFoundError(u'Record set {1} in zone {0} does not exist'.format(*key))
+            for mutate, future in pending:
+                if future.done():
+                    continue
+                # a mutation that fails only fails its own caller, so it is given a copy to change
+                candidate = copy.deepcopy(record_set)
+                try:
+                    result = mutate(candidate)
+                except Exception as e:
+                    future.set_exception(e)
+                    continue
+                if result is not None:
+                    record_set, changed = result, True
+
+            remaining = [future for _, future in pending if not future.done()]
+            if not remaining:
+                return
+            if not changed:
+                for future in remaining:
+                    future.set_result(None)
+                return
+
+            try:
+                change = self.client.update_record_set(record_set, **kwargs)
+            except ConflictError:
+                attempt += 1
+                delay = self.backoff.delay(attempt - 1)
+                active_deadline = current_deadline()
+                if attempt >= self.max_attempts or \
+                        (active_deadline is not None and active_deadline.remaining() <= delay):
+                    raise
+                time.sleep(delay)
+                continue
+            for future in remaining:
+                future.set_result(change)
+            return
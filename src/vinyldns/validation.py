@@ -0,0 +1,149 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Checking batch change requests locally before they are submitted."""
+import ipaddress
+from collections import defaultdict
+
+from vinyldns.batch_change import ValidationError
+from vinyldns.record import RecordType, rdata_converters
+from vinyldns.serdes import to_dict
+
+__all__ = [u'validate_batch_change', u'MIN_TTL', u'MAX_TTL']
+
+# the ttl bounds VinylDNS enforces by default
+MIN_TTL = 30
+MAX_TTL = 2147483647
+
+
+def _name(input_name):
+    return input_name.lower().rstrip(u'.')
+
+
+def _rdata(change):
+    """
+    :return: the rdata of a change as a dict, the way it is sent to the API, or None
+    """
+    return None if change.record is None else to_dict(change.record)
+
+
+def _check_rdata(change):
+    converter = rdata_converters.get(change.type)
+    if converter is None:
+        return [ValidationError(u'InvalidBatchRecordType', u'Record type {0} is not supported'.format(change.type))]
+    if change.record is None:
+        return [] if change.change_type == u'DeleteRecordSet' else \
+            [ValidationError(u'InvalidRecordData', u'{0} record is missing its rdata'.format(change.type))]
+
+    data = _rdata(change)
+    try:
+        expected = converter(data)
+    except (KeyError, TypeError):
+        expected = None
+    if expected is None or (not isinstance(change.record, dict) and type(change.record) is not type(expected)) \
+            or set(data) != set(to_dict(expected)):
+        return [ValidationError(u'InvalidRecordData',
+                                u'{0} is not valid rdata for a {1} record'.format(data, change.type))]
+
+    if change.type == RecordType.A:
+        return _check_address(data[u'address'], ipaddress.IPv4Address, u'InvalidIpv4Address')
+    if change.type == RecordType.AAAA:
+        return _check_address(data[u'address'], ipaddress.IPv6Address, u'InvalidIpv6Address')
+    return []
+
+
+def _check_address(address, address_type, error_type):
+    try:
+        address_type(address)
+    except (ipaddress.AddressValueError, TypeError, ValueError):
+        return [ValidationError(error_type, u'{0} is not a valid address'.format(address))]
+    return []
+
+
+def _check_ttl(change, min_ttl, max_ttl):
+    ttl = getattr(change, u'ttl', None)
+    if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, int) or not min_ttl <= ttl <= max_ttl):
+        return [ValidationError(u'InvalidTTL', u'TTL {0} must be an integer between {1} and {2}'.format(
+            ttl, min_ttl, max_ttl))]
+    return []
+
+
+def _index_existing(existing_record_sets):
+    existing = {}
+    for record_set in existing_record_sets:
+        key = (_name(record_set.fqdn or record_set.name), record_set.type)
+        existing[key] = [to_dict(r) for r in record_set.records]
+    return existing
+
+
+def validate_batch_change(batch_change_request, existing_record_sets=None, min_ttl=MIN_TTL, max_ttl=MAX_TTL):
+    """
+    Check a batch change request for the errors VinylDNS would reject it for that can be found without
+    the server, reporting every error rather than stopping at the first.
+
+    Each change is checked for a supported record type, rdata with the fields of its type, valid IPv4 and
+    IPv6 addresses and a ttl within bounds. Across the request, adds that repeat an earlier add and
+    CNAME records that share their name with another record are reported. When a snapshot of the
+    existing record sets is given, deletes of records that do not exist and CNAME records whose name is
+    already in use are reported as well.
+
+    :param batch_change_request: the BatchChangeRequest to check
+    :param existing_record_sets: an optional iterable of the RecordSet that exist, with fqdn set
+    :param min_ttl: the smallest ttl allowed
+    :param max_ttl: the largest ttl allowed
+    :return: a dict of the list of ValidationError by index of each change that has errors; empty if none do
+    """
+    changes = batch_change_request.changes
+    existing = _index_existing(existing_record_sets) if existing_record_sets is not None else None
+    errors = defaultdict(list)
+
+    added, adds_by_name, deleted_sets = {}, defaultdict(list), set()
+    for i, change in enumerate(changes):
+        errors[i].extend(_check_rdata(change))
+        errors[i].extend(_check_ttl(change, min_ttl, max_ttl))
+        key = (_name(change.input_name), change.type)
+
+        if change.change_type == u'DeleteRecordSet':
+            if change.record is None:
+                deleted_sets.add(key)
+            if existing is not None and (key not in existing or
+                                         (change.record is not None and _rdata(change) not in existing[key])):
+                errors[i].append(ValidationError(u'RecordDoesNotExist', u'{0} {1} {2}does not exist'.format(
+                    change.input_name, change.type, u'' if change.record is None else u'{0} '.format(_rdata(change)))))
+            continue
+
+        adds_by_name[key[0]].append(i)
+        rdata = _rdata(change)
+        identity = key + (repr(sorted(rdata.items())) if isinstance(rdata, dict) else repr(rdata),)
+        if identity in added:
+            errors[i].append(ValidationError(u'DuplicateChange', u'{0} {1} {2} is already added by change {3}'.format(
+                change.input_name, change.type, rdata, added[identity])))
+        else:
+            added[identity] = i
+
+    for name, indexes in adds_by_name.items():
+        cnames = [i for i in indexes if changes[i].type == RecordType.CNAME]
+        if not cnames:
+            continue
+        if len(indexes) > 1:
+            for i in cnames:
+                errors[i].append(ValidationError(u'CnameIsNotUniqueError', u'CNAME {0} conflicts with other records '
+                                                 u'added for the same name'.format(changes[i].input_name)))
+        elif existing is not None:
+            in_use = u', '.join(sorted(t for (n, t) in existing if n == name and (n, t) not in deleted_sets))
+            for i in cnames:
+                if in_use:
+                    errors[i].append(ValidationError(u'CnameIsNotUniqueError', u'CNAME {0} conflicts with the '
+                                                     u'existing {1} records'.format(changes[i].input_name, in_use)))
+
+    return dict((i, e) for i, e in errors.items() if e)
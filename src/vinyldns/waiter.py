@@ -0,0 +1,351 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Polling many long-running VinylDNS operations from one loop until they finish."""
+import asyncio
+import heapq
+import inspect
+import random
+import time
+
+from vinyldns.batch_change import batch_change_done
+from vinyldns.deadline import current_deadline
+from vinyldns.record import PENDING_RECORD_SET_STATUSES, RecordSetChangeStatus
+from vinyldns.tracing import operation, page
+from vinyldns.zone import ZoneChange, ZoneChangeStatus
+
+__all__ = [u'Backoff', u'Wait', u'poll', u'async_poll', u'batch_changes', u'zones', u'zone_changes', u'record_sets',
+           u'record_set_changes']
+
+
+class Backoff(object):
+    """
+    Exponential backoff with jitter between the polls of one target. Each delay is drawn between
+    ``1 - jitter`` and 1 times the exponential ceiling, so targets started together drift apart.
+    """
+
+    def __init__(self, initial=0.25, maximum=10.0, multiplier=2.0, jitter=0.5):
+        """
+        :param initial: the ceiling of the first delay, in seconds
+        :param maximum: the largest delay, in seconds
+        :param multiplier: the factor the ceiling grows by after each poll
+        :param jitter: the fraction of the ceiling that is randomized
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """
+        :param attempt: the number of polls made since the target last made progress, from zero
+        :return: the number of seconds to wait before the next poll
+        """
+        ceiling = min(self.maximum, self.initial * self.multiplier ** attempt)
+        return ceiling * (1 - self.jitter * random.random())
+
+
+def _expires_at(timeout):
+    """
+    :return: an (expires_at, by_deadline) tuple of when the wait ends and whether the current deadline,
+        rather than the timeout, ends it
+    """
+    expires_at = None if timeout is None else time.monotonic() + timeout
+    active_deadline = current_deadline()
+    if active_deadline is not None and (expires_at is None or active_deadline.expires_at < expires_at):
+        return active_deadline.expires_at, True
+    return expires_at, False
+
+
+class _Schedule(object):
+    """
+    The polling state of a set of targets: when each is next due, how far its backoff has grown, and the
+    states seen so far.
+    """
+
+    def __init__(self, targets, is_done, timeout, backoff, on_complete, status):
+        self.is_done = is_done
+        self.backoff = backoff or Backoff()
+        self.on_complete = on_complete
+        self.status = status
+        self.expires_at, self.by_deadline = _expires_at(timeout)
+        self.done, self.pending, self.attempts, self.statuses = {}, {}, {}, {}
+        # (due time, tie breaker, key), the tie breaker keeps keys from being compared
+        self.due = [(0.0, i, key) for i, key in enumerate(dict.fromkeys(targets))]
+        self.sequence = len(self.due)
+
+    def wait_time(self):
+        """
+        :return: the number of seconds until the next target is due, or None once none are left
+        """
+        if not self.due:
+            return None
+        return max(0.0, self.due[0][0] - time.monotonic())
+
+    def pop_due(self, limit=1):
+        now = time.monotonic()
+        keys = []
+        while self.due and len(keys) < limit and (not keys or self.due[0][0] <= now):
+            keys.append(heapq.heappop(self.due)[2])
+        return keys
+
+    def expire(self, *keys):
+        """
+        Give up on the given targets and those still due, e.g. once the deadline has passed; targets never
+        fetched are pending with a state of None.
+        """
+        for key in list(keys) + [key for _, _, key in self.due]:
+            self.pending.setdefault(key, None)
+        self.due = []
+
+    def record(self, key, state):
+        if self.is_done(state):
+            self.pending.pop(key, None)
+            self.done[key] = state
+            if self.on_complete is not None:
+                self.on_complete(key, state)
+            return
+        self.pending[key] = state
+
+        now = time.monotonic()
+        if self.expires_at is not None and now >= self.expires_at:
+            return
+        attempt = self.attempts.get(key, -1) + 1
+        if self.status is not None:
+            current = self.status(state)
+            if key in self.statuses and self.statuses[key] != current:
+                attempt = 0
+            self.statuses[key] = current
+        self.attempts[key] = attempt
+
+        # a target is polled one last time when the timeout passes, but not when a deadline does, as no
+        # request can be made once it has passed
+        next_poll = now + self.backoff.delay(attempt)
+        if self.expires_at is not None and next_poll >= self.expires_at:
+            if self.by_deadline:
+                return
+            next_poll = self.expires_at
+        heapq.heappush(self.due, (next_poll, self.sequence, key))
+        self.sequence += 1
+
+
+def poll(targets, fetch, is_done, timeout=None, backoff=None, on_complete=None, status=None):
+    """
+    Poll many targets from a single loop until each one is done or the timeout passes.
+
+    Every target is polled once straight away, then on its own backoff; targets that are done are not
+    polled again and the call returns as soon as the last one finishes. When ``status`` is given, a target
+    whose status changed since its last poll is making progress and its backoff starts over.
+
+    :param targets: an iterable of hashable keys, e.g. batch change ids
+    :param fetch: a function that takes a key and returns its current state
+    :param is_done: a function that takes a state and returns True once it will not change again
+    :param timeout: the most seconds to wait, or None to wait indefinitely; the current deadline also applies
+    :param backoff: the Backoff between polls of a target
+    :param on_complete: an optional function called with the key and state of each target as it finishes
+    :param status: an optional function that takes a state and returns its status
+    :return: a (done, pending) tuple of dicts of state by key; pending holds the last state seen of the
+        targets that did not finish in time, or None for those never fetched
+    """
+    # imported here as the client imports this module
+    from vinyldns.client import DeadlineExceededError
+
+    schedule = _Schedule(targets, is_done, timeout, backoff, on_complete, status)
+    wait = schedule.wait_time()
+    while wait is not None:
+        if wait > 0:
+            time.sleep(wait)
+        for key in schedule.pop_due():
+            try:
+                state = fetch(key)
+            except DeadlineExceededError:
+                schedule.expire(key)
+                break
+            schedule.record(key, state)
+        wait = schedule.wait_time()
+    return schedule.done, schedule.pending
+
+
+async def async_poll(targets, fetch, is_done, timeout=None, backoff=None, on_complete=None, status=None,
+                     max_concurrency=8):
+    """
+    The asyncio counterpart of poll. Targets that fall due together are fetched concurrently.
+
+    :param fetch: a coroutine function, or a plain function that is run in a worker thread
+    :param max_concurrency: the most fetches in flight at once
+    :return: a (done, pending) tuple of dicts of state by key
+    """
+    # imported here as the client imports this module
+    from vinyldns.client import DeadlineExceededError
+
+    schedule = _Schedule(targets, is_done, timeout, backoff, on_complete, status)
+
+    async def fetch_one(key):
+        if inspect.iscoroutinefunction(fetch):
+            return await fetch(key)
+        # to_thread runs the call in a copy of the current context, so deadlines carry over
+        return await asyncio.to_thread(fetch, key)
+
+    wait = schedule.wait_time()
+    while wait is not None:
+        if wait > 0:
+            await asyncio.sleep(wait)
+        keys = schedule.pop_due(max_concurrency)
+        states = await asyncio.gather(*(fetch_one(key) for key in keys), return_exceptions=True)
+        expired = []
+        for key, state in zip(keys, states):
+            if isinstance(state, DeadlineExceededError):
+                expired.append(key)
+            elif isinstance(state, BaseException):
+                raise state
+            else:
+                schedule.record(key, state)
+        if expired:
+            schedule.expire(*expired)
+        wait = schedule.wait_time()
+    return schedule.done, schedule.pending
+
+
+class Wait(object):
+    """
+    A wait for a kind of VinylDNS operation, ready to run with poll or async_poll.
+    """
+
+    def __init__(self, noun, targets, fetch, is_done, status=None):
+        """
+        :param noun: what is being waited on, for error messages
+        :param targets: the keys of the operations
+        :param fetch: a function that takes a key and returns the current state of its operation
+        :param is_done: a function that takes a state and returns True once it will not change again
+        :param status: an optional function that takes a state and returns its status
+        """
+        self.noun = noun
+        self.targets = list(targets)
+        self.fetch = fetch
+        self.is_done = is_done
+        self.status = status
+
+    def run(self, timeout=300, backoff=None, on_complete=None):
+        """
+        :param timeout: the most seconds to wait, or None to wait indefinitely
+        :param backoff: the Backoff between polls of an operation
+        :param on_complete: an optional function called with the key and state of each one as it finishes
+        :return: the final state of each operation, by key
+        :raises WaitTimeoutError: if any did not finish in time
+        """
+        with operation(u'wait', noun=self.noun, item_count=len(self.targets)) as span:
+            done, pending = poll(self.targets, self.fetch, self.is_done, timeout, backoff, on_complete, self.status)
+            span.set_attribute(u'vinyldns.pending_count', len(pending))
+        return self.__result(done, pending)
+
+    async def run_async(self, timeout=300, backoff=None, on_complete=None, max_concurrency=8):
+        """
+        Like run, from a coroutine; the client's blocking requests are made in worker threads.
+        """
+        with operation(u'wait', noun=self.noun, item_count=len(self.targets)) as span:
+            done, pending = await async_poll(self.targets, self.fetch, self.is_done, timeout, backoff, on_complete,
+                                             self.status, max_concurrency)
+            span.set_attribute(u'vinyldns.pending_count', len(pending))
+        return self.__result(done, pending)
+
+    def __result(self, done, pending):
+        if pending:
+            # imported here as the client imports this module
+            from vinyldns.client import WaitTimeoutError
+            raise WaitTimeoutError(u'{0} of {1} {2} did not finish in time'.format(
+                len(pending), len(done) + len(pending), self.noun), done, pending)
+        return done
+
+
+def batch_changes(client, batch_change_ids, stop_on_review=False, **kwargs):
+    """
+    Wait for batch changes to finish processing, keyed by id.
+
+    :param stop_on_review: also stop waiting for batch changes that are pending review or scheduled
+    """
+    return Wait(u'batch changes', batch_change_ids, lambda i: client.get_batch_change(i, **kwargs),
+                lambda bc: batch_change_done(bc, stop_on_review),
+                lambda bc: bc and (bc.status, bc.approval_status))
+
+
+def zones(client, zone_ids, deleted=False, **kwargs):
+    """
+    Wait for zones to exist, or with deleted set to be gone, keyed by id.
+    """
+    return Wait(u'zones', zone_ids, lambda i: client.get_zone(i, **kwargs),
+                (lambda z: z is None) if deleted else (lambda z: z is not None))
+
+
+def _find_zone_change(client, change, **kwargs):
+    if change.change_type == u'Delete':
+        # the changes of a zone cannot be listed once it is gone
+        if client.get_zone(change.zone.id, **kwargs) is not None:
+            return change
+        return ZoneChange(change.zone, change.user_id, change.change_type, ZoneChangeStatus.Complete,
+                          change.created, change.system_message, change.id)
+
+    start_from, number = None, 0
+    while True:
+        number += 1
+        with page(number):
+            response = client.list_zone_changes(change.zone.id, start_from=start_from, **kwargs)
+        if response is None:
+            # a zone being connected is not found until its change is applied, so the change is still pending
+            return change
+        for zone_change in response.zone_changes:
+            if zone_change.id == change.id:
+                return zone_change
+        start_from = response.next_id
+        if not start_from:
+            return change
+
+
+def zone_changes(client, changes, **kwargs):
+    """
+    Wait for zone changes, such as those returned when connecting, syncing or abandoning a zone, to
+    complete or fail, keyed by change id.
+    """
+    by_id = dict((change.id, change) for change in changes)
+    return Wait(u'zone changes', by_id, lambda i: _find_zone_change(client, by_id[i], **kwargs),
+                lambda zc: zc.status != ZoneChangeStatus.Pending, lambda zc: zc.status)
+
+
+def record_sets(client, items, deleted=False, **kwargs):
+    """
+    Wait for record sets to exist with no change pending, or with deleted set to be gone, keyed by
+    (zone id, record set id).
+
+    :param items: RecordSet objects, or (zone id, record set id) tuples
+    """
+    keys = [(rs.zone_id, rs.id) if hasattr(rs, u'zone_id') else tuple(rs) for rs in items]
+    if deleted:
+        is_done = (lambda rs: rs is None)
+    else:
+        is_done = (lambda rs: rs is not None and rs.status not in PENDING_RECORD_SET_STATUSES)
+    return Wait(u'record sets', keys, lambda key: client.get_record_set(*key, **kwargs), is_done,
+                lambda rs: rs and rs.status)
+
+
+def record_set_changes(client, changes, **kwargs):
+    """
+    Wait for record set changes to complete or fail, keyed by change id.
+    """
+    by_id = dict((change.id, change) for change in changes)
+
+    def fetch(change_id):
+        change = by_id[change_id]
+        return client.get_record_set_change(change.record_set.zone_id, change.record_set.id, change_id, **kwargs)
+
+    return Wait(u'record set changes', by_id, fetch,
+                lambda rsc: rsc is not None and rsc.status != RecordSetChangeStatus.Pending,
+                lambda rsc: rsc and rsc.status)
@@ -0,0 +1,232 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Coalescing single record changes from many callers into batch changes."""
+import json
+import threading
+import time
+from concurrent.futures import Future
+
+from vinyldns.batch_change import AddRecord, BatchChangeRequest, DeleteRecordSet
+from vinyldns.bulk import MAX_BATCH_CHANGES, chunk_changes, single_changes
+from vinyldns.serdes import to_dict
+from vinyldns.tracing import operation
+
+__all__ = [u'BatchingWriter']
+
+
+def _record_set_key(change):
+    return change.input_name.lower().rstrip(u'.'), change.type
+
+
+def _change_key(change):
+    d = to_dict(change)
+    d[u'inputName'] = _record_set_key(change)[0]
+    return json.dumps(d, sort_keys=True)
+
+
+class _Segment(object):
+    """
+    Buffered changes that can go in the same batch change; a new segment is started whenever a change
+    would be reordered by sharing a batch change with the ones before it.
+    """
+
+    def __init__(self):
+        self.changes = []
+        self.futures = {}
+        self.added = set()
+        # when the first, and so the oldest, change of the segment was buffered
+        self.queued_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.changes)
+
+
+class BatchingWriter(object):
+    """
+    Buffers record changes made one at a time, often from many threads, and submits them together as batch
+    changes. A batch change is submitted once the oldest buffered change has waited max_delay seconds or
+    max_changes are buffered, whichever comes first::
+
+        with BatchingWriter(client, owner_group_id=group.id) as writer:
+            futures = [writer.add_record(name, RecordType.A, 300, AData(address)) for name, address in hosts]
+        changes = [f.result() for f in futures]
+
+    Each call returns a Future resolved with the AddRecordChange or DeleteRecordSetChange of its change, or
+    with the exception raised when its batch change was submitted. A change identical to one already
+    buffered is not submitted twice; both calls get the same Future.
+
+    In VinylDNS, the deletes and adds of one record set in a batch change are applied together, deletes
+    first. A delete made after an add to the same record set therefore goes in a later batch change, so
+    that it is not applied before the add.
+
+    Batch changes are submitted from a background thread, one at a time, in the order the changes were
+    made. The caller's deadline does not carry over to them; give a timeout in kwargs instead.
+    """
+
+    def __init__(self, client, max_delay=0.05, max_changes=MAX_BATCH_CHANGES, comments=None, owner_group_id=None,
+                 allow_manual_review=None, **kwargs):
+        """
+        :param client: the VinylDNSClient used to submit the batch changes
+        :param max_delay: the most seconds a change is buffered before its batch change is submitted
+        :param max_changes: the most changes in one batch change
+        :param comments: the comments of each batch change
+        :param owner_group_id: the owner group of each batch change
+        :param allow_manual_review: set to false to fail rather than go to review if there are errors
+        :param kwargs: passed to create_batch_change, e.g. timeout
+        """
+        self.client = client
+        self.max_delay = max_delay
+        self.max_changes = max_changes
+        self.comments = comments
+        self.owner_group_id = owner_group_id
+        self.allow_manual_review = allow_manual_review
+        self.kwargs = kwargs
+
+        self._condition = threading.Condition()
+        self._segments = []
+        self._buffered = 0
+        # every change gets a sequence number so that flush knows when the changes before it are submitted
+        self._sequence = 0
+        self._submitted = 0
+        self._flush_to = 0
+        self._closed = False
+        self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add_record(self, input_name, type, ttl, record):
+        """
+        Add a record to a record set, creating the set if it does not exist.
+
+        :return: a Future of the AddRecordChange
+        """
+        return self.submit(AddRecord(input_name, type, ttl, record))
+
+    def delete_record(self, input_name, type, record=None):
+        """
+        Delete a record from a record set, or the whole record set when record is None.
+
+        :return: a Future of the DeleteRecordSetChange
+        """
+        return self.submit(DeleteRecordSet(input_name, type, record))
+
+    def submit(self, change):
+        """
+        Buffer an AddRecord or DeleteRecordSet.
+
+        :return: a Future of its single change
+        """
+        key, record_set_key = _change_key(change), _record_set_key(change)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(u'Cannot submit changes to a closed BatchingWriter')
+
+            segment = self._segments[-1] if self._segments else None
+            if segment is not None and key in segment.futures:
+                return segment.futures[key]
+            if segment is None or len(segment) >= self.max_changes or \
+                    (change.change_type == u'DeleteRecordSet' and record_set_key in segment.added):
+                segment = _Segment()
+                self._segments.append(segment)
+
+            future = segment.futures[key] = Future()
+            segment.changes.append((change, future))
+            if change.change_type == u'Add':
+                segment.added.add(record_set_key)
+            self._buffered += 1
+            self._sequence += 1
+            self.__start()
+            self._condition.notify_all()
+            return future
+
+    def flush(self):
+        """
+        Submit every buffered change now, returning once their batch changes have been submitted.
+        """
+        with self._condition:
+            target = self._flush_to = self._sequence
+            self._condition.notify_all()
+            while self._submitted < target:
+                self._condition.wait()
+
+    def close(self):
+        """
+        Submit every buffered change and stop the background thread; no more changes can be made.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def __start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__run, name=u'vinyldns-batching-writer', daemon=True)
+            self._thread.start()
+
+    def __due(self):
+        """
+        :return: the number of seconds until the buffered changes are due to be submitted, or None if
+            nothing is buffered
+        """
+        if not self._buffered:
+            return None
+        if self._closed or self._flush_to > self._submitted or self._buffered >= self.max_changes or \
+                len(self._segments) > 1:
+            return 0.0
+        return max(0.0, self._segments[0].queued_at + self.max_delay - time.monotonic())
+
+    def __run(self):
+        while True:
+            with self._condition:
+                due = self.__due()
+                while due is None or due > 0:
+                    if due is None and self._closed:
+                        return
+                    self._condition.wait(due)
+                    due = self.__due()
+                segment = self._segments.pop(0)
+                self._buffered -= len(segment)
+
+            self.__submit(segment)
+            with self._condition:
+                self._submitted += len(segment)
+                self._condition.notify_all()
+
+    def __submit(self, segment):
+        changes = [change for change, _ in segment.changes]
+        chunks = chunk_changes(changes, self.max_changes)
+        with operation(u'batching_writer.flush', item_count=len(changes), chunk_count=len(chunks)):
+            for chunk in chunks:
+                futures = [segment.changes[i][1] for i in chunk]
+                try:
+                    request = BatchChangeRequest([changes[i] for i in chunk], self.comments, self.owner_group_id)
+                    batch_change = self.client.create_batch_change(
+                        request, allow_manual_review=self.allow_manual_review, **self.kwargs)
+                except Exception as e:
+                    for future in futures:
+                        future.set_exception(e)
+                    continue
+                for future, outcome in zip(futures, single_changes(batch_change, len(chunk))):
+                    if isinstance(outcome, Exception):
+                        future.set_exception(outcome)
+                    else:
+                        future.set_result(outcome)
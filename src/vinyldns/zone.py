@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """TODO: Add module docstring."""
-from vinyldns.serdes import parse_datetime, map_option
+from vinyldns.serdes import ValueObject, intern_str, parse_datetime, map_option
 
 
 class AccessLevel:
@@ -22,7 +22,14 @@ class AccessLevel:
     Delete = "Delete"
 
 
-class ACLRule(object):
+class ZoneChangeStatus:
+    Pending = "Pending"
+    Complete = "Complete"
+    Failed = "Failed"
+    Synced = "Synced"
+
+
+class ACLRule(ValueObject):
     def __init__(self, access_level, description=None, user_id=None, group_id=None, record_mask=None, record_types=[]):
         self.access_level = access_level
         self.description = description
@@ -38,7 +45,7 @@ class ACLRule(object):
                        record_types=d.get('recordTypes', []))
 
 
-class ZoneACL(object):
+class ZoneACL(ValueObject):
     def __init__(self, rules=[]):
         self.rules = rules
 
@@ -88,11 +95,11 @@ class Zone(object):
         :return: A populated zone
         """
         return Zone(
-            id=d['id'],
-            name=d['name'],
-            email=d['email'],
-            admin_group_id=d['adminGroupId'],
-            status=d.get('status'),
+            id=intern_str(d['id']),
+            name=intern_str(d['name']),
+            email=intern_str(d['email']),
+            admin_group_id=intern_str(d['adminGroupId']),
+            status=intern_str(d.get('status')),
             created=map_option(d.get('created'), parse_datetime),
             updated=map_option(d.get('updated'), parse_datetime),
             connection=map_option(d.get('connection'), ZoneConnection.from_dict),
@@ -153,8 +160,9 @@ class ZoneChange(object):
     def from_dict(d):
         zone = Zone.from_dict(d['zone'])
         created = map_option(d.get('created'), parse_datetime)
-        return ZoneChange(zone=zone, user_id=d['userId'], change_type=d['changeType'], status=d['status'],
-                          created=created, system_message=d.get('systemMessage'), id=d['id'])
+        return ZoneChange(zone=zone, user_id=intern_str(d['userId']), change_type=intern_str(d['changeType']),
+                          status=intern_str(d['status']), created=created, system_message=d.get('systemMessage'),
+                          id=d['id'])
 
 
 class ListZoneChangesResponse(object):
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """TODO: Add module docstring."""
+import json
 from datetime import datetime, UTC
 
 from vinyldns.record import RecordSet, RecordSetChange, AData, AAAAData, CNAMEData, PTRData, MXData, NSData, SOAData, \
@@ -72,3 +73,17 @@ def gen_rs_change(record_set):
     return RecordSetChange(zone=forward_zone, record_set=record_set, user_id='test-user',
                            change_type='Create', status='Pending', created=datetime.now(UTC), system_message=None,
                            updates=record_set, id='some-id', user_name='some-username')
+
+
+def batch_change_callback(request):
+    """
+    A responses callback that accepts a batch change, failing it with a 400 if any input name starts with bad
+    """
+    submitted = json.loads(request.body)['changes']
+    if any(c['inputName'].startswith('bad') for c in submitted):
+        return 400, {}, json.dumps([{'errors': ['nope']}])
+    changes = [dict(c, zoneId='z', zoneName='bar.', recordName=c['inputName'].split('.')[0], status='Pending',
+                    id='change-{0}'.format(i))
+               for i, c in enumerate(submitted)]
+    return 202, {}, json.dumps({'userId': 'u', 'userName': 'u', 'createdTimestamp': '2026-01-01T00:00:00Z',
+                                'changes': changes, 'status': 'Pending', 'id': 'bc', 'approvalStatus': 'AutoApproved'})
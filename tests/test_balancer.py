@@ -0,0 +1,197 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import responses
+
+from sampledata import forward_zone, sample_zone_change
+from vinyldns.balancer import Endpoint, EndpointPool
+from vinyldns.client import ClientError, VinylDNSClient
+from vinyldns.retry import RetryPolicy
+from vinyldns.serdes import to_json_string
+
+zone_body = to_json_string({'zone': forward_zone})
+
+
+def multi_client(**kwargs):
+    return VinylDNSClient(['http://api1.test.com', 'http://api2.test.com'], 'ok', 'ok',
+                          retry_policy=RetryPolicy(status_rules={}), **kwargs)
+
+
+def test_endpoint_url_for():
+    endpoint = Endpoint('https://api2.test.com:9000', None)
+    assert endpoint.url_for('/zones', 'maxItems=10') == 'https://api2.test.com:9000/zones?maxItems=10'
+    assert endpoint.url_for('/zones') == 'https://api2.test.com:9000/zones'
+
+
+def test_pool_prefers_fewer_outstanding():
+    busy, idle = Endpoint('http://a', None), Endpoint('http://b', None)
+    pool = EndpointPool([busy, idle])
+    pool.acquire(busy)
+
+    assert all(pool.choose() is idle for _ in range(10))
+
+
+def test_pool_ejects_and_readmits():
+    bad, good = Endpoint('http://a', None), Endpoint('http://b', None)
+    pool = EndpointPool([bad, good], eject_after=2, readmit_after=0)
+
+    for _ in range(2):
+        pool.acquire(bad)
+        pool.release(bad, False)
+    assert pool.healthy() == [good]
+    assert all(pool.choose() is good for _ in range(10))
+
+    assert pool.due_for_check() == [bad]
+    assert pool.due_for_check() == []
+    pool.mark_checked(bad, True)
+    assert pool.healthy() == [bad, good]
+
+
+def test_pool_never_ejects_single_endpoint():
+    only = Endpoint('http://a', None)
+    pool = EndpointPool([only], eject_after=1)
+    pool.acquire(only)
+    pool.release(only, False)
+
+    assert only.healthy
+    assert pool.choose() is only
+
+
+def test_pool_falls_back_when_all_ejected():
+    a, b = Endpoint('http://a', None), Endpoint('http://b', None)
+    pool = EndpointPool([a, b], eject_after=1)
+    for endpoint in (a, b):
+        pool.acquire(endpoint)
+        pool.release(endpoint, False)
+
+    assert pool.healthy() == []
+    assert pool.choose() in (a, b)
+
+
+def test_pool_requires_endpoints():
+    with pytest.raises(ValueError):
+        EndpointPool([])
+
+
+def test_client_spreads_requests_and_signs_per_host(mocked_responses):
+    client = multi_client()
+    signed_hosts = []
+    for endpoint in client.endpoints.endpoints:
+        def spy(*args, _signer=endpoint.signer, _build=endpoint.signer.build_auth_header, **kwargs):
+            signed_hosts.append(_signer.netloc)
+            return _build(*args, **kwargs)
+        endpoint.signer.build_auth_header = spy
+
+    for host in ('api1', 'api2'):
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/zones/{1}'.format(host, forward_zone.id),
+                             body=zone_body, status=200)
+
+    for _ in range(40):
+        client.get_zone(forward_zone.id)
+
+    request_hosts = [c.request.url.split('/')[2] for c in mocked_responses.calls]
+    assert set(request_hosts) == {'api1.test.com', 'api2.test.com'}
+    assert signed_hosts == request_hosts
+    mocked_responses.reset()
+
+
+def test_client_ejects_failing_node_and_readmits_on_health(mocked_responses):
+    client = multi_client()
+    client.endpoints.eject_after = 1
+    bad = client.endpoints.endpoints[1]
+    mocked_responses.add(responses.GET, 'http://api2.test.com/zones/{0}'.format(forward_zone.id), status=500)
+    mocked_responses.add(responses.GET, 'http://api1.test.com/zones/{0}'.format(forward_zone.id),
+                         body=zone_body, status=200)
+
+    while bad.healthy:
+        try:
+            client.get_zone(forward_zone.id)
+        except ClientError:
+            pass
+    for _ in range(10):
+        client.get_zone(forward_zone.id)
+
+    mocked_responses.add(responses.GET, 'http://api1.test.com/ping', body='PONG', status=200)
+    mocked_responses.add(responses.GET, 'http://api1.test.com/health', status=200)
+    mocked_responses.add(responses.GET, 'http://api2.test.com/ping', body='PONG', status=200)
+    mocked_responses.add(responses.GET, 'http://api2.test.com/health', status=200)
+
+    assert client.check_endpoints() == {'http://api1.test.com': True, 'http://api2.test.com': True}
+    assert bad.healthy
+    mocked_responses.reset()
+
+
+def test_client_health_check_requires_expected_color(mocked_responses):
+    client = multi_client(expected_color='blue')
+    for host, color in (('api1', 'blue'), ('api2', 'green')):
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/ping'.format(host), body='PONG', status=200)
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/health'.format(host), status=200)
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/color'.format(host), body=color, status=200)
+
+    assert client.check_endpoints() == {'http://api1.test.com': True, 'http://api2.test.com': False}
+    assert [e.url for e in client.endpoints.healthy()] == ['http://api1.test.com']
+    mocked_responses.reset()
+
+
+def split_client(read_your_writes=60):
+    return VinylDNSClient('http://write.test.com', 'ok', 'ok',
+                          read_url=['http://read1.test.com', 'http://read2.test.com'],
+                          read_your_writes=read_your_writes)
+
+
+def test_reads_and_writes_are_split(mocked_responses):
+    client = split_client()
+    for host in ('read1', 'read2'):
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/zones/{1}'.format(host, forward_zone.id),
+                             body=zone_body, status=200)
+    mocked_responses.add(responses.POST, 'http://write.test.com/zones/{0}/sync'.format(forward_zone.id),
+                         body=to_json_string(sample_zone_change), status=202)
+    mocked_responses.add(responses.GET, 'http://write.test.com/zones/{0}'.format(forward_zone.id),
+                         body=zone_body, status=200)
+
+    for _ in range(10):
+        client.get_zone(forward_zone.id)
+    assert {c.request.url.split('/')[2] for c in mocked_responses.calls} == {'read1.test.com', 'read2.test.com'}
+
+    client.sync_zone(forward_zone.id)
+    client.get_zone(forward_zone.id)
+    assert [c.request.url.split('/')[2] for c in mocked_responses.calls[-2:]] == ['write.test.com'] * 2
+    mocked_responses.reset()
+
+
+def test_reads_leave_primary_after_window(mocked_responses):
+    client = split_client(read_your_writes=0)
+    mocked_responses.add(responses.POST, 'http://write.test.com/zones/{0}/sync'.format(forward_zone.id),
+                         body=to_json_string(sample_zone_change), status=202)
+    for host in ('read1', 'read2'):
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/zones/{1}'.format(host, forward_zone.id),
+                             body=zone_body, status=200)
+
+    client.sync_zone(forward_zone.id)
+    client.get_zone(forward_zone.id)
+    assert mocked_responses.calls[-1].request.url.startswith('http://read')
+    mocked_responses.reset()
+
+
+def test_check_endpoints_covers_read_pool(mocked_responses):
+    client = split_client()
+    for host in ('write', 'read1', 'read2'):
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/ping'.format(host), body='PONG', status=200)
+        mocked_responses.add(responses.GET, 'http://{0}.test.com/health'.format(host),
+                             status=503 if host == 'read2' else 200)
+
+    assert client.check_endpoints() == {'http://write.test.com': True, 'http://read1.test.com': True,
+                                        'http://read2.test.com': False}
+    assert [e.url for e in client.read_endpoints.healthy()] == ['http://read1.test.com']
+    mocked_responses.reset()
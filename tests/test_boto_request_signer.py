@@ -0,0 +1,37 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from vinyldns.boto_request_signer import BotoRequestSigner, generate_canonical_query_string
+
+
+def test_canonical_query_string():
+    query = generate_canonical_query_string({
+        'recordNameFilter': '*.com.',
+        'maxItems': 100,
+        'startFrom': None,
+        'ignoreAccess': True,
+        'recordTypeFilter[]': ['TXT', 'A'],
+    })
+    assert query == ('ignoreAccess=true&maxItems=100&recordNameFilter=%2A.com.'
+                     '&recordTypeFilter%5B%5D=A&recordTypeFilter%5B%5D=TXT')
+
+
+def test_signing_with_encoded_query_matches_params():
+    signer = BotoRequestSigner('http://test.com', 'ok', 'ok')
+    headers = {'X-Amz-Date': '20260101T000000Z'}
+    params = {'recordNameFilter': '*.com.', 'maxItems': 10}
+
+    from_params = signer.build_auth_header('GET', '/recordsets', headers, '', params)
+    from_query = signer.build_auth_header('GET', '/recordsets', headers, '',
+                                          query=generate_canonical_query_string(params))
+    assert from_params == from_query
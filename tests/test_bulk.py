@@ -0,0 +1,75 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+import responses
+
+from sampledata import batch_change_callback
+from vinyldns.batch_change import AddRecord, AddRecordChange, DeleteRecordSet, DeleteRecordSetChange
+from vinyldns.bulk import chunk_changes, submit_changes
+from vinyldns.client import BadRequestError, ClientError
+from vinyldns.record import AData, RecordType
+
+
+def test_chunk_changes_keeps_names_together():
+    changes = [AddRecord('a.bar.', RecordType.A, 300, AData('1.1.1.1')),
+               DeleteRecordSet('b.bar.', RecordType.A),
+               AddRecord('c.bar.', RecordType.A, 300, AData('3.3.3.3')),
+               AddRecord('B.bar', RecordType.A, 300, AData('2.2.2.2'))]
+
+    assert chunk_changes(changes, 2) == [[0], [1, 3], [2]]
+    assert chunk_changes(changes, 4) == [[0, 1, 3, 2]]
+    with pytest.raises(ValueError):
+        chunk_changes(changes, 1)
+
+
+def test_submit_changes_maps_every_outcome(mocked_responses, vinyldns_client):
+    mocked_responses.add_callback(responses.POST, 'http://test.com/zones/batchrecordchanges',
+                                  callback=batch_change_callback)
+    changes = [AddRecord('r{0}.bar.'.format(i), RecordType.A, 300, AData('1.1.1.1')) for i in range(7)]
+    changes += [DeleteRecordSet('r1.bar.', RecordType.A), AddRecord('bad.bar.', RecordType.A, 300, AData('1.1.1.1'))]
+
+    result = submit_changes(vinyldns_client, changes, max_changes=3, max_workers=2)
+
+    assert len(mocked_responses.calls) == 3
+    assert not result.ok
+    assert [c for c, _ in result.failed()] == [changes[5], changes[6], changes[8]]
+    assert isinstance(result.errors[0], BadRequestError)
+    for change, outcome in result:
+        if change in (changes[5], changes[6], changes[8]):
+            continue
+        assert isinstance(outcome, AddRecordChange if change.change_type == 'Add' else DeleteRecordSetChange)
+        assert outcome.input_name == change.input_name
+    mocked_responses.reset()
+
+
+def test_submit_changes_fails_changes_missing_from_the_response(mocked_responses, vinyldns_client):
+    def drop_last_change(request):
+        status, headers, body = batch_change_callback(request)
+        data = json.loads(body)
+        data['changes'] = data['changes'][:-1]
+        return status, headers, json.dumps(data)
+
+    mocked_responses.add_callback(responses.POST, 'http://test.com/zones/batchrecordchanges',
+                                  callback=drop_last_change)
+    changes = [AddRecord('r{0}.bar.'.format(i), RecordType.A, 300, AData('1.1.1.1')) for i in range(3)]
+
+    result = submit_changes(vinyldns_client, changes)
+
+    assert not result.ok
+    assert [c for c, _ in result.failed()] == [changes[2]]
+    assert isinstance(result.outcomes[2], ClientError)
+    assert all(isinstance(outcome, AddRecordChange) for outcome in result.outcomes[:2])
+    mocked_responses.reset()
@@ -0,0 +1,121 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import responses
+
+from sampledata import forward_zone
+from vinyldns.circuit_breaker import CircuitBreaker, CircuitState
+from vinyldns.client import CircuitOpenError, ClientError, VinylDNSClient
+from vinyldns.retry import RetryPolicy
+from vinyldns.serdes import to_json_string
+
+
+def breaker_client(breaker):
+    return VinylDNSClient('http://test.com', 'ok', 'ok', retry_policy=RetryPolicy(status_rules={}),
+                          circuit_breaker=breaker)
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        assert breaker.admit() == CircuitState.Closed
+        breaker.record_failure()
+    assert breaker.state == CircuitState.Closed
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.Open
+    assert breaker.admit() == CircuitState.Open
+
+
+def test_opens_on_failure_rate():
+    breaker = CircuitBreaker(failure_threshold=100, failure_rate=0.5, window_size=10, min_calls=4)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitState.Closed
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.Open
+
+
+def test_half_open_admits_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.admit() == CircuitState.HalfOpen
+    assert breaker.admit() == CircuitState.Open
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.Closed
+    assert breaker.admit() == CircuitState.Closed
+
+
+def test_failed_probe_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.admit() == CircuitState.HalfOpen
+    breaker.record_failure()
+    assert breaker.state == CircuitState.Open
+
+
+def test_client_fails_fast_when_open(mocked_responses):
+    client = breaker_client(CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    mocked_responses.add(responses.GET, url, status=500)
+
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            client.get_zone(forward_zone.id)
+    with pytest.raises(CircuitOpenError):
+        client.get_zone(forward_zone.id)
+
+    assert len(mocked_responses.calls) == 2
+    mocked_responses.reset()
+
+
+def test_client_errors_do_not_open_circuit(mocked_responses):
+    client = breaker_client(CircuitBreaker(failure_threshold=1, reset_timeout=60))
+    mocked_responses.add(responses.GET, 'http://test.com/zones/{0}'.format(forward_zone.id), status=404)
+
+    assert client.get_zone(forward_zone.id) is None
+    assert client.circuit_breaker.state == CircuitState.Closed
+    mocked_responses.reset()
+
+
+def test_client_probes_with_ping(mocked_responses):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, probe_with_ping=True)
+    breaker.record_failure()
+    client = breaker_client(breaker)
+    mocked_responses.add(responses.GET, 'http://test.com/ping', body='PONG', status=200)
+    mocked_responses.add(responses.GET, 'http://test.com/zones/{0}'.format(forward_zone.id),
+                         body=to_json_string({'zone': forward_zone}), status=200)
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    assert [c.request.url for c in mocked_responses.calls] == [
+        'http://test.com/ping', 'http://test.com/zones/{0}'.format(forward_zone.id)]
+    assert breaker.state == CircuitState.Closed
+    mocked_responses.reset()
+
+
+def test_client_failed_ping_probe_fails_fast(mocked_responses):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, probe_with_ping=True)
+    breaker.record_failure()
+    client = breaker_client(breaker)
+    mocked_responses.add(responses.GET, 'http://test.com/ping', status=503)
+
+    with pytest.raises(CircuitOpenError):
+        client.get_zone(forward_zone.id)
+    assert breaker.state == CircuitState.Open
+    mocked_responses.reset()
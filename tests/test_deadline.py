@@ -0,0 +1,94 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+
+import pytest
+import responses
+
+from sampledata import forward_zone, sample_group
+from vinyldns.client import DEFAULT_TIMEOUT, DeadlineExceededError, VinylDNSClient
+from vinyldns.deadline import clamp_timeout, current_deadline, deadline
+from vinyldns.serdes import to_json_string
+
+
+def test_default_and_endpoint_timeouts(mocked_responses, vinyldns_client):
+    mocked_responses.add(responses.GET, 'http://test.com/ping', body='PONG', status=200)
+    mocked_responses.add(responses.GET, 'http://test.com/zones/{0}'.format(forward_zone.id),
+                         body=to_json_string({'zone': forward_zone}), status=200)
+
+    vinyldns_client.ping()
+    vinyldns_client.get_zone(forward_zone.id)
+
+    assert mocked_responses.calls[0].request.req_kwargs['timeout'] == (1, 2)
+    assert mocked_responses.calls[1].request.req_kwargs['timeout'] == DEFAULT_TIMEOUT
+    mocked_responses.reset()
+
+
+def test_timeout_overrides(mocked_responses):
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', timeout=5, endpoint_timeouts={'ping': 0.5})
+    mocked_responses.add(responses.GET, 'http://test.com/ping', body='PONG', status=200)
+    mocked_responses.add(responses.GET, 'http://test.com/color', body='blue', status=200)
+    mocked_responses.add(responses.GET, 'http://test.com/health', body='OK', status=200)
+
+    client.ping()
+    client.color(timeout=7)
+    client.health()
+
+    assert [c.request.req_kwargs['timeout'] for c in mocked_responses.calls] == [0.5, 7, (1, 5)]
+    mocked_responses.reset()
+
+
+def test_deadline_clamps_timeouts(mocked_responses, vinyldns_client):
+    mocked_responses.add(responses.GET, 'http://test.com/ping', body='PONG', status=200)
+
+    with deadline(0.5):
+        vinyldns_client.ping()
+
+    connect, read = mocked_responses.calls[0].request.req_kwargs['timeout']
+    assert connect <= 0.5
+    assert read <= 0.5
+    mocked_responses.reset()
+
+
+def test_deadline_stops_pagination(mocked_responses, vinyldns_client):
+    def slow_first_page(request):
+        time.sleep(0.2)
+        return 200, {}, to_json_string({'groups': [sample_group], 'maxItems': 1, 'nextId': 'next'})
+
+    mocked_responses.add_callback(responses.GET, 'http://test.com/groups', callback=slow_first_page)
+
+    with pytest.raises(DeadlineExceededError):
+        with deadline(0.1):
+            vinyldns_client.list_all_my_groups()
+    assert len(mocked_responses.calls) == 1
+    mocked_responses.reset()
+
+
+def test_nested_deadline_cannot_extend():
+    with deadline(1) as outer:
+        with deadline(60) as inner:
+            assert inner is outer
+            assert current_deadline() is outer
+        with deadline(0.5) as shorter:
+            assert shorter is not outer
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_clamp_timeout():
+    assert clamp_timeout(None, 2) == 2
+    assert clamp_timeout(5, 2) == 2
+    assert clamp_timeout(1, 2) == 1
+    assert clamp_timeout((3, 30), 10) == (3, 10)
+    assert clamp_timeout((None, 30), 10) == (10, 10)
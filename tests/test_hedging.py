@@ -0,0 +1,202 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import itertools
+import threading
+import time
+
+import pytest
+import responses
+
+from sampledata import forward_zone
+from vinyldns.client import VinylDNSClient
+from vinyldns.hedging import HedgingPolicy, LatencyTracker
+from vinyldns.retry import RetryBudget
+from vinyldns.serdes import to_json_string
+
+
+def sequenced_send(*behaviours):
+    """
+    Build a send function whose n-th call sleeps and then returns or raises according to behaviours[n]
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            n = next(counter)
+        delay, result = behaviours[n]
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return send
+
+
+def test_fast_response_is_not_hedged():
+    policy = HedgingPolicy(max_delay=0.5)
+    send = sequenced_send((0, 'primary'))
+
+    assert policy.run('get_zone', send) == 'primary'
+    policy.close(wait=True)
+
+
+def test_slow_response_is_hedged():
+    policy = HedgingPolicy(max_delay=0.02)
+    discarded = []
+    send = sequenced_send((0.3, 'primary'), (0, 'hedge'))
+
+    assert policy.run('get_zone', send, discard=discarded.append) == 'hedge'
+    policy.close(wait=True)
+    assert discarded == ['primary']
+
+
+def test_hedge_covers_failed_primary():
+    policy = HedgingPolicy(max_delay=0.02)
+    send = sequenced_send((0.1, ValueError('slow failure')), (0.2, 'hedge'))
+
+    assert policy.run('get_zone', send) == 'hedge'
+    policy.close(wait=True)
+
+
+def test_both_failing_raises():
+    policy = HedgingPolicy(max_delay=0.02)
+    send = sequenced_send((0.05, ValueError('primary')), (0.1, KeyError('hedge')))
+
+    with pytest.raises(ValueError):
+        policy.run('get_zone', send)
+    policy.close(wait=True)
+
+
+def test_exhausted_budget_skips_hedge():
+    policy = HedgingPolicy(max_delay=0.01, budget=RetryBudget(ratio=0, min_retries_per_second=0))
+    send = sequenced_send((0.1, 'primary'), (0, 'hedge'))
+
+    assert policy.run('get_zone', send) == 'primary'
+    policy.close(wait=True)
+
+
+def test_first_attempts_are_not_queued():
+    policy = HedgingPolicy(max_delay=1.0, max_workers=1)
+    results = []
+
+    def call():
+        results.append(policy.run('get_zone', sequenced_send((0.1, 'primary'))))
+
+    start = time.monotonic()
+    callers = [threading.Thread(target=call) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+
+    assert results == ['primary'] * 8
+    assert time.monotonic() - start < 0.5
+    assert policy.tracker('get_zone').percentile(100) < 0.2
+    policy.close(wait=True)
+
+
+def test_hedging_threads_are_bounded_and_reused():
+    policy = HedgingPolicy(max_delay=0.02, max_workers=2, max_requests=3)
+    results = []
+
+    def hedge_threads():
+        return [t for t in threading.enumerate() if t.name.startswith(('vinyldns-primary', 'vinyldns-hedge'))]
+
+    def call():
+        results.append(policy.run('get_zone', sequenced_send((0.1, 'primary'), (0.1, 'hedge'))))
+
+    for _ in range(3):
+        callers = [threading.Thread(target=call) for _ in range(10)]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+        assert len(hedge_threads()) <= 5
+
+    assert len(results) == 30
+    assert set(results) <= {'primary', 'hedge'}
+    policy.close(wait=True)
+    assert not hedge_threads()
+
+
+def test_delay_follows_observed_percentile():
+    policy = HedgingPolicy(percentile=95, min_delay=0.001, max_delay=1.0, min_samples=10)
+    assert policy.delay('get_zone') == 1.0
+
+    for latency in range(1, 101):
+        policy.tracker('get_zone').record(latency / 1000.0)
+    assert policy.delay('get_zone') == pytest.approx(0.096)
+
+
+def test_latency_tracker_window():
+    tracker = LatencyTracker(window_size=3)
+    assert tracker.percentile(50) is None
+    for latency in (10, 1, 2, 3):
+        tracker.record(latency)
+    assert len(tracker) == 3
+    assert tracker.percentile(100) == 3
+
+
+def test_applies_only_to_hedged_reads():
+    policy = HedgingPolicy()
+    assert policy.applies_to('get_record_set', 'GET')
+    assert not policy.applies_to('create_batch_change', 'POST')
+    assert not policy.applies_to('ping', 'GET')
+
+
+def test_client_hedges_slow_get(mocked_responses):
+    policy = HedgingPolicy(max_delay=0.02)
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', hedging=policy)
+    delays = iter([0.3, 0])
+
+    def callback(request):
+        time.sleep(next(delays))
+        return 200, {}, to_json_string({'zone': forward_zone})
+
+    mocked_responses.add_callback(responses.GET, 'http://test.com/zones/{0}'.format(forward_zone.id),
+                                  callback=callback)
+
+    start = time.monotonic()
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    assert time.monotonic() - start < 0.3
+
+    policy.close(wait=True)
+    assert len(mocked_responses.calls) == 2
+    mocked_responses.reset()
+
+
+def test_client_reports_only_the_winning_attempt(mocked_responses):
+    policy = HedgingPolicy(max_delay=0.02)
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', hedging=policy)
+    events = []
+    client.add_hook('after_response', events.append)
+    body = to_json_string({'zone': forward_zone})
+    delays = iter([0.3, 0])
+
+    def callback(request):
+        time.sleep(next(delays))
+        return 200, {}, body
+
+    mocked_responses.add_callback(responses.GET, 'http://test.com/zones/{0}'.format(forward_zone.id),
+                                  callback=callback)
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    policy.close(wait=True)
+
+    event, = events
+    assert (event.status, event.retries, event.bytes_in) == (200, 0, len(body.encode('utf-8')))
+    assert event.timings['first_byte'] < 0.3
+    assert event.bytes_out == 4
+    mocked_responses.reset()
@@ -0,0 +1,75 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import responses
+
+from sampledata import forward_zone
+from vinyldns.client import ConflictError, VinylDNSClient
+from vinyldns.serdes import to_json_string
+
+zone_url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+
+
+@pytest.fixture
+def hooked_client():
+    client = VinylDNSClient('http://test.com', 'ok', 'ok')
+    client.calls = []
+    for name in ('before_request', 'after_response', 'on_retry', 'on_error'):
+        client.add_hook(name, lambda event, name=name: client.calls.append((name, event)))
+    return client
+
+
+def test_hooks_report_requests(mocked_responses, hooked_client):
+    mocked_responses.add(responses.GET, zone_url, body=to_json_string({'zone': forward_zone}))
+
+    assert hooked_client.get_zone(forward_zone.id).id == forward_zone.id
+
+    assert [name for name, _ in hooked_client.calls] == ['before_request', 'after_response']
+    event = hooked_client.calls[1][1]
+    assert event is hooked_client.calls[0][1]
+    assert (event.endpoint, event.method, event.path, event.url) == ('get_zone', 'GET', '/zones/' + forward_zone.id,
+                                                                     zone_url)
+    assert (event.status, event.retries, event.error) == (200, 0, None)
+    assert event.bytes_in == len(mocked_responses.calls[0].response.content)
+    assert {'sign', 'first_byte', 'transfer', 'decode', 'hydrate'} <= set(event.timings)
+    mocked_responses.reset()
+
+
+def test_hooks_report_errors(mocked_responses, hooked_client):
+    mocked_responses.add(responses.PUT, zone_url, status=409, body='Conflict')
+
+    with pytest.raises(ConflictError):
+        hooked_client.update_zone(forward_zone)
+
+    assert [name for name, _ in hooked_client.calls] == ['before_request', 'on_error']
+    event = hooked_client.calls[1][1]
+    assert event.status == 409
+    assert event.bytes_out > 0
+    assert isinstance(event.error, ConflictError)
+    mocked_responses.reset()
+
+
+def test_failing_hooks_and_removed_hooks(mocked_responses, hooked_client):
+    mocked_responses.add(responses.GET, zone_url, body=to_json_string({'zone': forward_zone}))
+
+    def fail(event):
+        raise RuntimeError('broken telemetry')
+
+    hooked_client.add_hook('after_response', fail)
+    assert hooked_client.get_zone(forward_zone.id).id == forward_zone.id
+
+    hooked_client.remove_hook('after_response', fail)
+    with pytest.raises(ValueError):
+        hooked_client.add_hook('on_success', fail)
+    mocked_responses.reset()
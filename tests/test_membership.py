@@ -12,13 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from datetime import datetime, UTC
 
 import responses
 
 from vinyldns.membership import Group, GroupChange, ListAdminsResponse, ListGroupsResponse, ListGroupChangesResponse, \
     ListMembersResponse, Member, User
-from vinyldns.serdes import to_json_string, from_json_string
+from vinyldns.serdes import LazyValue, to_json_string, from_json_string
 from sampledata import sample_group, sample_group2
 
 
@@ -172,3 +173,19 @@ def test_list_group_changes(mocked_responses, vinyldns_client):
 def test_group_serdes():
     r = from_json_string(to_json_string(sample_group), Group.from_dict)
     check_groups_are_same(sample_group, r)
+
+
+def test_group_members_are_converted_on_first_access():
+    g = Group.from_dict(json.loads(to_json_string(sample_group)))
+    assert isinstance(g.__dict__['members'], LazyValue)
+    assert isinstance(g.__dict__['admins'], LazyValue)
+
+    check_groups_are_same(sample_group, g)
+    assert all(isinstance(u, User) for u in g.members + g.admins)
+    assert not isinstance(g.__dict__['members'], LazyValue)
+
+
+def test_users_compare_and_hash_by_value():
+    decoded = Group.from_dict(json.loads(to_json_string(sample_group)))
+    assert decoded.members == sample_group.members
+    assert set(decoded.admins) == set(sample_group.admins)
@@ -0,0 +1,104 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import requests
+import responses
+
+from sampledata import forward_zone
+from vinyldns.client import ConflictError, VinylDNSClient
+from vinyldns.metrics import ClientMetrics, LatencyHistogram
+from vinyldns.retry import RetryPolicy
+from vinyldns.serdes import to_json_string
+
+zone_url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+
+
+def test_latency_histogram_keeps_relative_precision():
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.record(i / 1000.0)
+
+    assert histogram.count == 1000
+    assert histogram.mean() == pytest.approx(0.5005)
+    for q, expected in ((50, 0.5), (90, 0.9), (99, 0.99)):
+        assert histogram.percentile(q) == pytest.approx(expected, rel=0.02)
+    assert histogram.percentile(100) == 1.0
+    assert histogram.count_at_most(0.25) == pytest.approx(250, rel=0.02)
+    assert histogram.count_at_most(10) == 1000
+    assert LatencyHistogram().percentile(50) is None
+
+    small = LatencyHistogram()
+    small.record(0.000005)
+    assert small.percentile(50) == 0.000005
+
+
+def test_failed_requests_and_shared_metrics():
+    metrics = ClientMetrics()
+    clients = [VinylDNSClient('http://127.0.0.1:1', 'ok', 'ok', retry_policy=RetryPolicy(total=0), metrics=metrics)
+               for _ in range(2)]
+    for client in clients:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get_zone(forward_zone.id)
+
+    stats = metrics.stats()['get_zone']
+    assert stats['statuses'] == {'error': 2}
+    assert stats['connection_reuse'] == 0.0
+
+
+def test_client_stats(mocked_responses):
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', metrics=True)
+    mocked_responses.add(responses.GET, zone_url, body=to_json_string({'zone': forward_zone}))
+    mocked_responses.add(responses.PUT, zone_url, status=409, body='Conflict')
+
+    client.get_zone(forward_zone.id)
+    client.get_zone(forward_zone.id)
+    with pytest.raises(ConflictError):
+        client.update_zone(forward_zone)
+
+    stats = client.stats()
+    assert sorted(stats) == ['get_zone', 'update_zone']
+    get_zone = stats['get_zone']
+    assert (get_zone['requests'], get_zone['in_flight'], get_zone['retries']) == (2, 0, 0)
+    assert get_zone['statuses'] == {'2xx': 2}
+    assert get_zone['latency']['count'] == 2
+    assert 0 < get_zone['latency']['p50'] <= get_zone['latency']['max']
+    assert get_zone['timings']['hydrate']['count'] == 2
+    assert stats['update_zone']['statuses'] == {'4xx': 1}
+
+    client.metrics.reset()
+    assert client.stats()['get_zone']['requests'] == 0
+    # metrics and tracing are opt in, so by default requests take the path without hooks
+    plain = VinylDNSClient('http://test.com', 'ok', 'ok')
+    assert plain.stats() == {}
+    assert not plain.hooks
+    mocked_responses.reset()
+
+
+def test_render_prometheus(mocked_responses):
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', metrics=True)
+    mocked_responses.add(responses.GET, zone_url, body=to_json_string({'zone': forward_zone}))
+    client.get_zone(forward_zone.id)
+
+    text = client.metrics.render_prometheus(buckets=(0.5, 60.0))
+    lines = text.splitlines()
+    assert '# TYPE vinyldns_client_request_duration_seconds histogram' in lines
+    assert 'vinyldns_client_requests_total{endpoint="get_zone",status="2xx"} 1' in lines
+    assert 'vinyldns_client_in_flight{endpoint="get_zone"} 0' in lines
+    assert 'vinyldns_client_request_duration_seconds_bucket{endpoint="get_zone",le="60.0"} 1' in lines
+    assert 'vinyldns_client_request_duration_seconds_bucket{endpoint="get_zone",le="+Inf"} 1' in lines
+    assert 'vinyldns_client_request_duration_seconds_count{endpoint="get_zone"} 1' in lines
+    assert any(line.startswith('vinyldns_client_request_phase_seconds_total{endpoint="get_zone",phase="sign"} ')
+               for line in lines)
+    assert text.endswith('\n')
+    mocked_responses.reset()
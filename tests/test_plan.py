@@ -0,0 +1,102 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+import responses
+
+from sampledata import forward_zone
+from vinyldns.plan import apply, fqdn, plan
+from vinyldns.record import AData, NSData, RecordSet, RecordType, TXTData
+from vinyldns.serdes import to_json_string
+
+list_url = 'http://test.com/zones/{0}/recordsets'.format(forward_zone.id)
+
+
+def record_set(name, record_type, ttl, *records):
+    return RecordSet(forward_zone.id, name, record_type, ttl, records=list(records),
+                     fqdn=fqdn(name, forward_zone.name))
+
+
+current = [
+    record_set('bar.', RecordType.NS, 300, NSData('ns1.bar.')),
+    record_set('same', RecordType.A, 300, AData('1.1.1.1'), AData('1.1.1.2')),
+    record_set('grow', RecordType.A, 300, AData('2.2.2.2')),
+    record_set('retime', RecordType.TXT, 300, TXTData('t')),
+    record_set('stale', RecordType.A, 300, AData('3.3.3.3')),
+]
+
+desired = [
+    record_set('same', RecordType.A, 300, AData('1.1.1.2'), AData('1.1.1.1')),
+    record_set('grow.bar.', RecordType.A, 300, AData('2.2.2.2'), AData('2.2.2.3')),
+    record_set('retime', RecordType.TXT, 60, TXTData('t')),
+    record_set('new', RecordType.A, 300, AData('4.4.4.4')),
+]
+
+
+def changes(p):
+    return [(c.change_type, c.input_name, c.type, getattr(c, 'ttl', None), c.record) for c in p.changes]
+
+
+def add_pages(mocked_responses):
+    mocked_responses.add(responses.GET, list_url + '?startFrom=page2',
+                         body=to_json_string({'recordSets': current[3:], 'startFrom': 'page2'}), status=200)
+    mocked_responses.add(responses.GET, list_url,
+                         body=to_json_string({'recordSets': current[:3], 'nextId': 'page2'}), status=200)
+
+
+def test_plan_emits_minimal_changes(mocked_responses, vinyldns_client):
+    add_pages(mocked_responses)
+    p = plan(vinyldns_client, desired, forward_zone)
+
+    assert p.unchanged == 1
+    assert changes(p) == [
+        ('Add', 'grow.bar.', 'A', 300, AData('2.2.2.3')),
+        ('Add', 'new.bar.', 'A', 300, AData('4.4.4.4')),
+        ('DeleteRecordSet', 'retime.bar.', 'TXT', None, None),
+        ('Add', 'retime.bar.', 'TXT', 60, TXTData('t')),
+        ('DeleteRecordSet', 'stale.bar.', 'A', None, None),
+    ]
+    assert len(p.requests) == 1
+    mocked_responses.reset()
+
+
+def test_plan_without_prune_keeps_undesired(mocked_responses, vinyldns_client):
+    add_pages(mocked_responses)
+    p = plan(vinyldns_client, desired, forward_zone, prune=False, max_changes=2)
+
+    assert 'stale.bar.' not in [c.input_name for c in p.changes]
+    assert [len(r.changes) for r in p.requests] == [2, 2]
+    mocked_responses.reset()
+
+
+def test_plan_rejects_duplicates(vinyldns_client):
+    with pytest.raises(ValueError):
+        plan(vinyldns_client, [desired[0], desired[0]], forward_zone)
+
+
+def test_apply_submits_requests(mocked_responses, vinyldns_client):
+    add_pages(mocked_responses)
+    p = plan(vinyldns_client, desired[:2], forward_zone, prune=False)
+    mocked_responses.add(responses.POST, 'http://test.com/zones/batchrecordchanges',
+                         body=json.dumps({'userId': 'u', 'userName': 'u', 'createdTimestamp': '2026-01-01T00:00:00Z',
+                                          'changes': [], 'status': 'Pending', 'id': 'bc',
+                                          'approvalStatus': 'AutoApproved'}), status=202)
+
+    results = apply(vinyldns_client, p)
+    assert [r.id for r in results] == ['bc']
+    submitted = json.loads(mocked_responses.calls[-1].request.body)
+    assert [(c['changeType'], c['inputName'], c['record']) for c in submitted['changes']] == \
+        [('Add', 'grow.bar.', {'address': '2.2.2.3'})]
+    mocked_responses.reset()
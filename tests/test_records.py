@@ -13,12 +13,13 @@
 # limitations under the License.
 
 import copy
+import pickle
 import json
 import responses
 from sampledata import record_sets, record_set_values, gen_rs_change, forward_zone
-from vinyldns.record import RecordSet, RecordSetChange, ListRecordSetsResponse
+from vinyldns.record import AData, AAAAData, RecordSet, RecordSetChange, ListRecordSetsResponse
 from vinyldns.record import ListRecordSetChangesResponse, RecordSetStatus
-from vinyldns.serdes import to_json_string, from_json_string, parse_datetime
+from vinyldns.serdes import LazyValue, to_json_string, from_json_string, parse_datetime
 
 
 def check_record_sets_are_equal(a, b):
@@ -153,6 +154,18 @@ def test_list_record_sets(mocked_responses, vinyldns_client):
         check_record_sets_are_equal(left_rs, right_rs)
 
 
+def test_list_record_sets_encodes_filter(mocked_responses, vinyldns_client):
+    list_response = ListRecordSetsResponse(record_set_values, None, None, 100, '*.com.')
+    mocked_responses.add(
+        responses.GET, f'http://test.com/zones/{forward_zone.id}/recordsets',
+        body=to_json_string(list_response), status=200
+    )
+    vinyldns_client.list_record_sets(forward_zone.id, record_name_filter='*.com. a&b')
+    assert mocked_responses.calls[-1].request.url == \
+        f'http://test.com/zones/{forward_zone.id}/recordsets?recordNameFilter=%2A.com.%20a%26b'
+    mocked_responses.reset()
+
+
 def test_search_record_sets(mocked_responses, vinyldns_client):
     list_response = ListRecordSetsResponse(record_set_values, 'start', 'next', 100, '*')
     all_record_types = list(record_sets.keys())
@@ -241,3 +254,68 @@ def test_list_record_set_response_serdes():
     assert len(response.record_sets) == len(parsed_response.record_sets)
     for left_rs, right_rs in zip(response.record_sets, parsed_response.record_sets):
         check_record_sets_are_equal(left_rs, right_rs)
+
+
+def test_record_set_rdata_is_converted_on_first_access():
+    d = json.loads(to_json_string(record_sets['TXT']))
+    rs = RecordSet.from_dict(d)
+    assert isinstance(rs.__dict__['records'], LazyValue)
+
+    assert json.loads(to_json_string(rs))['records'] == d['records']
+    assert isinstance(rs.__dict__['records'], LazyValue)
+
+    assert rs.records[0].text == 'some-text'
+    assert rs.records is rs.records
+    rs.records = []
+    assert rs.records == []
+
+
+def test_record_sets_pickle_and_compare_without_converting_rdata():
+    d = json.loads(to_json_string(record_sets['MX']))
+    rs = RecordSet.from_dict(d)
+
+    copied = pickle.loads(pickle.dumps(rs))
+    assert copied == rs
+    assert hash(copied) == hash(rs)
+    assert isinstance(rs.__dict__['records'], LazyValue)
+    assert isinstance(copied.__dict__['records'], LazyValue)
+
+    assert copied.records == record_sets['MX'].records
+    assert copied == rs
+    assert RecordSet.from_dict(d) == record_sets['MX']
+
+
+def test_record_set_repeated_fields_are_interned():
+    d = json.loads(to_json_string(record_sets['A']))
+    a = RecordSet.from_dict(json.loads(json.dumps(d)))
+    b = RecordSet.from_dict(json.loads(json.dumps(d)))
+    assert a.zone_id is b.zone_id
+    assert a.type is b.type
+    assert a.owner_group_id is b.owner_group_id
+
+
+def test_record_sets_compare_and_hash_by_value():
+    decoded = [RecordSet.from_dict(json.loads(to_json_string(rs))) for rs in record_sets.values()]
+    again = [RecordSet.from_dict(json.loads(to_json_string(rs))) for rs in record_sets.values()]
+    assert decoded == again
+    assert len(set(decoded + again)) == len(record_sets)
+    assert {r for rs in decoded for r in rs.records} == {r for rs in record_sets.values() for r in rs.records}
+
+    changed = again[0]
+    hash(changed)
+    changed.ttl += 1
+    assert changed != decoded[0]
+    assert changed not in set(decoded)
+    assert AData('1.2.3.4') != AAAAData('1.2.3.4')
+
+    # fields the server manages are not compared
+    applied = again[1]
+    applied.status, applied.created, applied.updated = 'Pending', None, 'later'
+    assert applied == decoded[1]
+    assert hash(applied) == hash(decoded[1])
+
+
+def test_record_sets_without_ids_hash_by_content():
+    local = [RecordSet(forward_zone.id, 'rs{0}'.format(i), 'A', 300, records=[AData('1.1.1.1')]) for i in range(100)]
+    assert len({hash(rs) for rs in local}) == len(local)
+    assert len(set(local)) == len(local)
@@ -0,0 +1,143 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import time
+
+import pytest
+import responses
+from urllib3.response import HTTPResponse
+
+from sampledata import forward_zone, sample_zone_change
+from vinyldns.batch_change import AddRecord, BatchChangeRequest
+from vinyldns.client import ClientError, VinylDNSClient
+from vinyldns.deadline import deadline
+from vinyldns.record import AData, RecordType
+from vinyldns.retry import RetryBudget, RetryPolicy
+from vinyldns.serdes import to_json_string
+
+
+def retrying_client(budget=None):
+    return VinylDNSClient('http://test.com', 'ok', 'ok', retry_policy=RetryPolicy(budget=budget))
+
+
+def test_get_retries_unavailable(mocked_responses):
+    client = retrying_client()
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    mocked_responses.add(responses.GET, url, status=503, headers={'Retry-After': '0'})
+    mocked_responses.add(responses.GET, url, body=to_json_string({'zone': forward_zone}), status=200)
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    assert len(mocked_responses.calls) == 2
+    mocked_responses.reset()
+
+
+def test_batch_change_post_is_not_replayed(mocked_responses):
+    client = retrying_client()
+    mocked_responses.add(responses.POST, 'http://test.com/zones/batchrecordchanges', status=503)
+
+    bc = BatchChangeRequest([AddRecord('foo.bar.com', RecordType.A, 100, AData('1.2.3.4'))])
+    with pytest.raises(ClientError):
+        client.create_batch_change(bc)
+    assert len(mocked_responses.calls) == 1
+    mocked_responses.reset()
+
+
+def test_post_retries_too_many_requests(mocked_responses):
+    client = retrying_client()
+    url = 'http://test.com/zones/{0}/sync'.format(forward_zone.id)
+    mocked_responses.add(responses.POST, url, status=429)
+    mocked_responses.add(responses.POST, url, body=to_json_string(sample_zone_change), status=202)
+
+    assert client.sync_zone(forward_zone.id).id == sample_zone_change.id
+    assert len(mocked_responses.calls) == 2
+    mocked_responses.reset()
+
+
+def test_status_rule_limits_retries(mocked_responses):
+    client = retrying_client()
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    for _ in range(4):
+        mocked_responses.add(responses.GET, url, status=500)
+
+    with pytest.raises(ClientError):
+        client.get_zone(forward_zone.id)
+    assert len(mocked_responses.calls) == 3
+    mocked_responses.reset()
+
+
+def test_exhausted_budget_stops_retries(mocked_responses):
+    client = retrying_client(RetryBudget(ratio=0, min_retries_per_second=0))
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    mocked_responses.add(responses.GET, url, status=503)
+    mocked_responses.add(responses.GET, url, body=to_json_string({'zone': forward_zone}), status=200)
+
+    with pytest.raises(ClientError):
+        client.get_zone(forward_zone.id)
+    assert len(mocked_responses.calls) == 1
+    mocked_responses.reset()
+
+
+def test_budget_is_a_fraction_of_requests():
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0)
+    assert not budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_backoff_uses_full_jitter():
+    retry = RetryPolicy(backoff_factor=1, backoff_max=5)
+    assert retry.get_backoff_time() == 0
+
+    waits = set()
+    for _ in range(20):
+        retried = retry
+        for _ in range(4):
+            retried = retried.increment(u'GET', u'/zones', response=HTTPResponse(status=503))
+        assert 0 <= retried.get_backoff_time() <= 5
+        assert retried.get_backoff_time() == retried.get_backoff_time()
+        waits.add(retried.get_backoff_time())
+    assert len(waits) > 1
+
+
+def test_retry_after_is_capped():
+    retry = RetryPolicy(backoff_max=10)
+    assert retry.get_retry_after(HTTPResponse(status=429, headers={'Retry-After': '3'})) == 3
+    assert retry.get_retry_after(HTTPResponse(status=429, headers={'Retry-After': '3600'})) == 10
+
+
+def test_retry_does_not_wait_past_deadline(mocked_responses):
+    client = retrying_client()
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    mocked_responses.add(responses.GET, url, status=503, headers={'Retry-After': '5'}, body='unavailable')
+    mocked_responses.add(responses.GET, url, body=to_json_string({'zone': forward_zone}), status=200)
+
+    started = time.monotonic()
+    with deadline(0.1):
+        with pytest.raises(ClientError) as e:
+            client.get_zone(forward_zone.id)
+    assert time.monotonic() - started < 1
+    assert type(e.value) is ClientError and str(e.value) == 'unavailable'
+    assert len(mocked_responses.calls) == 1
+    mocked_responses.reset()
+
+
+def test_waits_are_clamped_to_deadline():
+    retry = RetryPolicy(backoff_factor=10, backoff_max=20)
+    for _ in range(3):
+        retry = retry.increment(u'GET', u'/zones', response=HTTPResponse(status=500))
+    with deadline(0.5):
+        assert retry.get_backoff_time() <= 0.5
+        assert retry.get_retry_after(HTTPResponse(status=429, headers={'Retry-After': '10'})) <= 0.5
@@ -0,0 +1,85 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import responses
+
+from vinyldns.batch_change import AddRecord, BatchChangeSummary
+from vinyldns.record import AData, RecordType
+from vinyldns.schedule import MISSING, ChangeWindow, progress, schedule, submit
+
+now = datetime(2026, 3, 1, 11, 59, 30, tzinfo=timezone.utc)
+noon = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def adds(prefix, count):
+    return [AddRecord('{0}{1}.bar.'.format(prefix, i), RecordType.A, 300, AData('1.1.1.1')) for i in range(count)]
+
+
+def test_spreads_windows_over_minutes():
+    windows = [ChangeWindow(adds('a', 6), noon, comments='a'),
+               ChangeWindow(adds('b', 3), noon, noon + timedelta(minutes=1), comments='b'),
+               ChangeWindow(adds('c', 2), noon + timedelta(seconds=10), owner_group_id='og')]
+
+    result = schedule(windows, 5, now=now)
+
+    # the window with a deadline goes first, the large window is split, the late start rounds up a minute
+    assert [(r.scheduled_time, len(r.changes), r.comments) for r in result.requests] == [
+        ('2026-03-01T12:00:00Z', 3, 'b'),
+        ('2026-03-01T12:01:00Z', 5, 'a'),
+        ('2026-03-01T12:02:00Z', 1, 'a'),
+        ('2026-03-01T12:02:00Z', 2, None)]
+    assert result.window_indexes == [1, 0, 0, 2]
+    assert result.requests[3].owner_group_id == 'og'
+    assert max(result.load.values()) <= 5
+    assert sum(result.load.values()) == 11
+
+
+def test_counts_booked_changes_and_rejects_missed_windows():
+    booked = [BatchChangeSummary('u', 'u', now, 4, 'bc1', 'Scheduled', 'AutoApproved', scheduled_time=noon),
+              BatchChangeSummary('u', 'u', now, 5, 'bc2', 'Complete', 'AutoApproved',
+                                 scheduled_time=noon + timedelta(minutes=1))]
+    result = schedule([ChangeWindow(adds('a', 2), now)], 5, booked, now=now)
+    assert [r.scheduled_time for r in result.requests] == ['2026-03-01T12:01:00Z']
+
+    with pytest.raises(ValueError):
+        schedule([ChangeWindow(adds('a', 2), noon, noon + timedelta(seconds=59))], 5, booked, now=now)
+    with pytest.raises(ValueError):
+        schedule([ChangeWindow(adds('a', 2), datetime(2026, 3, 1))], 5, now=now)
+
+
+def test_submit_and_progress(mocked_responses, vinyldns_client):
+    def create(request):
+        body = json.loads(request.body)
+        return 202, {}, json.dumps({'userId': 'u', 'userName': 'u', 'createdTimestamp': '2026-01-01T00:00:00Z',
+                                    'changes': [], 'status': 'Scheduled', 'approvalStatus': 'AutoApproved',
+                                    'id': body['scheduledTime'], 'scheduledTime': body['scheduledTime']})
+
+    mocked_responses.add_callback(responses.POST, 'http://test.com/zones/batchrecordchanges', callback=create)
+    result = schedule([ChangeWindow(adds('a', 4), noon)], 2, now=now)
+    batch_changes = submit(vinyldns_client, result)
+    assert [bc.id for bc in batch_changes] == ['2026-03-01T12:00:00Z', '2026-03-01T12:01:00Z']
+
+    for bc, status in zip(batch_changes, ['Complete', 'Scheduled']):
+        mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges/{0}'.format(bc.id),
+                             json={'userId': 'u', 'userName': 'u', 'changes': [], 'status': status, 'id': bc.id,
+                                   'approvalStatus': 'AutoApproved'})
+    assert progress(vinyldns_client, batch_changes) == {'Complete': 1, 'Scheduled': 1}
+
+    mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges/gone', status=404)
+    gone = BatchChangeSummary('u', 'u', None, 2, 'gone', 'Scheduled', 'AutoApproved')
+    assert progress(vinyldns_client, batch_changes + [gone]) == {'Complete': 1, 'Scheduled': 1, MISSING: 1}
+    mocked_responses.reset()
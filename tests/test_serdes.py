@@ -0,0 +1,56 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+import responses
+
+from sampledata import forward_zone
+from vinyldns import serdes
+from vinyldns.serdes import JSON_CODECS, set_json_codec, to_json_bytes, to_json_string
+from vinyldns.zone import Zone
+
+
+@pytest.fixture(params=sorted(JSON_CODECS))
+def codec(request):
+    previous = set_json_codec(request.param)
+    yield request.param
+    set_json_codec(previous)
+
+
+def test_codec_round_trip(codec):
+    encoded = to_json_bytes(forward_zone)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == json.loads(to_json_string(forward_zone))
+    assert serdes.json_loads(encoded) == json.loads(to_json_string(forward_zone))
+    assert serdes.json_loads(u'{"name": "é"}') == {'name': u'é'}
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        set_json_codec('simplejson-not-here')
+
+
+def test_client_uses_selected_codec(codec, mocked_responses, vinyldns_client):
+    mocked_responses.add(responses.PUT, 'http://test.com/zones/{0}'.format(forward_zone.id),
+                         body=to_json_string({'zone': forward_zone, 'userId': 'user', 'changeType': 'Update',
+                                              'status': 'Pending', 'created': '2026-01-01T00:00:00Z',
+                                              'id': 'change'}),
+                         status=202)
+
+    change = vinyldns_client.update_zone(forward_zone)
+    assert change.zone.id == forward_zone.id
+    assert json.loads(mocked_responses.calls[-1].request.body)['id'] == forward_zone.id
+    assert Zone.from_dict(json.loads(mocked_responses.calls[-1].request.body)).name == forward_zone.name
+    mocked_responses.reset()
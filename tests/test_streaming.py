@@ -0,0 +1,99 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+from datetime import datetime, UTC
+
+import pytest
+import responses
+
+from sampledata import forward_zone, record_set_values
+from vinyldns.batch_change import AddRecordChange, BatchChange, DeleteRecordSetChange
+from vinyldns.record import AData, ListRecordSetsResponse, RecordType
+from vinyldns.serdes import to_json_string
+from vinyldns.streaming import ArrayStream
+
+
+def chunked(document, size):
+    data = document.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_streams_items_and_collects_fields():
+    items = [{'name': u'a "quoted" [bracket] {brace} \\ é', 'n': [1, 2.5e3, None, True]}, 'x', 7, [], {}]
+    document = json.dumps({'startFrom': 'a', 'items': items, 'nested': {'items': [1]}, 'nextId': None},
+                          ensure_ascii=False, indent=1)
+
+    for size in (1, 3, 64):
+        stream = ArrayStream(chunked(document, size), 'items')
+        assert list(stream) == items
+        assert stream.fields == {'startFrom': 'a', 'nested': {'items': [1]}, 'nextId': None}
+
+
+def test_item_hook_and_close():
+    closed = []
+    stream = ArrayStream([b'{"items": [1, 2, 3]}'], 'items', item_hook=lambda i: i * 10,
+                         close=lambda: closed.append(True))
+    with stream:
+        assert next(stream) == 10
+    assert closed == [True]
+
+
+def test_truncated_document():
+    with pytest.raises(ValueError):
+        list(ArrayStream([b'{"items": [{"a": 1}, {"b"'], 'items'))
+
+
+def test_memory_is_bounded_by_an_item():
+    item = {'name': 'x' * 100, 'records': [{'address': '1.2.3.4'}]}
+    document = json.dumps({'items': [item] * 5000})
+    stream = ArrayStream(chunked(document, 4096), 'items')
+
+    largest = 0
+    for _ in stream:
+        largest = max(largest, len(stream._buffer.data))
+    assert largest < 128 * 1024 < len(document)
+
+
+def test_stream_record_sets(mocked_responses, vinyldns_client):
+    list_response = ListRecordSetsResponse(record_set_values, None, 'next', 100, None)
+    mocked_responses.add(
+        responses.GET, 'http://test.com/zones/{0}/recordsets?maxItems=100'.format(forward_zone.id),
+        body=to_json_string(list_response), status=200
+    )
+
+    with vinyldns_client.stream_record_sets(forward_zone.id, max_items=100) as stream:
+        names = [rs.name for rs in stream]
+    assert names == [rs.name for rs in record_set_values]
+    assert stream.fields['nextId'] == 'next'
+    mocked_responses.reset()
+
+
+def test_stream_batch_change_changes(mocked_responses, vinyldns_client):
+    arc = AddRecordChange(forward_zone.id, forward_zone.name, 'foo', 'foo.bar.com', RecordType.A, 200,
+                          AData('1.2.3.4'), 'Complete', 'id1', [], 'system-message', 'rchangeid1', 'rsid1')
+    drc = DeleteRecordSetChange(forward_zone.id, forward_zone.name, 'baz', 'baz.bar.com', RecordType.A,
+                                'Complete', 'id2', [], 'system-message', 'rchangeid2', 'rsid2')
+    bc = BatchChange('user-id', 'user-name', datetime.now(UTC), [arc, drc], 'bcid', 'Complete', 'AutoApproved')
+    mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges/bcid',
+                         body=to_json_string(bc), status=200)
+    mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges/missing', status=404)
+
+    stream = vinyldns_client.stream_batch_change_changes('bcid')
+    changes = list(stream)
+    assert [type(c) for c in changes] == [AddRecordChange, DeleteRecordSetChange]
+    assert changes[0].record.address == '1.2.3.4'
+    assert stream.fields['id'] == 'bcid'
+
+    assert vinyldns_client.stream_batch_change_changes('missing') is None
+    mocked_responses.reset()
@@ -0,0 +1,68 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+
+from sampledata import record_sets
+from vinyldns import table as table_module
+from vinyldns.record import RecordSet
+from vinyldns.serdes import to_json_string
+from vinyldns.table import RecordSetTable
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def table(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(table_module, 'numpy', None)
+    decoded = [RecordSet.from_dict(json.loads(to_json_string(rs))) for rs in record_sets.values()]
+    return RecordSetTable(decoded + [record_sets['A'], record_sets['TXT']])
+
+
+def test_table_counts(table):
+    assert len(table) == len(record_sets) + 2
+    assert table.count() == len(table)
+    assert table.count(type='A') == 2
+    assert table.count(type=['A', 'TXT']) == 4
+    assert table.count(type='A', zone_id='not-a-zone') == 0
+    assert table.count(ttl=200) == len(table)
+    assert list(table.filter(type='TXT')) == [list(record_sets).index('TXT'), len(record_sets) + 1]
+
+
+def test_table_group_count(table):
+    by_type = table.group_count('type')
+    assert by_type['A'] == 2
+    assert sum(by_type.values()) == len(table)
+
+    by_owner_and_type = table.group_count('owner_group_id', 'type', type=['A', 'AAAA'])
+    assert by_owner_and_type == {('owner-group-id', 'A'): 2, ('owner-group-id', 'AAAA'): 1}
+    assert table.group_count('type', type='missing') == {}
+
+    with pytest.raises(ValueError):
+        table.count(color='blue')
+
+
+def test_table_rebuilds_rows(table):
+    row = list(record_sets).index('MX')
+    original = record_sets['MX']
+    rebuilt = table.record_set(row)
+
+    assert table.name(row) == original.name
+    assert table.rdata(row) == [{'preference': 1, 'exchange': 'mail'}]
+    assert (rebuilt.zone_id, rebuilt.name, rebuilt.type, rebuilt.ttl) == \
+        (original.zone_id, original.name, original.type, original.ttl)
+    assert rebuilt.records[0].__dict__ == original.records[0].__dict__
+    assert list(table.column('type'))[row] == 'MX'
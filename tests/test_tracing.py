@@ -0,0 +1,131 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import responses
+
+from sampledata import batch_change_callback, forward_zone, sample_group, sample_group2
+from vinyldns import tracing
+from vinyldns.batch_change import AddRecord
+from vinyldns.bulk import submit_changes
+from vinyldns.client import ConflictError, VinylDNSClient
+from vinyldns.membership import ListGroupsResponse
+from vinyldns.record import AData, RecordType
+from vinyldns.serdes import to_json_string
+
+
+def add_group_pages(mocked_responses):
+    mocked_responses.add(responses.GET, 'http://test.com/groups?groupNameFilter=*',
+                         body=to_json_string(ListGroupsResponse([sample_group], 1, '*', None, 'next-id')))
+    mocked_responses.add(responses.GET, 'http://test.com/groups?groupNameFilter=*&startFrom=next-id',
+                         body=to_json_string(ListGroupsResponse([sample_group2], 1, '*', 'next-id')))
+
+
+def test_tracing_without_opentelemetry(mocked_responses, monkeypatch):
+    monkeypatch.setattr(tracing, 'trace', None)
+    add_group_pages(mocked_responses)
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', tracing=True)
+
+    assert not tracing.enabled()
+    assert not client.hooks
+    with tracing.operation('anything', zone_id='z') as span:
+        span.set_attribute('vinyldns.item_count', 1)
+        assert not span.is_recording()
+    assert len(client.list_all_my_groups('*').groups) == 2
+    mocked_responses.reset()
+
+
+@pytest.fixture(scope='module')
+def exporter():
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    if trace.get_tracer_provider() is not provider:
+        pytest.skip('a tracer provider is already set')
+    yield exporter
+    exporter.clear()
+
+
+def test_pages_are_children_of_the_operation(mocked_responses, exporter):
+    from opentelemetry.trace import SpanKind
+
+    exporter.clear()
+    add_group_pages(mocked_responses)
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', tracing=True)
+
+    client.list_all_my_groups('*')
+
+    spans = exporter.get_finished_spans()
+    parent = [span for span in spans if span.kind == SpanKind.INTERNAL][0]
+    calls = sorted((span for span in spans if span is not parent), key=lambda span: span.start_time)
+    assert parent.name == 'vinyldns.list_all_my_groups'
+    assert parent.attributes['vinyldns.page_count'] == 2
+    assert parent.attributes['vinyldns.item_count'] == 2
+    assert [span.name for span in calls] == ['vinyldns.list_all_my_groups'] * 2
+    assert [span.attributes['vinyldns.page'] for span in calls] == [1, 2]
+    for span in calls:
+        assert span.kind == SpanKind.CLIENT
+        assert span.parent.span_id == parent.context.span_id
+        assert span.attributes['http.response.status_code'] == 200
+        assert span.attributes['vinyldns.retries'] == 0
+        assert span.attributes['vinyldns.bytes_in'] > 0
+        assert parent.start_time <= span.start_time <= span.end_time <= parent.end_time
+    assert calls[0].end_time <= calls[1].start_time
+    mocked_responses.reset()
+
+
+def test_zone_and_error_attributes(mocked_responses, exporter):
+    from opentelemetry.trace import StatusCode
+
+    exporter.clear()
+    mocked_responses.add(responses.PUT, 'http://test.com/zones/{0}'.format(forward_zone.id), status=409, body='busy')
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', tracing=True)
+
+    with pytest.raises(ConflictError):
+        client.update_zone(forward_zone)
+
+    span, = exporter.get_finished_spans()
+    assert span.name == 'vinyldns.update_zone'
+    assert span.attributes['vinyldns.zone_id'] == forward_zone.id
+    assert span.attributes['http.request.method'] == 'PUT'
+    assert span.attributes['http.response.status_code'] == 409
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.events[0].name == 'exception'
+    mocked_responses.reset()
+
+
+def test_bulk_submits_share_a_parent_across_threads(mocked_responses, exporter):
+    exporter.clear()
+    mocked_responses.add_callback(responses.POST, 'http://test.com/zones/batchrecordchanges',
+                                  callback=batch_change_callback)
+    client = VinylDNSClient('http://test.com', 'ok', 'ok', tracing=True)
+    changes = [AddRecord('r{0}.bar.'.format(i), RecordType.A, 300, AData('1.1.1.1')) for i in range(5)]
+
+    submit_changes(client, changes, max_changes=2, max_workers=3)
+
+    spans = exporter.get_finished_spans()
+    parent = [span for span in spans if span.name == 'vinyldns.submit_changes'][0]
+    calls = [span for span in spans if span.name == 'vinyldns.create_batch_change']
+    assert parent.attributes['vinyldns.item_count'] == 5
+    assert parent.attributes['vinyldns.chunk_count'] == 3
+    assert parent.attributes['vinyldns.error_count'] == 0
+    assert len(calls) == 3
+    assert all(span.parent.span_id == parent.context.span_id for span in calls)
+    mocked_responses.reset()
@@ -0,0 +1,214 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+import responses
+
+from sampledata import forward_zone
+from vinyldns.client import VinylDNSClient
+from vinyldns.retry import RetryPolicy
+from vinyldns.serdes import to_json_string
+from vinyldns.streaming import ArrayStream
+from vinyldns.transport import HttpxTransport, RequestsTransport, TransportResponse, Urllib3Transport
+
+zone_body = to_json_string({'zone': forward_zone}).encode('utf-8')
+
+
+@pytest.fixture
+def api_server():
+    """
+    A local API that serves forward_zone, answering with the statuses queued in server.statuses first
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.requests.append((self.path, self.headers.get('Authorization')))
+            status = server.statuses.pop(0) if server.statuses else 200
+            body = zone_body if status == 200 else b'error'
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.requests = []
+    server.statuses = []
+    server.url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def transports():
+    yield RequestsTransport
+    yield Urllib3Transport
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return
+    yield lambda retry_policy: HttpxTransport(retry_policy, http2=False)
+
+
+def test_transport_response():
+    response = TransportResponse(200, {}, b'{"a": "\xc3\xa9"}')
+    assert response.json() == {'a': u'\xe9'}
+    assert response.text == u'{"a": "\xe9"}'
+
+
+@pytest.mark.parametrize('transport', list(transports()))
+def test_transports_send_signed_requests(api_server, transport):
+    client = VinylDNSClient(api_server.url, 'ok', 'ok', transport=transport)
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    path, authorization = api_server.requests[0]
+    assert path == '/zones/{0}'.format(forward_zone.id)
+    assert authorization.startswith('AWS4-HMAC-SHA256')
+    client.close()
+
+
+@pytest.mark.parametrize('transport', list(transports()))
+def test_transports_apply_retry_policy(api_server, transport):
+    policy = RetryPolicy(total=3, backoff_factor=0, status_rules={503: 3})
+    client = VinylDNSClient(api_server.url, 'ok', 'ok', retry_policy=policy, transport=transport)
+    api_server.statuses.extend([503, 503])
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    assert len(api_server.requests) == 3
+    client.close()
+
+
+@pytest.mark.parametrize('transport', list(transports()))
+def test_transports_raise_requests_errors(transport):
+    client = VinylDNSClient('http://127.0.0.1:1', 'ok', 'ok', retry_policy=RetryPolicy(total=0),
+                            transport=transport)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get_zone(forward_zone.id)
+    client.close()
+
+    # a refused connection is a ConnectionError, never a ConnectTimeout, with or without retries
+    for policy in (None, RetryPolicy(total=0), RetryPolicy(total=1, backoff_factor=0)):
+        with pytest.raises(requests.exceptions.ConnectionError) as e:
+            transport(policy).request('GET', 'http://127.0.0.1:1/zones/foo', {}, None, (1, 5))
+        assert type(e.value) is requests.exceptions.ConnectionError
+
+
+def mock_httpx_transport(retry_policy, outcomes):
+    """
+    An HttpxTransport whose requests get the queued outcomes in turn: an httpx exception to raise or a status
+    """
+    httpx = pytest.importorskip('httpx')
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        outcome = outcomes.pop(0) if outcomes else 200
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, content=zone_body if outcome == 200 else b'error')
+
+    transport = HttpxTransport(retry_policy, http2=False, transport=httpx.MockTransport(handler))
+    return transport, requests_seen
+
+
+def test_httpx_transport_retries():
+    httpx = pytest.importorskip('httpx')
+    policy = RetryPolicy(total=3, backoff_factor=0, status_rules={503: 3})
+    transport, seen = mock_httpx_transport(policy, [httpx.ConnectError('refused'), 503])
+
+    response = transport.request('GET', 'http://test.com/zones/foo', {}, None, (1, 5))
+    assert response.status_code == 200
+    assert response.json()['zone']['id'] == forward_zone.id
+    assert len(seen) == 3
+
+    # once a status has had its retries the response is returned; with raise_on_status, once the total is spent
+    # it is an error
+    transport, seen = mock_httpx_transport(policy, [503] * 5)
+    assert transport.request('GET', 'http://test.com/zones/foo', {}, None, (1, 5)).status_code == 503
+    assert len(seen) == 4
+
+    policy = RetryPolicy(total=1, backoff_factor=0, status_rules={503: 3}, raise_on_status=True)
+    transport, seen = mock_httpx_transport(policy, [503] * 5)
+    with pytest.raises(requests.exceptions.RetryError):
+        transport.request('GET', 'http://test.com/zones/foo', {}, None, (1, 5))
+    assert len(seen) == 2
+
+    # requests that may have been processed are not retried unless idempotent
+    transport, seen = mock_httpx_transport(policy, [httpx.ReadTimeout('slow')])
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        transport.request('POST', 'http://test.com/zones', {}, b'{}', (1, 5))
+    assert len(seen) == 1
+
+
+def test_httpx_transport_maps_errors():
+    httpx = pytest.importorskip('httpx')
+    expected = [(httpx.ConnectError('refused'), requests.exceptions.ConnectionError),
+                (httpx.ConnectTimeout('slow'), requests.exceptions.ConnectTimeout),
+                (httpx.ReadTimeout('slow'), requests.exceptions.ReadTimeout),
+                (httpx.RemoteProtocolError('bad'), requests.exceptions.ConnectionError)]
+    for policy in (None, RetryPolicy(total=0)):
+        for error, mapped in expected:
+            transport, _ = mock_httpx_transport(policy, [error])
+            with pytest.raises(requests.exceptions.RequestException) as e:
+                transport.request('GET', 'http://test.com/zones/foo', {}, None, (1, 5))
+            assert type(e.value) is mapped
+
+
+@pytest.mark.parametrize('transport', list(transports()))
+def test_transports_stream(api_server, transport):
+    response = transport(None).request('GET', api_server.url + '/zones/foo', {}, None, (1, 5), stream=True)
+
+    assert response.status_code == 200
+    with ArrayStream(response.iter_content(), 'changes', close=response.close) as stream:
+        assert list(stream) == []
+    assert stream.fields['zone']['id'] == forward_zone.id
+
+
+@pytest.mark.parametrize('transport', list(transports()))
+def test_transports_time_requests(api_server, transport):
+    policy = RetryPolicy(total=3, backoff_factor=0, status_rules={503: 3})
+    client = VinylDNSClient(api_server.url, 'ok', 'ok', retry_policy=policy, transport=transport)
+    retries, responses_ = [], []
+    client.add_hook('on_retry', lambda event: retries.append(event.retries))
+    client.add_hook('after_response', responses_.append)
+    api_server.statuses.append(503)
+
+    assert client.get_zone(forward_zone.id).id == forward_zone.id
+    event, = responses_
+    assert retries == [1]
+    assert (event.endpoint, event.status, event.retries, event.bytes_in) == ('get_zone', 200, 1, len(zone_body))
+    expected = {'sign', 'first_byte', 'transfer', 'decode', 'hydrate'}
+    if transport in (RequestsTransport, Urllib3Transport):
+        expected.add('connect')
+    assert expected <= set(event.timings)
+    assert all(t >= 0 for t in event.timings.values())
+    assert event.total >= event.timings['first_byte']
+    client.close()
+
+
+def test_requests_transport_keeps_session(mocked_responses):
+    client = VinylDNSClient('http://test.com', 'ok', 'ok')
+    mocked_responses.add(responses.GET, 'http://test.com/color', body='blue', status=200)
+
+    assert isinstance(client.session, requests.Session)
+    assert client.color() == 'blue'
+    mocked_responses.reset()
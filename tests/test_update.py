@@ -0,0 +1,116 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from sampledata import gen_rs_change
+from vinyldns.client import ConflictError, NotFoundError
+from vinyldns.record import RecordSet, RecordType, TXTData
+from vinyldns.serdes import to_json_string
+from vinyldns.update import RecordSetUpdater
+from vinyldns.waiter import Backoff
+
+url = 'http://test.com/zones/z/recordsets/rs'
+
+
+def txt_record_set(*texts):
+    return RecordSet('z', 'acme', RecordType.TXT, 300, id='rs', records=[TXTData(t) for t in texts])
+
+
+def add_text(text):
+    def mutate(record_set):
+        if TXTData(text) in record_set.records:
+            return None
+        record_set.records.append(TXTData(text))
+        return record_set
+    return mutate
+
+
+def test_retries_conflicts_with_a_fresh_read(mocked_responses, vinyldns_client):
+    vinyldns_client.record_set_updater.backoff = Backoff(0.001, 0.001)
+    mocked_responses.add(responses.GET, url, body=to_json_string({'recordSet': txt_record_set('a')}))
+    mocked_responses.add(responses.GET, url, body=to_json_string({'recordSet': txt_record_set('a', 'b')}))
+    mocked_responses.add(responses.PUT, url, status=409, body='Pending change')
+    mocked_responses.add(responses.PUT, url, body=to_json_string(gen_rs_change(txt_record_set('a', 'b', 'c'))))
+
+    change = vinyldns_client.modify_record_set('z', 'rs', add_text('c'))
+
+    assert change.record_set.records == [TXTData('a'), TXTData('b'), TXTData('c')]
+    puts = [json.loads(c.request.body)['records'] for c in mocked_responses.calls if c.request.method == 'PUT']
+    assert puts == [[{'text': 'a'}, {'text': 'c'}], [{'text': 'a'}, {'text': 'b'}, {'text': 'c'}]]
+
+    # a mutation that changes nothing is not written
+    assert vinyldns_client.modify_record_set('z', 'rs', add_text('a')) is None
+    assert len(mocked_responses.calls) == 5
+    mocked_responses.reset()
+
+
+def test_gives_up_after_max_attempts(mocked_responses, vinyldns_client):
+    updater = RecordSetUpdater(vinyldns_client, max_attempts=2, backoff=Backoff(0.001, 0.001))
+    mocked_responses.add(responses.GET, url, body=to_json_string({'recordSet': txt_record_set('a')}))
+    mocked_responses.add(responses.PUT, url, status=409, body='Pending change')
+
+    with pytest.raises(ConflictError):
+        updater.modify('z', 'rs', add_text('c'))
+    assert len(mocked_responses.calls) == 4
+
+    mocked_responses.replace(responses.GET, url, status=404)
+    with pytest.raises(NotFoundError):
+        updater.modify('z', 'rs', add_text('c'))
+    mocked_responses.reset()
+
+
+class SlowClient(object):
+    def __init__(self):
+        self.record_set = txt_record_set()
+        self.reading = threading.Event()
+        self.release = threading.Event()
+        self.updates = []
+
+    def get_record_set(self, zone_id, rs_id):
+        self.reading.set()
+        self.release.wait(5)
+        return self.record_set
+
+    def update_record_set(self, record_set):
+        self.updates.append([r.text for r in record_set.records])
+        self.record_set = record_set
+        return len(self.updates)
+
+
+def test_coalesces_concurrent_updates():
+    client = SlowClient()
+    updater = RecordSetUpdater(client)
+
+    def fail(record_set):
+        record_set.records.append(TXTData('bad'))
+        raise ValueError('nope')
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        first = executor.submit(updater.modify, 'z', 'rs', add_text('a'))
+        client.reading.wait(5)
+        others = [executor.submit(updater.modify, 'z', 'rs', m) for m in (add_text('b'), fail, add_text('c'))]
+        while len(updater._queues[('z', 'rs')]) < 3:
+            time.sleep(0.001)
+        client.release.set()
+
+    assert first.result() == 1
+    assert [f.result() for f in (others[0], others[2])] == [2, 2]
+    assert isinstance(others[1].exception(), ValueError)
+    assert client.updates == [['a'], ['a', 'b', 'c']]
@@ -0,0 +1,111 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from vinyldns.batch_change import AddRecord, BatchChangeRequest, DeleteRecordSet
+from vinyldns.record import AAAAData, AData, CNAMEData, MXData, RecordSet, RecordType, TXTData
+from vinyldns.validation import validate_batch_change
+
+
+def error_types(errors):
+    return dict((i, [e.error_type for e in errs]) for i, errs in errors.items())
+
+
+def test_valid_request_has_no_errors():
+    request = BatchChangeRequest([
+        AddRecord('foo.example.com.', RecordType.A, 300, AData('1.2.3.4')),
+        AddRecord('foo.example.com.', RecordType.AAAA, 300, AAAAData('fd69:27cc:fe91::60')),
+        AddRecord('bar.example.com.', RecordType.CNAME, 300, {'cname': 'foo.example.com.'}),
+        AddRecord('foo.example.com.', RecordType.MX, 300, MXData(1, 'mx.example.com.')),
+        DeleteRecordSet('baz.example.com.', RecordType.TXT)
+    ])
+    assert validate_batch_change(request) == {}
+
+
+def test_reports_every_error_at_once():
+    request = BatchChangeRequest([
+        AddRecord('a.example.com.', RecordType.A, 300, AData('1.2.3.400')),
+        AddRecord('a.example.com.', RecordType.AAAA, 10, AAAAData('fd69::27cc::60')),
+        AddRecord('b.example.com.', RecordType.MX, 300, {'exchange': 'mx.example.com.'}),
+        AddRecord('b.example.com.', RecordType.TXT, 300, AData('1.2.3.4')),
+        AddRecord('c.example.com.', 'DS', 300, {'keytag': 1}),
+        AddRecord('d.example.com.', RecordType.A, 2 ** 31, AData('1.2.3.4')),
+        AddRecord('d.example.com.', RecordType.A, 300, None)
+    ])
+    assert error_types(validate_batch_change(request)) == {
+        0: ['InvalidIpv4Address'],
+        1: ['InvalidIpv6Address', 'InvalidTTL'],
+        2: ['InvalidRecordData'],
+        3: ['InvalidRecordData'],
+        4: ['InvalidBatchRecordType'],
+        5: ['InvalidTTL'],
+        6: ['InvalidRecordData']
+    }
+
+
+def test_duplicate_adds():
+    request = BatchChangeRequest([
+        AddRecord('foo.example.com.', RecordType.A, 300, AData('1.2.3.4')),
+        AddRecord('FOO.example.com', RecordType.A, 300, {'address': '1.2.3.4'}),
+        AddRecord('foo.example.com.', RecordType.A, 300, AData('1.2.3.5'))
+    ])
+    errors = validate_batch_change(request)
+    assert error_types(errors) == {1: ['DuplicateChange']}
+    assert 'change 0' in errors[1][0].message
+
+
+def test_cname_must_be_the_only_record_for_its_name():
+    request = BatchChangeRequest([
+        AddRecord('foo.example.com.', RecordType.CNAME, 300, CNAMEData('bar.example.com.')),
+        AddRecord('foo.example.com.', RecordType.TXT, 300, TXTData('hello')),
+        AddRecord('baz.example.com.', RecordType.CNAME, 300, CNAMEData('bar.example.com.')),
+        AddRecord('baz.example.com.', RecordType.CNAME, 300, CNAMEData('qux.example.com.')),
+        DeleteRecordSet('qux.example.com.', RecordType.A),
+        AddRecord('qux.example.com.', RecordType.CNAME, 300, CNAMEData('bar.example.com.'))
+    ])
+    assert error_types(validate_batch_change(request)) == {
+        0: ['CnameIsNotUniqueError'],
+        2: ['CnameIsNotUniqueError'],
+        3: ['CnameIsNotUniqueError']
+    }
+
+
+def test_checks_against_existing_record_sets():
+    existing = [
+        RecordSet('zone', 'foo', RecordType.A, 300, records=[AData('1.2.3.4')], fqdn='foo.example.com.'),
+        RecordSet('zone', 'bar', RecordType.TXT, 300, records=[TXTData('hello')], fqdn='bar.example.com.'),
+        RecordSet('zone', 'baz', RecordType.A, 300, records=[AData('1.2.3.4')], fqdn='baz.example.com.')
+    ]
+    request = BatchChangeRequest([
+        DeleteRecordSet('foo.example.com.', RecordType.A, AData('1.2.3.4')),
+        DeleteRecordSet('foo.example.com.', RecordType.A, AData('1.2.3.5')),
+        DeleteRecordSet('missing.example.com.', RecordType.A),
+        AddRecord('bar.example.com.', RecordType.CNAME, 300, CNAMEData('foo.example.com.')),
+        DeleteRecordSet('baz.example.com.', RecordType.A),
+        AddRecord('baz.example.com.', RecordType.CNAME, 300, CNAMEData('foo.example.com.'))
+    ])
+    errors = validate_batch_change(request, existing)
+    assert error_types(errors) == {
+        1: ['RecordDoesNotExist'],
+        2: ['RecordDoesNotExist'],
+        3: ['CnameIsNotUniqueError']
+    }
+    assert 'TXT' in errors[3][0].message
+
+    # without a snapshot nothing is known about the zone
+    assert validate_batch_change(request) == {}
+
+
+def test_ttl_bounds_are_configurable():
+    request = BatchChangeRequest([AddRecord('foo.example.com.', RecordType.A, 5, AData('1.2.3.4'))])
+    assert error_types(validate_batch_change(request)) == {0: ['InvalidTTL']}
+    assert validate_batch_change(request, min_ttl=1) == {}
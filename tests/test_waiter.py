@@ -0,0 +1,198 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import copy
+import json
+from collections import Counter
+
+import pytest
+import responses
+
+from sampledata import forward_zone, gen_rs_change, record_sets
+from vinyldns import waiter
+from vinyldns.batch_change import BatchChangeApprovalStatus, BatchChangeStatus
+from vinyldns.client import WaitTimeoutError
+from vinyldns.deadline import deadline
+from vinyldns.record import RecordSetChangeStatus, RecordSetStatus
+from vinyldns.serdes import to_json_string
+from vinyldns.waiter import Backoff, async_poll, poll
+from vinyldns.zone import ListZoneChangesResponse, ZoneChange, ZoneChangeStatus
+
+fast = Backoff(initial=0.001, maximum=0.004)
+
+
+def test_backoff_grows_with_jitter():
+    backoff = Backoff(initial=1, maximum=8, jitter=0.5)
+    for attempt, ceiling in enumerate([1, 2, 4, 8, 8]):
+        assert ceiling / 2 <= backoff.delay(attempt) <= ceiling
+
+
+def test_poll_stops_polling_finished_targets():
+    remaining = {'a': 1, 'b': 4, 'c': 2}
+    polls, completed = Counter(), []
+
+    def fetch(key):
+        polls[key] += 1
+        remaining[key] -= 1
+        return remaining[key]
+
+    done, pending = poll(['a', 'b', 'c', 'a'], fetch, lambda left: left == 0, backoff=fast,
+                         on_complete=lambda key, state: completed.append(key))
+
+    assert done == {'a': 0, 'b': 0, 'c': 0}
+    assert pending == {}
+    assert completed == ['a', 'c', 'b']
+    assert polls == {'a': 1, 'b': 4, 'c': 2}
+
+
+def test_poll_returns_pending_on_timeout():
+    done, pending = poll(['a'], lambda key: 'working', lambda state: False, timeout=0.02, backoff=fast)
+    assert done == {}
+    assert pending == {'a': 'working'}
+
+
+def test_poll_respects_deadline():
+    with deadline(0.02):
+        done, pending = poll(['a'], lambda key: 'working', lambda state: False, backoff=fast)
+    assert pending == {'a': 'working'}
+
+
+def batch_change_body(batch_change_id, status, approval_status=BatchChangeApprovalStatus.AutoApproved):
+    return json.dumps({'userId': 'u', 'userName': 'u', 'createdTimestamp': '2026-01-01T00:00:00Z', 'changes': [],
+                       'status': status, 'id': batch_change_id, 'approvalStatus': approval_status})
+
+
+def test_wait_for_batch_changes(mocked_responses, vinyldns_client):
+    url = 'http://test.com/zones/batchrecordchanges/'
+    mocked_responses.add(responses.GET, url + 'one',
+                         body=batch_change_body('one', BatchChangeStatus.PendingProcessing))
+    mocked_responses.add(responses.GET, url + 'one', body=batch_change_body('one', BatchChangeStatus.Complete))
+    mocked_responses.add(responses.GET, url + 'two', body=batch_change_body('two', BatchChangeStatus.PendingReview,
+                                                                            BatchChangeApprovalStatus.PendingReview))
+
+    completed = []
+    done = vinyldns_client.wait_for_batch_changes(['one', 'two'], backoff=fast, stop_on_review=True,
+                                                  on_complete=lambda i, bc: completed.append(i))
+    assert completed == ['two', 'one']
+    assert done['one'].status == BatchChangeStatus.Complete
+
+    with pytest.raises(WaitTimeoutError) as e:
+        vinyldns_client.wait_for_batch_changes(['two'], timeout=0.02, backoff=fast)
+    assert e.value.pending['two'].status == BatchChangeStatus.PendingReview
+    mocked_responses.reset()
+
+
+def test_wait_ends_with_timeout_error_at_deadline(mocked_responses, vinyldns_client):
+    mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges/one',
+                         body=batch_change_body('one', BatchChangeStatus.PendingProcessing))
+
+    with deadline(0.3):
+        with pytest.raises(WaitTimeoutError) as e:
+            vinyldns_client.wait_for_batch_changes(['one'], timeout=10, backoff=Backoff(0.05, 0.1))
+    assert e.value.pending['one'].status == BatchChangeStatus.PendingProcessing
+
+    with deadline(0) as passed:
+        assert passed.expired()
+        with pytest.raises(WaitTimeoutError) as e:
+            vinyldns_client.wait_for_batch_changes(['one', 'two'], backoff=fast)
+    assert e.value.pending == {'one': None, 'two': None}
+
+    with deadline(0):
+        done, pending = asyncio.run(async_poll(['one'], vinyldns_client.get_batch_change, lambda bc: False,
+                                               backoff=fast))
+    assert pending == {'one': None}
+    mocked_responses.reset()
+
+
+def test_async_poll_fetches_due_targets_together():
+    in_flight, most_in_flight = [0], [0]
+    remaining = {key: 2 for key in 'abcd'}
+
+    async def fetch(key):
+        in_flight[0] += 1
+        most_in_flight[0] = max(most_in_flight[0], in_flight[0])
+        await asyncio.sleep(0.001)
+        in_flight[0] -= 1
+        remaining[key] -= 1
+        return remaining[key]
+
+    done, pending = asyncio.run(async_poll('abcd', fetch, lambda left: left == 0, backoff=fast, max_concurrency=3))
+    assert done == {key: 0 for key in 'abcd'}
+    assert most_in_flight[0] == 3
+
+    done, pending = asyncio.run(async_poll(['x'], lambda key: 'working', lambda state: False, timeout=0.02,
+                                           backoff=fast))
+    assert pending == {'x': 'working'}
+
+
+def test_wait_for_zones(mocked_responses, vinyldns_client):
+    url = 'http://test.com/zones/{0}'.format(forward_zone.id)
+    mocked_responses.add(responses.GET, url, status=404)
+    mocked_responses.add(responses.GET, url, body=to_json_string({'zone': forward_zone}))
+
+    assert vinyldns_client.wait_for_zones([forward_zone.id], backoff=fast)[forward_zone.id].id == forward_zone.id
+
+    mocked_responses.replace(responses.GET, url, status=404)
+    abandon = ZoneChange(forward_zone, 'user', 'Delete', ZoneChangeStatus.Pending, None, None, 'abandon')
+    assert vinyldns_client.wait_for_zones([forward_zone.id], deleted=True, backoff=fast) == {forward_zone.id: None}
+    assert vinyldns_client.wait_for_zone_changes([abandon], backoff=fast)['abandon'].status == \
+        ZoneChangeStatus.Complete
+    mocked_responses.reset()
+
+
+def test_wait_for_connect_and_sync_zone_changes(mocked_responses, vinyldns_client):
+    url = 'http://test.com/zones/{0}/changes'.format(forward_zone.id)
+    connect = ZoneChange(forward_zone, 'user', 'Create', ZoneChangeStatus.Pending, None, None, 'connect')
+    sync = ZoneChange(forward_zone, 'user', 'Sync', ZoneChangeStatus.Pending, None, None, 'sync')
+
+    def changes_body(*changes):
+        return to_json_string(ListZoneChangesResponse(forward_zone.id, list(changes)))
+
+    # the zone is not found until it has been connected
+    mocked_responses.add(responses.GET, url, status=404)
+    mocked_responses.add(responses.GET, url, body=changes_body(copy.copy(connect)))
+    synced = copy.copy(sync)
+    synced.status = ZoneChangeStatus.Synced
+    connected = copy.copy(connect)
+    connected.status = ZoneChangeStatus.Complete
+    mocked_responses.add(responses.GET, url, body=changes_body(synced, connected))
+
+    done = vinyldns_client.wait_for_zone_changes([connect, sync], backoff=fast)
+    assert done['connect'].status == ZoneChangeStatus.Complete
+    assert done['sync'].status == ZoneChangeStatus.Synced
+
+    mocked_responses.replace(responses.GET, url, status=404)
+    with pytest.raises(WaitTimeoutError) as e:
+        vinyldns_client.wait_for_zone_changes([connect], timeout=0.05, backoff=fast)
+    assert e.value.pending['connect'].status == ZoneChangeStatus.Pending
+    mocked_responses.reset()
+
+
+def test_wait_for_record_sets_and_changes(mocked_responses, vinyldns_client):
+    rs = copy.deepcopy(record_sets['A'])
+    rs.id = 'rs'
+    change = gen_rs_change(rs)
+    url = 'http://test.com/zones/{0}/recordsets/rs'.format(rs.zone_id)
+    for status in (RecordSetStatus.Pending, RecordSetStatus.Active):
+        rs.status = status
+        mocked_responses.add(responses.GET, url, body=to_json_string({'recordSet': rs}))
+    for status in (RecordSetChangeStatus.Pending, RecordSetChangeStatus.Complete):
+        change.status = status
+        mocked_responses.add(responses.GET, url + '/changes/some-id', body=to_json_string(change))
+
+    done = asyncio.run(waiter.record_sets(vinyldns_client, [(rs.zone_id, 'rs')]).run_async(backoff=fast))
+    assert done[(rs.zone_id, 'rs')].status == RecordSetStatus.Active
+    assert vinyldns_client.wait_for_record_set_changes([change], backoff=fast)['some-id'].status == \
+        RecordSetChangeStatus.Complete
+    mocked_responses.reset()
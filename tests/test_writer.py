@@ -0,0 +1,141 @@
+# Copyright 2026 Comcast Cable Communications Management, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from sampledata import batch_change_callback
+from vinyldns.batch_change import AddRecordChange, DeleteRecordSetChange
+from vinyldns.client import BadRequestError, ClientError
+from vinyldns.record import AData, RecordType
+from vinyldns.writer import BatchingWriter
+
+batch_url = 'http://test.com/zones/batchrecordchanges'
+
+
+def submitted(mocked_responses):
+    return [[(c['changeType'], c['inputName']) for c in json.loads(call.request.body)['changes']]
+            for call in mocked_responses.calls]
+
+
+def test_coalesces_changes_from_many_threads(mocked_responses, vinyldns_client):
+    mocked_responses.add_callback(responses.POST, batch_url, callback=batch_change_callback)
+
+    with BatchingWriter(vinyldns_client, max_delay=10) as writer:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = list(executor.map(
+                lambda i: writer.add_record('r{0}.bar.'.format(i % 50), RecordType.A, 300, AData('1.1.1.1')),
+                range(100)))
+
+    assert len(mocked_responses.calls) == 1
+    assert len(submitted(mocked_responses)[0]) == 50
+    # identical changes share a future
+    assert futures[0] is futures[50]
+    for i, future in enumerate(futures):
+        change = future.result(timeout=0)
+        assert isinstance(change, AddRecordChange)
+        assert change.input_name == 'r{0}.bar.'.format(i % 50)
+    mocked_responses.reset()
+
+
+def test_flushes_on_size_and_keeps_order(mocked_responses, vinyldns_client):
+    mocked_responses.add_callback(responses.POST, batch_url, callback=batch_change_callback)
+
+    writer = BatchingWriter(vinyldns_client, max_delay=10, max_changes=3)
+    writer.delete_record('a.bar.', RecordType.A)
+    add = writer.add_record('a.bar.', RecordType.A, 300, AData('1.1.1.1'))
+    writer.add_record('b.bar.', RecordType.A, 300, AData('1.1.1.1'))
+    writer.add_record('c.bar.', RecordType.A, 300, AData('1.1.1.1'))
+    # a delete after an add to the same record set waits for the next batch change
+    delete = writer.delete_record('c.bar.', RecordType.A)
+    writer.flush()
+
+    assert submitted(mocked_responses) == [
+        [('DeleteRecordSet', 'a.bar.'), ('Add', 'a.bar.'), ('Add', 'b.bar.')],
+        [('Add', 'c.bar.')],
+        [('DeleteRecordSet', 'c.bar.')]
+    ]
+    assert add.result(timeout=0).id == 'change-1'
+    assert isinstance(delete.result(timeout=0), DeleteRecordSetChange)
+    writer.close()
+    mocked_responses.reset()
+
+
+def test_flushes_after_max_delay(mocked_responses, vinyldns_client):
+    mocked_responses.add_callback(responses.POST, batch_url, callback=batch_change_callback)
+
+    writer = BatchingWriter(vinyldns_client, max_delay=0.01)
+    future = writer.add_record('a.bar.', RecordType.A, 300, AData('1.1.1.1'))
+
+    assert future.result(timeout=5).input_name == 'a.bar.'
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.add_record('b.bar.', RecordType.A, 300, AData('1.1.1.1'))
+    mocked_responses.reset()
+
+
+def test_rejected_batch_fails_its_futures(mocked_responses, vinyldns_client):
+    mocked_responses.add_callback(responses.POST, batch_url, callback=batch_change_callback)
+
+    with BatchingWriter(vinyldns_client, max_delay=10) as writer:
+        futures = [writer.add_record('bad.bar.', RecordType.A, 300, AData('1.1.1.1')),
+                   writer.add_record('good.bar.', RecordType.A, 300, AData('1.1.1.1'))]
+
+    for future in futures:
+        assert isinstance(future.exception(timeout=0), BadRequestError)
+    mocked_responses.reset()
+
+
+def test_leftover_changes_keep_their_wait(mocked_responses, vinyldns_client):
+    delays = iter([0.3])
+
+    def slow_first_batch(request):
+        time.sleep(next(delays, 0))
+        return batch_change_callback(request)
+
+    mocked_responses.add_callback(responses.POST, batch_url, callback=slow_first_batch)
+
+    start = time.monotonic()
+    with BatchingWriter(vinyldns_client, max_delay=0.3) as writer:
+        writer.add_record('a.bar.', RecordType.A, 300, AData('1.1.1.1'))
+        writer.delete_record('a.bar.', RecordType.A)
+        time.sleep(0.05)
+        # buffered while the first batch change is in flight, behind the delete
+        writer.add_record('b.bar.', RecordType.A, 300, AData('1.1.1.1'))
+        last = writer.delete_record('b.bar.', RecordType.A)
+
+        last.result(timeout=5)
+        assert time.monotonic() - start < 0.5
+    assert len(mocked_responses.calls) == 3
+    mocked_responses.reset()
+
+
+def test_changes_missing_from_the_response_fail(mocked_responses, vinyldns_client):
+    def drop_last_change(request):
+        status, headers, body = batch_change_callback(request)
+        data = json.loads(body)
+        data['changes'] = data['changes'][:-1]
+        return status, headers, json.dumps(data)
+
+    mocked_responses.add_callback(responses.POST, batch_url, callback=drop_last_change)
+
+    with BatchingWriter(vinyldns_client, max_delay=10) as writer:
+        futures = [writer.add_record('r{0}.bar.'.format(i), RecordType.A, 300, AData('1.1.1.1')) for i in range(3)]
+
+    assert [f.result(timeout=0).input_name for f in futures[:2]] == ['r0.bar.', 'r1.bar.']
+    assert isinstance(futures[2].exception(timeout=0), ClientError)
+    mocked_responses.reset()
@@ -75,9 +75,32 @@ def test_list_deleted_zones(mocked_responses, vinyldns_client):
         'ignoreAccess': True
     }
     mocked_responses.add(
-        responses.GET, 'http://test.com/zones/deleted/changes?startFrom=start&maxItems=100&ignoreAccess=True',
+        responses.GET, 'http://test.com/zones/deleted/changes?startFrom=start&maxItems=100&ignoreAccess=true',
         body=to_json_string(body), status=200)
 
     resp = vinyldns_client.list_deleted_zones(start_from='start', max_items=100, ignore_access=True)
     assert resp.ignore_access is True
     assert len(resp.zones_deleted_info) == 1
+
+
+def test_unset_query_params_are_not_sent(mocked_responses, vinyldns_client):
+    mocked_responses.add(responses.GET, 'http://test.com/zones', body=to_json_string({'zones': []}))
+    mocked_responses.add(responses.GET, 'http://test.com/zones/{0}/changes'.format(forward_zone.id),
+                         body=to_json_string({'zoneId': forward_zone.id, 'zoneChanges': []}))
+    mocked_responses.add(responses.GET, 'http://test.com/groups', body=to_json_string({'groups': []}))
+    mocked_responses.add(responses.GET, 'http://test.com/zones/batchrecordchanges',
+                         body=to_json_string({'batchChanges': []}))
+
+    vinyldns_client.list_zones()
+    vinyldns_client.list_zone_changes(forward_zone.id, start_from='')
+    vinyldns_client.list_my_groups(group_name_filter='', start_from='')
+    vinyldns_client.list_batch_change_summaries()
+    vinyldns_client.list_batch_change_summaries(start_from='', max_items=0, ignore_access=False)
+
+    urls = [call.request.url for call in mocked_responses.calls[-5:]]
+    assert urls == ['http://test.com/zones',
+                    'http://test.com/zones/{0}/changes'.format(forward_zone.id),
+                    'http://test.com/groups',
+                    'http://test.com/zones/batchrecordchanges',
+                    'http://test.com/zones/batchrecordchanges?ignoreAccess=false&maxItems=0']
+    mocked_responses.reset()